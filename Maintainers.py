@@ -1,246 +1,50 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import sqlite3
-import os
-import subprocess
-import sys
-import threading
-import tempfile
-
-class MaintainersDashboard(ctk.CTkToplevel):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.parent = parent
-
-        # ---------------- DATABASE ---------------- #
-        self.conn = sqlite3.connect("Scholarship.db", timeout=10)
-        self.cursor = self.conn.cursor()
-        self.title("Maintainers Dashboard")
-        try:
-            self.state("zoomed")
-        except:
-            pass
-
-        # ---------------- HEADER ---------------- #
-        header_height = 110
-        header = ctk.CTkFrame(self, fg_color="#6F0000", height=header_height, corner_radius=0)
-        header.pack(side="top", fill="x")
-        header.grid_propagate(False)
-
-        ctk.CTkLabel(header, text="BATANGAS STATE UNIVERSITY", font=("Arial Black", 34),
-                     text_color="white").pack(pady=(20, 0))
-        ctk.CTkLabel(header, text="SCHOLARSHIP MANAGEMENT SYSTEM", font=("Arial", 18),
-                     text_color="white").pack()
-
-        # ---------------- MAIN CONTENT ---------------- #
-        self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.main_frame.pack(fill="both", expand=True, padx=40, pady=20)
-
-        top_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        top_frame.pack(fill="x", pady=(0, 20))
-
-        back_btn = ctk.CTkButton(top_frame, text="← Back", width=120, height=40,
-                                fg_color="#4a0000", hover_color="#7c0a02",
-                                command=self.go_back)
-        back_btn.pack(side="left")
-
-        manage_label = ctk.CTkLabel(top_frame, text="Manage Maintainers", font=("Arial Black", 28),
-                                    text_color="black")
-        manage_label.place(relx=0.5, rely=0.5, anchor="center")
-
-        # ---------------- Table container ---------------- #
-        self.table_container = ctk.CTkFrame(self.main_frame, fg_color="#f2f2f2",
-                                            corner_radius=10, width=1200, height=400)
-        self.table_container.pack(fill="both", expand=True)
-        self.table_container.pack_propagate(False)
-
-        self.table_frame = ctk.CTkScrollableFrame(self.table_container, fg_color="white")
-        self.table_frame.pack(fill="both", expand=True)
-
-        self.load_maintainers()
-
-    # ---------------- LOAD TABLE ---------------- #
-    def load_maintainers(self):
-        for widget in self.table_frame.winfo_children():
-            widget.destroy()
-
-        headers = ["Student ID", "Name", "Username", "Email", "Status", "Action"]
-        for col, header in enumerate(headers):
-            label = ctk.CTkLabel(self.table_frame, text=header, font=("Arial Black", 16),
-                                fg_color="#7c0a02", text_color="white",
-                                width=250, height=40)
-            label.grid(row=0, column=col, padx=1, pady=1, sticky="nsew")
-
-        self.cursor.execute("SELECT student_id, name, username, email, status FROM Maintainer")
-        maintainers = self.cursor.fetchall()
+import database
+import app_shell
+import dashboard_stats
+from app_shell import Screen
+from document_viewer import RequirementsViewer, fetch_documents
+from document_store import store, document_refs
+from maintainer_repository import repository
+from virtual_table import PagedQuery, TableModel, VirtualTable, SearchBox
+from records import Maintainer
+import search
+import schema
 
-        for row, entry in enumerate(maintainers, start=1):
-            student_id, name, username, email, status = entry
+MAINTAINER_HEADERS = ["Student ID", "Name", "Username", "Email", "Status"]
 
-            allowed_status = {"claimed": "claimed", "unclaimed": "unclaimed"}
-            display_status = allowed_status.get(status.lower(), "not yet updated")
+# (button label, Maintainer_Requirements column)
+MAINTAINER_DOCUMENTS = (("COR", "COR"), ("TOR", "TOR"), ("Good Moral", "GOOD_MORAL"))
 
-            values = [student_id, name, username, email, display_status]
+# status filter -> (condition, params), matching what display_maintainer shows.
+# Written on the sort expression, so schema.SORT_INDEXES seek them
+STATUS_KEY = schema.sort_expression("Maintainer.status")
+STATUS_FILTERS = {
+    "All statuses": None,
+    "claimed": (f"{STATUS_KEY} = ?", ("claimed",)),
+    "unclaimed": (f"{STATUS_KEY} = ?", ("unclaimed",)),
+    "not yet updated": (f"{STATUS_KEY} NOT IN ('claimed', 'unclaimed')", ()),
+}
+ALL_COURSES = "All courses"
 
-            for col, value in enumerate(values):
-                cell = ctk.CTkLabel(self.table_frame, text=value, font=("Arial", 14),
-                                    width=250, height=40, fg_color="white", anchor="center")
-                cell.grid(row=row, column=col, padx=1, pady=1, sticky="nsew")
 
-            action_frame = ctk.CTkFrame(self.table_frame, fg_color="white", width=250, height=40)
-            action_frame.grid(row=row, column=len(headers)-1, padx=1, pady=1, sticky="nsew")
-            action_frame.grid_propagate(False)
-            action_frame.columnconfigure((0, 1), weight=1)
+def maintainer_courses():
+    # From the trigger-maintained counters, not a scan of Maintainer
+    return [course for course, _ in dashboard_stats.load_stats().maintainers_by_course if course != "Unknown"]
 
-            view_btn = ctk.CTkButton(action_frame, text="View", width=80, height=30,
-                                    command=lambda e=entry: self.view_maintainer(e))
-            view_btn.grid(row=0, column=0, padx=5, pady=5)
 
-            delete_btn = ctk.CTkButton(action_frame, text="Delete", width=80, height=30,
-                                    fg_color="#B22222", hover_color="#FF0000",
-                                    command=lambda e=entry: self.delete_maintainer(e[0]))
-            delete_btn.grid(row=0, column=1, padx=5, pady=5)
+def display_maintainer(row):
+    allowed_status = {"claimed": "claimed", "unclaimed": "unclaimed"}
+    display_status = allowed_status.get((row.status or "").lower(), "not yet updated")
+    return [row.student_id, row.name, row.username, row.email, display_status]
 
-        for col in range(len(headers)):
-            self.table_frame.grid_columnconfigure(col, weight=1)
-
-    # ---------------- VIEW / DELETE ---------------- #
-    def view_maintainer(self, entry):
-        student_id, name, username, email, status = entry
-        self.ViewMaintainerRequirements(self, student_id)
 
-    def delete_maintainer(self, student_id):
-        if messagebox.askyesno(title="Confirm Delete", message="Are you sure you want to delete this maintainer?"):
-            self.cursor.execute("DELETE FROM Maintainer WHERE student_id=?", (student_id,))
-            self.conn.commit()
-            self.load_maintainers()
+class MaintainersDashboard(Screen):
+    title = "Maintainers Dashboard"
 
-    # ---------------- BACK ---------------- #
-    def go_back(self):
-        try:
-            # Open adminchart.py again
-            subprocess.Popen([sys.executable, "adminchart.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Cannot open adminchart.py\n{e}")
-
-        # Close this window
-        self.destroy()
-
-    # ==========================================================================
-    # ⭐ FULL WORKING ViewMaintainerRequirements (BLOB VERSION)
-    # ==========================================================================
-    class ViewMaintainerRequirements(ctk.CTkToplevel):
-        def __init__(self, parent, student_id):
-            super().__init__(parent)
-            self.title("Maintainer's Requirements")
-            self.geometry("520x380")
-            self.resizable(False, False)
-
-            # Center window
-            self.update_idletasks()
-            w, h = 520, 380
-            x = (self.winfo_screenwidth() // 2) - (w // 2)
-            y = (self.winfo_screenheight() // 2) - (h // 2)
-            self.geometry(f"{w}x{h}+{x}+{y}")
-
-            # DB
-            self.conn = sqlite3.connect("Scholarship.db")
-            self.cursor = self.conn.cursor()
-
-            # Load BLOBs from Maintainer_Requirements
-            self.cor_blob, self.tor_blob, self.gm_blob = self.load_from_db(student_id)
-
-            ctk.CTkLabel(self, text=f"Requirements for Student ID {student_id}",
-                         font=("Arial Black", 20)).pack(pady=20)
-
-            # No files
-            if not any([self.cor_blob, self.tor_blob, self.gm_blob]):
-                ctk.CTkLabel(self, text="No requirements uploaded.", font=("Arial", 16)).pack(pady=20)
-                return
-
-            # Buttons
-            if self.cor_blob:
-                ctk.CTkButton(self, text="Open COR", width=200,
-                    command=lambda: self.open_blob_with_loading("COR", self.cor_blob)
-                ).pack(pady=10)
-
-            if self.tor_blob:
-                ctk.CTkButton(self, text="Open TOR", width=200,
-                    command=lambda: self.open_blob_with_loading("TOR", self.tor_blob)
-                ).pack(pady=10)
-
-            if self.gm_blob:
-                ctk.CTkButton(self, text="Open Good Moral", width=200,
-                    command=lambda: self.open_blob_with_loading("GoodMoral", self.gm_blob)
-                ).pack(pady=10)
-
-        # ---------------- LOAD BLOB FROM TABLE ---------------- #
-        def load_from_db(self, student_id):
-            try:
-                self.cursor.execute("""
-                    SELECT COR, TOR, Good_Moral
-                    FROM Maintainer_Requirements
-                    WHERE maintainer_id = ?
-                """, (student_id,))
-
-                row = self.cursor.fetchone()
-                if row:
-                    return row[0], row[1], row[2]
-            except Exception as e:
-                messagebox.showerror("Database Error", str(e))
-
-            return None, None, None
-
-        # ---------------- OPEN FILE SAFELY ---------------- #
-        def open_blob_file(self, name, blob_data):
-            if not blob_data:
-                return
-
-            # Detect file type (default PDF)
-            ext = ".pdf"
-            if blob_data[:4] == b"\xFF\xD8\xFF\xE0":
-                ext = ".jpg"
-            elif blob_data[:8] == b"\x89PNG\r\n\x1a\n":
-                ext = ".png"
-
-            temp_path = os.path.join(tempfile.gettempdir(), f"{name}{ext}")
-
-            with open(temp_path, "wb") as f:
-                f.write(blob_data)
-
-            try:
-                if sys.platform.startswith("win"):
-                    os.startfile(temp_path)
-                elif sys.platform.startswith("darwin"):
-                    subprocess.call(["open", temp_path])
-                else:
-                    subprocess.call(["xdg-open", temp_path])
-            except Exception as e:
-                messagebox.showerror("Open Error", str(e))
-
-        # ---------------- LOADING LABEL WRAPPER ---------------- #
-        def open_blob_with_loading(self, name, blob_data):
-            loading = ctk.CTkLabel(self, text="Opening file...", font=("Arial", 14))
-            loading.pack(pady=10)
-
-            def task():
-                self.open_blob_file(name, blob_data)
-                loading.destroy()
-
-            threading.Thread(target=task, daemon=True).start()
-
-
-# ------------------ STANDALONE VERSION ------------------ #
-class MaintainersDashboardStandalone(ctk.CTk):
-    """Standalone version using CTk (not CTkToplevel) to avoid extra Tk window"""
-    def __init__(self):
-        super().__init__()
-
-        # ---------------- DATABASE ---------------- #
-        self.conn = sqlite3.connect("Scholarship.db", timeout=10)
-        self.cursor = self.conn.cursor()
-        self.title("Maintainers Dashboard")
-        self.attributes('-fullscreen', True)  # True fullscreen mode
+    def __init__(self, master):
+        super().__init__(master)
 
         # ---------------- HEADER ---------------- #
         header_height = 110
@@ -275,188 +79,107 @@ class MaintainersDashboardStandalone(ctk.CTk):
         self.table_container.pack(fill="both", expand=True)
         self.table_container.pack_propagate(False)
 
-        self.table_frame = ctk.CTkScrollableFrame(self.table_container, fg_color="white")
-        self.table_frame.pack(fill="both", expand=True)
-
         self.load_maintainers()
 
-    def load_maintainers(self):
-        for widget in self.table_frame.winfo_children():
-            widget.destroy()
-
-        headers = ["Student ID", "Name", "Username", "Email", "Status", "Action"]
-        for col, header in enumerate(headers):
-            label = ctk.CTkLabel(self.table_frame, text=header, font=("Arial Black", 16),
-                                fg_color="#7c0a02", text_color="white",
-                                width=250, height=40)
-            label.grid(row=0, column=col, padx=1, pady=1, sticky="nsew")
-
-        self.cursor.execute("SELECT student_id, name, username, email, status FROM Maintainer")
-        maintainers = self.cursor.fetchall()
-
-        for row, entry in enumerate(maintainers, start=1):
-            student_id, name, username, email, status = entry
-
-            allowed_status = {"claimed": "claimed", "unclaimed": "unclaimed"}
-            display_status = allowed_status.get(status.lower(), "not yet updated")
-
-            values = [student_id, name, username, email, display_status]
-
-            for col, value in enumerate(values):
-                cell = ctk.CTkLabel(self.table_frame, text=value, font=("Arial", 14),
-                                    width=250, height=40, fg_color="white", anchor="center")
-                cell.grid(row=row, column=col, padx=1, pady=1, sticky="nsew")
-
-            action_frame = ctk.CTkFrame(self.table_frame, fg_color="white", width=250, height=40)
-            action_frame.grid(row=row, column=len(headers)-1, padx=1, pady=1, sticky="nsew")
-            action_frame.grid_propagate(False)
-            action_frame.columnconfigure((0, 1), weight=1)
+        # Filters the table as the admin types (full-text index, see search.py)
+        self.search_box = SearchBox(top_frame, self.model, lambda text: search.filtered(self.query, text),
+                                    width=340, height=40)
+        self.search_box.pack(side="right")
+
+        # ---------------- Filters ---------------- #
+        self.course_filter = ctk.CTkOptionMenu(top_frame, values=[ALL_COURSES] + maintainer_courses(),
+                                               width=160, height=40, fg_color="#4a0000",
+                                               button_color="#7c0a02", command=self.apply_view)
+        self.course_filter.pack(side="right", padx=10)
+        self.status_filter = ctk.CTkOptionMenu(top_frame, values=list(STATUS_FILTERS),
+                                               width=160, height=40, fg_color="#4a0000",
+                                               button_color="#7c0a02", command=self.apply_view)
+        self.status_filter.pack(side="right")
+
+    def on_show(self):
+        # Cached screen: pick up maintainers (and courses) added since the last visit
+        self.course_filter.configure(values=[ALL_COURSES] + maintainer_courses())
+        self.model.reset()
 
-            view_btn = ctk.CTkButton(action_frame, text="View", width=80, height=30,
-                                    command=lambda e=entry: self.view_maintainer(e))
-            view_btn.grid(row=0, column=0, padx=5, pady=5)
-
-            delete_btn = ctk.CTkButton(action_frame, text="Delete", width=80, height=30,
-                                    fg_color="#B22222", hover_color="#FF0000",
-                                    command=lambda e=entry: self.delete_maintainer(e[0]))
-            delete_btn.grid(row=0, column=1, padx=5, pady=5)
-
-        for col in range(len(headers)):
-            self.table_frame.grid_columnconfigure(col, weight=1)
+    # ---------------- LOAD TABLE ---------------- #
+    def load_maintainers(self):
+        # Rows are paged in from SQLite, which also sorts and filters them (see
+        # apply_view); only the visible ones get widgets
+        self.base_query = PagedQuery("Maintainer", ["student_id", "name", "username", "email", "status"],
+                                     record=Maintainer)
+        self.query = self.base_query
+        self.sort = (None, False)
+        self.model = TableModel(self.query)
+        self.table = VirtualTable(
+            self.table_container, self.model, headers=MAINTAINER_HEADERS, display=display_maintainer,
+            on_sort=self.sort_by,
+            actions=[
+                ("View", None, None, self.view_maintainer),
+                ("Delete", "#B22222", "#FF0000", self.delete_maintainer),
+            ])
+        self.table.pack(fill="both", expand=True)
+
+    # ---------------- SORT / FILTER ---------------- #
+    def sort_by(self, col):
+        column = self.base_query.columns[col]
+        # Clicking the sorted column again reverses the order
+        descending = self.sort == (column, False)
+        self.sort = (column, descending)
+        self.table.show_sort(col, descending)
+        self.apply_view()
+
+    def apply_view(self, _=None):
+        conditions, params = [], []
+        status = STATUS_FILTERS[self.status_filter.get()]
+        if status is not None:
+            conditions.append(status[0])
+            params += status[1]
+        course = self.course_filter.get()
+        if course != ALL_COURSES:
+            conditions.append("Maintainer.course = ?")
+            params.append(course)
+        self.query = self.base_query.filtered(" AND ".join(conditions), params).sorted(*self.sort)
+        # Re-applies the search text too; the first page is read off the Tk thread
+        self.search_box.search(force=True)
 
+    # ---------------- VIEW / DELETE ---------------- #
     def view_maintainer(self, entry):
-        student_id = entry[0]
-        ViewMaintainerRequirements(self, student_id)
+        ViewMaintainerRequirements(self, entry.student_id)
 
-    def delete_maintainer(self, student_id):
+    def delete_maintainer(self, entry):
         if messagebox.askyesno(title="Confirm Delete", message="Are you sure you want to delete this maintainer?"):
-            self.cursor.execute("DELETE FROM Maintainer WHERE student_id=?", (student_id,))
-            self.conn.commit()
-            self.load_maintainers()
+            with database.transaction() as conn:
+                released = document_refs(conn, "Maintainer_Requirements", "maintainer_id = ?",
+                                         (entry.student_id,))
+                conn.execute("DELETE FROM Maintainer_Requirements WHERE maintainer_id=?", (entry.student_id,))
+                conn.execute("DELETE FROM Maintainer WHERE student_id=?", (entry.student_id,))
+            store.sweep(released)
+            repository.invalidate(entry.student_id)
+            # Only the deleted row leaves the table
+            self.model.remove_row(entry.key)
 
+    # ---------------- BACK ---------------- #
     def go_back(self):
-        try:
-            subprocess.Popen([sys.executable, "adminchart.py"])
-        except Exception as e:
-            messagebox.showerror("Error", f"Cannot open adminchart.py\n{e}")
+        app_shell.navigate("admin")
 
-        self.destroy()
 
-
-# Separate ViewMaintainerRequirements class (used by both versions)
-class ViewMaintainerRequirements(ctk.CTkToplevel):
+# ------------------ VIEW REQUIREMENTS ------------------ #
+class ViewMaintainerRequirements(RequirementsViewer):
     def __init__(self, parent, student_id):
-        super().__init__(parent)
-        self.title("Maintainer's Requirements")
-        self.geometry("520x380")
-        self.resizable(False, False)
-
-        # Center window
-        self.update_idletasks()
-        w, h = 520, 380
-        x = (self.winfo_screenwidth() // 2) - (w // 2)
-        y = (self.winfo_screenheight() // 2) - (h // 2)
-        self.geometry(f"{w}x{h}+{x}+{y}")
-
-        # DB
-        self.conn = sqlite3.connect("Scholarship.db")
-        self.cursor = self.conn.cursor()
-
-        # Load BLOBs from Maintainer_Requirements
-        self.cor_blob, self.tor_blob, self.gm_blob = self.load_from_db(student_id)
-
-        ctk.CTkLabel(self, text=f"Requirements for Student ID {student_id}",
-                     font=("Arial Black", 20)).pack(pady=20)
-
-        # No files
-        if not any([self.cor_blob, self.tor_blob, self.gm_blob]):
-            ctk.CTkLabel(self, text="No requirements uploaded.", font=("Arial", 16)).pack(pady=20)
-            return
-
-        # Buttons
-        if self.cor_blob:
-            ctk.CTkButton(self, text="Open COR", width=200,
-                command=lambda: self.open_blob_with_loading("COR", self.cor_blob)
-            ).pack(pady=10)
-
-        if self.tor_blob:
-            ctk.CTkButton(self, text="Open TOR", width=200,
-                command=lambda: self.open_blob_with_loading("TOR", self.tor_blob)
-            ).pack(pady=10)
-
-        if self.gm_blob:
-            ctk.CTkButton(self, text="Open Good Moral", width=200,
-                command=lambda: self.open_blob_with_loading("GoodMoral", self.gm_blob)
-            ).pack(pady=10)
+        # Presence and sizes only; each document is streamed when opened
+        super().__init__(parent, "Maintainer's Requirements", student_id,
+                         self.load_from_db(student_id))
 
     def load_from_db(self, student_id):
         try:
-            self.cursor.execute("""
-                SELECT COR, TOR, Good_Moral
-                FROM Maintainer_Requirements
-                WHERE maintainer_id = ?
-            """, (student_id,))
-
-            row = self.cursor.fetchone()
-            if row:
-                return row[0], row[1], row[2]
+            return fetch_documents("Maintainer_Requirements", "maintainer_id", student_id,
+                                   MAINTAINER_DOCUMENTS)
         except Exception as e:
             messagebox.showerror("Database Error", str(e))
 
-        return None, None, None
-
-    def open_blob_file(self, name, blob_data):
-        if not blob_data:
-            return
-
-        # Detect file type (default PDF)
-        ext = ".pdf"
-        if blob_data[:4] == b"\xFF\xD8\xFF\xE0":
-            ext = ".jpg"
-        elif blob_data[:8] == b"\x89PNG\r\n\x1a\n":
-            ext = ".png"
-
-        temp_path = os.path.join(tempfile.gettempdir(), f"{name}{ext}")
-
-        with open(temp_path, "wb") as f:
-            f.write(blob_data)
-
-        try:
-            if sys.platform.startswith("win"):
-                os.startfile(temp_path)
-            elif sys.platform.startswith("darwin"):
-                subprocess.call(["open", temp_path])
-            else:
-                subprocess.call(["xdg-open", temp_path])
-        except Exception as e:
-            messagebox.showerror("Open Error", str(e))
-
-    def open_blob_with_loading(self, name, blob_data):
-        loading = ctk.CTkLabel(self, text="Opening file...", font=("Arial", 14))
-        loading.pack(pady=10)
-
-        def task():
-            self.open_blob_file(name, blob_data)
-            loading.destroy()
-
-        threading.Thread(target=task, daemon=True).start()
+        return []
 
 
 # ------------------ RUN ------------------ #
 if __name__ == "__main__":
-    ctk.set_appearance_mode("light")
-    ctk.set_default_color_theme("green")
-    
-    # Create hidden root window to avoid extra Tk window
-    root = ctk.CTk()
-    root.withdraw()  # Hide the root window
-    
-    # Create the dashboard as a Toplevel
-    app = MaintainersDashboard(parent=root)
-    
-    # When dashboard closes, also close the hidden root
-    def on_closing():
-        root.destroy()
-    
-    app.protocol("WM_DELETE_WINDOW", on_closing)
-    app.mainloop()
\ No newline at end of file
+    app_shell.run("maintainers")
\ No newline at end of file
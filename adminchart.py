@@ -1,46 +1,46 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import sqlite3
 from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import subprocess
-import sys
+import app_shell
+from app_shell import Screen
+import warmup
+from dashboard_stats import load_stats
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
-# Import your custom modules
-from New_Applicants import NewApplicantsDashboard
-from Maintainers import MaintainersDashboard
+# matplotlib is only needed for the charts: import it off the Tk thread
+CHART_MODULE = "dashboard_charts"
+# The mail stack behind the outbox is not needed for the first frame either
+OUTBOX_MODULE = "outbox"
 
-class ScholarshipManagementSystem(ctk.CTk):
-    def __init__(self):
-        super().__init__()
-        self.title("Batangas State University - Scholarship Management System")
+class ScholarshipManagementSystem(Screen):
+    title = "Batangas State University - Scholarship Management System"
+    
+    def __init__(self, master):
+        super().__init__(master)
+        
+        self.dashboard = None
+        self.stats = None
         
-        # Get screen dimensions and maximize
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        self.geometry(f"{screen_width}x{screen_height}+0+0")
+        # Start importing the chart stack while the window paints
+        warmup.preload([CHART_MODULE])
         
-        # Configure database connection
-        self.conn = sqlite3.connect("Scholarship.db", timeout=10)
-        self.cursor = self.conn.cursor()
+        # Notification emails a previous session committed but never sent;
+        # the drainer starts once outbox is imported, after the first paint
+        warmup.when_loaded(self, OUTBOX_MODULE, lambda outbox: outbox.start())
         
         # Create header
         self.create_header()
         
         # Create main container
         self.create_main_container()
-        
-        # Show dashboard by default
+    
+    def on_show(self):
+        # Dashboard by default; coming back from another screen only
+        # refreshes the numbers
         self.show_dashboard()
-        
-        # Try to maximize after everything loads
-        self.after(100, lambda: self.state('zoomed'))
     
     def create_header(self):
         header_height = 110
@@ -92,32 +92,35 @@ class ScholarshipManagementSystem(ctk.CTk):
     
     # ----- BUTTON FUNCTIONS -----
     def open_new_applicants(self):
-        self.withdraw()
-        subprocess.Popen([sys.executable, 'New_Applicants.py'])
-        
-
+        app_shell.navigate("new_applicants")
+    
     def open_maintainers(self):
-        self.withdraw()
-        subprocess.Popen([sys.executable, 'Maintainers.py'])
-
+        app_shell.navigate("maintainers")
     
     def logout(self):
         """Handle logout functionality"""
         confirm = messagebox.askyesno("Logout", "Are you sure you want to logout?")
         if confirm:
-            self.destroy()
-            subprocess.Popen(["python", "login.py"])
+            app_shell.navigate("login")
     
     def clear_content(self):
         for widget in self.content_area.winfo_children():
             widget.destroy()
     
     def show_dashboard(self):
-        self.clear_content()
-        
+        # The dashboard (cards + charts) is built once; later visits only
+        # refresh the numbers in place
+        if self.dashboard is None or not self.dashboard.winfo_exists():
+            self.clear_content()
+            self.build_dashboard()
+        self.refresh_dashboard()
+    
+    def build_dashboard(self):
         # Main content frame with padding
         content = ctk.CTkScrollableFrame(self.content_area, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=40, pady=20)
+        self.dashboard = content
+        self.stats = None
         
         # Title
         title_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -126,46 +129,6 @@ class ScholarshipManagementSystem(ctk.CTk):
         ctk.CTkLabel(title_frame, text="Dashboard Overview", 
                      font=("Arial Black", 28), text_color="black").pack()
         
-        # Get counts from database
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM Applicants")
-            applicants_count = self.cursor.fetchone()[0]
-        except:
-            applicants_count = 0
-            
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM Maintainer")
-            maintainers_count = self.cursor.fetchone()[0]
-        except:
-            maintainers_count = 0
-        
-        # Get status counts - check for various possible status values
-        try:
-            # Get all distinct statuses first to debug
-            self.cursor.execute("SELECT DISTINCT Status FROM Applicants")
-            all_statuses = self.cursor.fetchall()
-            print("Available statuses:", all_statuses)  # Debug print
-            
-            # Count accepted (try different variations)
-            self.cursor.execute("SELECT COUNT(*) FROM Applicants WHERE LOWER(Status) IN ('accepted', 'approve', 'approved')")
-            accepted_count = self.cursor.fetchone()[0]
-        except:
-            accepted_count = 0
-            
-        try:
-            # Count pending (try different variations)
-            self.cursor.execute("SELECT COUNT(*) FROM Applicants WHERE LOWER(Status) IN ('pending', 'waiting', 'in progress')")
-            pending_count = self.cursor.fetchone()[0]
-        except:
-            pending_count = 0
-            
-        try:
-            # Count rejected (try different variations)
-            self.cursor.execute("SELECT COUNT(*) FROM Applicants WHERE LOWER(Status) IN ('rejected', 'declined', 'denied')")
-            rejected_count = self.cursor.fetchone()[0]
-        except:
-            rejected_count = 0
-        
         # Stats container - 5 cards in a row
         stats_container = ctk.CTkFrame(content, fg_color="transparent")
         stats_container.pack(fill="x", pady=20)
@@ -174,17 +137,19 @@ class ScholarshipManagementSystem(ctk.CTk):
         for i in range(5):
             stats_container.grid_columnconfigure(i, weight=1)
         
-        # Statistics cards
-        self.create_stat_card(stats_container, "Total New Applicants", 
-                             applicants_count, "#1f6aa5", 0)
-        self.create_stat_card(stats_container, "Total Maintainers", 
-                             maintainers_count, "#2b8a3e", 1)
-        self.create_stat_card(stats_container, "Accepted", 
-                             accepted_count, "#28a745", 2)
-        self.create_stat_card(stats_container, "Pending", 
-                             pending_count, "#ffc107", 3)
-        self.create_stat_card(stats_container, "Rejected", 
-                             rejected_count, "#dc3545", 4)
+        # Statistics cards (value labels kept for in-place updates)
+        self.card_values = {
+            "applicants": self.create_stat_card(stats_container, "Total New Applicants", 
+                                                0, "#1f6aa5", 0),
+            "maintainers": self.create_stat_card(stats_container, "Total Maintainers", 
+                                                 0, "#2b8a3e", 1),
+            "accepted": self.create_stat_card(stats_container, "Accepted", 
+                                              0, "#28a745", 2),
+            "pending": self.create_stat_card(stats_container, "Pending", 
+                                             0, "#ffc107", 3),
+            "rejected": self.create_stat_card(stats_container, "Rejected", 
+                                              0, "#dc3545", 4),
+        }
         
         # Graphs container
         graphs_container = ctk.CTkFrame(content, fg_color="transparent")
@@ -199,127 +164,75 @@ class ScholarshipManagementSystem(ctk.CTk):
         left_column.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
         
         # Applicants Bar Graph
-        self.create_applicants_bar_graph(left_column)
+        self.applicants_frame = self.create_graph_frame(left_column, "Applicants Bar Graph",
+                                                        pady=(0, 20))
         
         # Maintainers Bar Graph
-        self.create_maintainers_bar_graph(left_column)
+        self.maintainers_frame = self.create_graph_frame(left_column, "Maintainers Bar Graph")
         
         # Right column for pie graph
         right_column = ctk.CTkFrame(graphs_container, fg_color="transparent")
         right_column.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
         
         # Pie Graph
-        self.create_status_pie_graph(right_column, accepted_count, pending_count, rejected_count)
-    
-    def create_applicants_bar_graph(self, parent):
-        # Container
-        graph_frame = ctk.CTkFrame(parent, fg_color="white", corner_radius=10)
-        graph_frame.pack(fill="both", expand=True, pady=(0, 20))
-        
-        # Title
-        ctk.CTkLabel(graph_frame, text="Applicants Bar Graph", 
-                     font=("Arial Black", 18), text_color="black").pack(pady=10)
+        self.status_frame = self.create_graph_frame(right_column,
+                                                    "Accepted, Pending, Rejected Pie Graph")
         
-        # Get data by course
-        try:
-            self.cursor.execute("SELECT Course, COUNT(*) FROM Applicants GROUP BY Course")
-            course_data = self.cursor.fetchall()
-            courses = [row[0] if row[0] else "Unknown" for row in course_data]
-            counts = [row[1] for row in course_data]
-        except:
-            courses = ["No Data"]
-            counts = [0]
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
-        # Create horizontal bar chart with courses on y-axis and counts on x-axis
-        y_pos = range(len(courses))
-        ax.barh(y_pos, counts, color='#1f6aa5')
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(courses)
-        ax.set_xlabel('Count')
-        ax.set_ylabel('Courses')
-        ax.invert_yaxis()  # Invert y-axis to have first course at top
-        fig.tight_layout()
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Charts are created after first paint, once matplotlib has loaded
+        self.charts_ready = False
+        warmup.when_loaded(content, CHART_MODULE, self.create_charts)
     
-    def create_maintainers_bar_graph(self, parent):
-        # Container
-        graph_frame = ctk.CTkFrame(parent, fg_color="white", corner_radius=10)
-        graph_frame.pack(fill="both", expand=True)
-        
-        # Title
-        ctk.CTkLabel(graph_frame, text="Maintainers Bar Graph", 
-                     font=("Arial Black", 18), text_color="black").pack(pady=10)
-        
-        # Get data by course
-        try:
-            self.cursor.execute("SELECT course, COUNT(*) FROM Maintainer GROUP BY course")
-            course_data = self.cursor.fetchall()
-            courses = [row[0] if row[0] else "Unknown" for row in course_data]
-            counts = [row[1] for row in course_data]
-        except:
-            courses = ["No Data"]
-            counts = [0]
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
-        # Create horizontal bar chart with courses on y-axis and counts on x-axis
-        y_pos = range(len(courses))
-        ax.barh(y_pos, counts, color='#2b8a3e')
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(courses)
-        ax.set_xlabel('Count')
-        ax.set_ylabel('Courses')
-        ax.invert_yaxis()  # Invert y-axis to have first course at top
-        fig.tight_layout()
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+    def refresh_dashboard(self):
+        # All cards and chart series come from one snapshot
+        stats = load_stats()
+        if stats == self.stats:
+            return  # nothing changed: no redraw at all
+        self.stats = stats
+        
+        for name, label in self.card_values.items():
+            label.configure(text=str(getattr(stats, name)))
+        
+        if self.charts_ready:
+            self.update_charts(stats)
     
-    def create_status_pie_graph(self, parent, accepted, pending, rejected):
+    def update_charts(self, stats):
+        # Data by course (No Data placeholder when empty)
+        for chart, course_data in ((self.applicants_chart, stats.applicants_by_course),
+                                   (self.maintainers_chart, stats.maintainers_by_course)):
+            course_data = course_data or [("No Data", 0)]
+            chart.update([row[0] for row in course_data], [row[1] for row in course_data])
+        
+        self.status_chart.update(stats.status_breakdown)
+    
+    def create_graph_frame(self, parent, title, pady=0):
         # Container
         graph_frame = ctk.CTkFrame(parent, fg_color="white", corner_radius=10)
-        graph_frame.pack(fill="both", expand=True)
+        graph_frame.pack(fill="both", expand=True, pady=pady)
         
         # Title
-        ctk.CTkLabel(graph_frame, text="Accepted, Pending, Rejected Pie Graph", 
+        ctk.CTkLabel(graph_frame, text=title, 
                      font=("Arial Black", 18), text_color="black").pack(pady=10)
         
-        # Data
-        labels = ['Accepted', 'Pending', 'Rejected']
-        sizes = [accepted, pending, rejected]
-        colors = ['#28a745', '#ffc107', '#dc3545']
-        
-        # Create figure
-        fig = Figure(figsize=(5, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        
-        # Only show pie if there's data
-        if sum(sizes) > 0:
-            ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            ax.axis('equal')
-        else:
-            ax.text(0.5, 0.5, 'No Data Available', horizontalalignment='center',
-                   verticalalignment='center', transform=ax.transAxes, fontsize=14)
-            ax.axis('off')
-        
-        fig.tight_layout()
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Placeholder until the chart is created
+        graph_frame.placeholder = ctk.CTkLabel(graph_frame, text="Loading chart...",
+                                               font=("Arial", 14), text_color="gray")
+        graph_frame.placeholder.pack(pady=40)
+        return graph_frame
+    
+    def create_charts(self, charts):
+        for frame in (self.applicants_frame, self.maintainers_frame, self.status_frame):
+            frame.placeholder.destroy()
+        
+        # Horizontal bars: courses on y-axis, counts on x-axis
+        self.applicants_chart = charts.BarChart(self.applicants_frame, '#1f6aa5')
+        self.maintainers_chart = charts.BarChart(self.maintainers_frame, '#2b8a3e')
+        
+        # Shows "No Data Available" while every slice is zero
+        self.status_chart = charts.PieChart(self.status_frame, ['Accepted', 'Pending', 'Rejected'],
+                                            ['#28a745', '#ffc107', '#dc3545'])
+        self.charts_ready = True
+        if self.stats is not None:
+            self.update_charts(self.stats)
     
     def create_stat_card(self, parent, title, value, color, col):
         # Card frame - smaller height for 5 cards
@@ -328,13 +241,15 @@ class ScholarshipManagementSystem(ctk.CTk):
         card.grid_propagate(False)
         
         # Value
-        ctk.CTkLabel(card, text=str(value), font=("Arial Black", 36), 
-                     text_color="white").pack(expand=True, pady=(20, 0))
+        value_label = ctk.CTkLabel(card, text=str(value), font=("Arial Black", 36), 
+                                   text_color="white")
+        value_label.pack(expand=True, pady=(20, 0))
         
         # Title
         ctk.CTkLabel(card, text=title, font=("Arial", 12), 
                      text_color="white").pack(expand=True, pady=(0, 15))
+        
+        return value_label
 
 if __name__ == "__main__":
-    app = ScholarshipManagementSystem()
-    app.mainloop()
\ No newline at end of file
+    app_shell.run("admin")
\ No newline at end of file
@@ -1,59 +1,123 @@
+import importlib
+import threading
 import customtkinter as ctk
-import subprocess
+from tkinter import messagebox
+import database
+import app_shell
+from app_shell import Screen
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("green")
 
+# Images the login screen shows first
+STARTUP_IMAGES = ("logo.png", "eye_open.png", "eye_closed.png")
+
+POLL_MS = 30
+
+
+# ----------------------- STARTUP WORK -----------------------
+# customtkinter is already imported by the time the splash is on screen;
+# everything else the login screen needs is done here instead of on
+# the first click.
+def load_libraries():
+    importlib.import_module("PIL.Image")
+    importlib.import_module("assets")
+
+
+def open_database():
+    # First connection opens the pool and brings the schema up to date
+    with database.connection() as conn:
+        conn.execute("SELECT 1").fetchone()
+
+
+def load_images():
+    import assets
+    assets.preload(STARTUP_IMAGES)
+
+
+def sweep_documents():
+    # Uploads that were replaced, or released within the sweep grace period
+    from document_store import store
+    store.sweep()
+
+
+STARTUP_STEPS = (
+    ("Loading libraries", load_libraries),
+    ("Opening database", open_database),
+    ("Loading images", load_images),
+    ("Tidying documents", sweep_documents),
+)
+
+
+class SplashScreen(Screen):
+    window_size = (640, 360)
+    borderless = True
+    cacheable = False
+
+    def __init__(self, master):
+        # Full maroon background
+        super().__init__(master, fg_color="maroon")
+
+        # --------- Elements (properly spaced) ---------
+        # Logo
+        logo_label = ctk.CTkLabel(self, text="🎓", font=("Helvetica", 36, "bold"), text_color="white", fg_color="maroon")
+        logo_label.place(relx=0.5, rely=0.25, anchor="center")
+
+        # University name
+        uni_label = ctk.CTkLabel(self, text="Batangas State University",
+                                 font=("Helvetica", 24, "bold"),
+                                 text_color="white", fg_color="maroon")
+        uni_label.place(relx=0.5, rely=0.50, anchor="center")
+
+        # Scholarship system text
+        sys_label = ctk.CTkLabel(self, text="Scholarship Management System",
+                                 font=("Helvetica", 16),
+                                 text_color="white", fg_color="maroon")
+        sys_label.place(relx=0.5, rely=0.65, anchor="center")
+
+        # Progress of the startup work
+        self.progress = ctk.CTkProgressBar(self, width=300, height=8, progress_color="white",
+                                           fg_color="#5a0000")
+        self.progress.set(0)
+        self.progress.place(relx=0.5, rely=0.78, anchor="center")
+
+        self.step_label = ctk.CTkLabel(self, text="Starting...", font=("Helvetica", 12),
+                                       text_color="white", fg_color="maroon")
+        self.step_label.place(relx=0.5, rely=0.86, anchor="center")
+
+        # --------- Startup work (off the Tk thread) ---------
+        self.done = 0
+        self.step = STARTUP_STEPS[0][0]
+        threading.Thread(target=self.run_steps, name="startup", daemon=True).start()
+        self.after(POLL_MS, self.poll)
+
+    def run_steps(self):
+        for label, step in STARTUP_STEPS:
+            self.step = label
+            try:
+                step()
+            except Exception as e:
+                # The screen that needs it reports the real error
+                print(f"Startup step failed ({label}): {e}")
+            self.done += 1
+
+    def poll(self):
+        if not self.winfo_exists():
+            return
+        self.progress.set(self.done / len(STARTUP_STEPS))
+        if self.done < len(STARTUP_STEPS):
+            self.step_label.configure(text=f"{self.step}...")
+            self.after(POLL_MS, self.poll)
+        else:
+            # Hand off the moment the work is finished
+            warnings = database.schema_warnings()
+            if warnings:
+                messagebox.showwarning("Database", "\n\n".join(warnings))
+            app_shell.navigate("login")
+
+
 def splash_screen():
-    splash = ctk.CTk()
-    splash.overrideredirect(True)
-
-    # Splash size
-    w, h = 640, 360
-
-    # Center window
-    splash.update_idletasks()
-    sw, sh = splash.winfo_screenwidth(), splash.winfo_screenheight()
-    x, y = (sw - w) // 2, (sh - h) // 2
-    splash.geometry(f"{w}x{h}+{x}+{y}")
-
-    # Full maroon background
-    splash.configure(fg_color="maroon")
-
-    # --------- Elements (properly spaced) ---------
-    # Logo
-    logo_label = ctk.CTkLabel(splash, text="🎓", font=("Helvetica", 36, "bold"), text_color="white", fg_color="maroon")
-    logo_label.place(relx=0.5, rely=0.25, anchor="center")
-
-    # University name
-    uni_label = ctk.CTkLabel(splash, text="Batangas State University",
-                             font=("Helvetica", 24, "bold"),
-                             text_color="white", fg_color="maroon")
-    uni_label.place(relx=0.5, rely=0.50, anchor="center")
-
-    # Scholarship system text
-    sys_label = ctk.CTkLabel(splash, text="Scholarship Management System",
-                             font=("Helvetica", 16),
-                             text_color="white", fg_color="maroon")
-    sys_label.place(relx=0.5, rely=0.65, anchor="center")
-
-    # Loading dots
-    dots_label = ctk.CTkLabel(splash, text="", font=("Helvetica", 18, "bold"),
-                              text_color="white", fg_color="maroon")
-    dots_label.place(relx=0.5, rely=0.80, anchor="center")
-
-    # --------- Animations ---------
-    def animate_dots(counter=0):
-        dots_label.configure(text="." * ((counter % 3) + 1))
-        splash.after(500, animate_dots, counter + 1)
-
-    animate_dots()
-
-    # Close splash after 4 seconds and open login
-    splash.after(4000, lambda: [splash.destroy(),
-                                subprocess.Popen(["python", "login.py"])])
-
-    splash.mainloop()
+    app_shell.run("splash")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+import importlib
+import customtkinter as ctk
+
+# ----------------------- CONFIG -----------------------
+ctk.set_appearance_mode("light")
+ctk.set_default_color_theme("green")
+
+APP_TITLE = "Scholarship Management System - Batangas State University"
+
+# route -> (module, attribute). Modules are imported on first visit, so the
+# login screen does not pay for matplotlib or the mail stack.
+ROUTES = {
+    "splash": ("animation", "SplashScreen"),
+    "login": ("login", "LoginScreen"),
+    "forgot_password": ("forget_pass", "ForgotPasswordWindow"),
+    "reset_password": ("reset_password", "ForgotPasswordScreen"),
+    "reset_otp": ("reset_password", "OtpScreen"),
+    "reset_new_password": ("reset_password", "NewPasswordScreen"),
+    "reset_success": ("reset_password", "SuccessScreen"),
+    "admin": ("adminchart", "ScholarshipManagementSystem"),
+    "new_applicants": ("New_Applicants", "NewApplicantsDashboard"),
+    "maintainers": ("Maintainers", "MaintainersDashboard"),
+    "maintainer": ("maintainersdashboard", "MaintainerApp"),
+}
+
+
+# ============================================================
+#                      ROUTED SCREEN
+# ============================================================
+class Screen(ctk.CTkFrame):
+    """A page of the application: a frame inside the single CTk root.
+
+    Class attributes describe the window while the screen is shown.
+    """
+    title = APP_TITLE
+    window_size = None      # None: maximized; (w, h): centered fixed-size window
+    min_size = None
+    borderless = False
+    cacheable = True        # False: rebuilt on every visit, destroyed when left
+
+    def __init__(self, master, **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        kwargs.setdefault("corner_radius", 0)
+        super().__init__(master, **kwargs)
+
+    @classmethod
+    def cache_key(cls, **params):
+        return tuple(sorted(params.items()))
+
+    def on_show(self):
+        """Called every time the screen becomes visible (refresh data here)."""
+
+    def on_hide(self):
+        """Called when another screen replaces this one."""
+
+
+# ============================================================
+#                          ROUTER
+# ============================================================
+class Router:
+    """Swaps Screen frames inside one root window, reusing cached screens."""
+
+    def __init__(self, root, routes=ROUTES):
+        self.root = root
+        self.routes = dict(routes)
+        self.cache = {}
+        self.current = None
+
+    def _screen_class(self, route):
+        module_name, attr = self.routes[route]
+        return getattr(importlib.import_module(module_name), attr)
+
+    def navigate(self, route, **params):
+        cls = self._screen_class(route)
+        key = (route, cls.cache_key(**params))
+
+        screen = self.cache.get(key)
+        if screen is None or not screen.winfo_exists():
+            screen = cls(self.root, **params)
+            if cls.cacheable:
+                self.cache[key] = screen
+
+        previous, self.current = self.current, screen
+        if previous is not None and previous is not screen:
+            previous.on_hide()
+            previous.pack_forget()
+            if not previous.cacheable:
+                previous.destroy()
+
+        self.apply_window(screen)
+        screen.pack(fill="both", expand=True)
+        screen.on_show()
+        return screen
+
+    def evict(self, route):
+        """Drop cached screens of `route` (e.g. a user's dashboard on logout)."""
+        for key in [key for key in self.cache if key[0] == route]:
+            screen = self.cache.pop(key)
+            if screen is not self.current and screen.winfo_exists():
+                screen.destroy()
+
+    def apply_window(self, screen):
+        root = self.root
+        root.title(screen.title)
+        root.overrideredirect(screen.borderless)
+
+        if screen.window_size:
+            w, h = screen.window_size
+            x = (root.winfo_screenwidth() - w) // 2
+            y = (root.winfo_screenheight() - h) // 2
+            root.state("normal")
+            root.minsize(1, 1)
+            root.geometry(f"{w}x{h}+{x}+{y}")
+            root.resizable(False, False)
+        else:
+            root.resizable(True, True)
+            if screen.min_size:
+                root.minsize(*screen.min_size)
+            root.after(100, lambda: maximize(root))
+
+
+def maximize(root):
+    try:
+        root.state("zoomed")
+    except Exception:
+        # "zoomed" is Windows/macOS only
+        root.geometry(f"{root.winfo_screenwidth()}x{root.winfo_screenheight()}+0+0")
+
+
+# ----------------------- MODULE API -----------------------
+_router = None
+
+
+def get_router():
+    return _router
+
+
+def navigate(route, **params):
+    """Show `route` in the running application window."""
+    return _router.navigate(route, **params)
+
+
+def run(route="splash", **params):
+    """Start the single-process application on `route`."""
+    global _router
+    root = ctk.CTk()
+    _router = Router(root)
+    _router.navigate(route, **params)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    run()
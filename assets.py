@@ -0,0 +1,121 @@
+import os
+import threading
+from collections import OrderedDict
+import customtkinter as ctk
+from PIL import Image, ImageTk
+
+# ----------------------- CONFIG -----------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMAGE_CACHE_SIZE = 64   # decoded images, and sized variants (CTkImage / PhotoImage), kept in memory
+
+# ============================================================
+#                     IMAGE ASSET REGISTRY
+# ============================================================
+# Every image is decoded once per process and every (path, size) variant is
+# built once. Entries remember the file's mtime, so replacing a file (e.g. a
+# new avatar) is picked up on the next lookup while unchanged files never
+# hit the PNG decoder again. Both caches are LRUs of IMAGE_CACHE_SIZE entries,
+# so a stream of different avatars cannot grow them without bound.
+
+_decoded = OrderedDict()   # path -> (mtime, PIL image), least recently used first
+_variants = OrderedDict()  # (kind, path, size) -> (mtime, image), least recently used first
+_lock = threading.Lock()
+
+
+def path(name):
+    """Absolute path of an asset; names are relative to the project folder."""
+    return os.path.join(BASE_DIR, name)
+
+
+def exists(name):
+    return os.path.exists(path(name))
+
+
+def _mtime(file_path):
+    return os.stat(file_path).st_mtime_ns
+
+
+def _cached(cache, key, mtime):
+    """The cached value for this version of the file, or None (call with _lock held)."""
+    entry = cache.get(key)
+    if entry is None or entry[0] != mtime:
+        return None
+    cache.move_to_end(key)
+    return entry[1]
+
+
+def _remember(cache, key, mtime, value):
+    """Cache value, evicting the least recently used entries (call with _lock held)."""
+    cache[key] = (mtime, value)
+    cache.move_to_end(key)
+    while len(cache) > IMAGE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def decoded(name):
+    """PIL image of an asset file (e.g. "logo.png"), decoded once per file version.
+
+    Safe to call from a worker thread; only the sized variants need Tk.
+    """
+    file_path = path(name)
+    mtime = _mtime(file_path)
+    with _lock:
+        image = _cached(_decoded, file_path, mtime)
+    if image is None:
+        image = Image.open(file_path)
+        image.load()   # decode now, not on first draw
+        with _lock:
+            _remember(_decoded, file_path, mtime, image)
+    return image
+
+
+def preload(names):
+    """Decode the assets that exist (the splash screen runs this off the Tk thread)."""
+    for name in names:
+        if exists(name):
+            decoded(name)
+
+
+def _variant(kind, name, size, build):
+    file_path = path(name)
+    mtime = _mtime(file_path)
+    key = (kind, file_path, size)
+    with _lock:
+        image = _cached(_variants, key, mtime)
+    if image is not None:
+        return image
+
+    image = build(decoded(name))
+    with _lock:
+        _remember(_variants, key, mtime, image)
+    return image
+
+
+def ctk_image(name, size):
+    """Shared CTkImage of `name` at `size` (w, h); built once per file version."""
+    return _variant("ctk", name, size,
+                    lambda image: ctk.CTkImage(image, size=size))
+
+
+def square_photo(name, side):
+    """Tk PhotoImage of `name` center-cropped to a square and scaled to `side` px."""
+    def build(image):
+        image = image.convert("RGBA")
+        w, h = image.size
+        s = min(w, h)
+        left = (w - s) // 2
+        top = (h - s) // 2
+        image = image.crop((left, top, left + s, top + s))
+        return ImageTk.PhotoImage(image.resize((side, side), Image.LANCZOS))
+
+    return _variant("photo", name, side, build)
+
+
+def forget(name):
+    """Drop every cached version of `name` (e.g. after deleting the file)."""
+    file_path = path(name)
+    with _lock:
+        _decoded.pop(file_path, None)
+        for key in [key for key in _variants if key[1] == file_path]:
+            del _variants[key]
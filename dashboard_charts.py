@@ -0,0 +1,191 @@
+import math
+import time
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+# ============================================================
+#        REUSABLE CHARTS (built once, updated in place)
+# ============================================================
+# Building a Figure + FigureCanvasTkAgg and running tight_layout is the
+# expensive part of a chart. These components do it once. The data artists
+# (bars, wedges, percentages) are "animated": a full draw caches everything
+# else as a background, and a data-only change restores that background and
+# blits the artists on top instead of re-rendering axes, ticks and text.
+
+
+class _BlitChart:
+    def _init_canvas(self, parent):
+        self.background = None
+        self.canvas = FigureCanvasTkAgg(self.fig, parent)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+
+    def _animated(self):
+        return []
+
+    def _on_draw(self, event):
+        # After every full draw (first show, resize, layout change)
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated():
+            self.ax.draw_artist(artist)
+
+    def _redraw(self, full):
+        if full or self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+
+
+class BarChart(_BlitChart):
+    """Horizontal bar chart: one bar per label (course)."""
+
+    def __init__(self, parent, color, xlabel="Count", ylabel="Courses", figsize=(5, 3)):
+        self.color = color
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.labels = None
+        self.values = None
+        self.bars = []
+
+        self.fig = Figure(figsize=figsize, dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self._init_canvas(parent)
+
+    def _animated(self):
+        return self.bars
+
+    def _rebuild(self, labels, values):
+        # Only when the set of courses changes: new bars, ticks and layout
+        ax = self.ax
+        ax.clear()
+        y_pos = range(len(labels))
+        self.bars = list(ax.barh(y_pos, values, color=self.color))
+        for bar in self.bars:
+            bar.set_animated(True)
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(labels)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel)
+        ax.invert_yaxis()  # Invert y-axis to have first course at top
+        self.fig.tight_layout()
+
+    def _fit_xlim(self, values):
+        """Rescale (a full redraw) only when bars outgrow the axis or shrink below half of it."""
+        peak = max(values + [1])
+        limit = self.ax.get_xlim()[1]
+        if peak > limit or peak < limit / 2:
+            self.ax.set_xlim(0, peak * 1.25)
+            return True
+        return False
+
+    def update(self, labels, values):
+        """Show new values; returns False (no redraw) when nothing changed."""
+        labels, values = list(labels), list(values)
+        if labels == self.labels and values == self.values:
+            return False
+
+        full = labels != self.labels
+        if full:
+            self._rebuild(labels, values)
+        else:
+            for bar, value in zip(self.bars, values):
+                bar.set_width(value)
+
+        full = self._fit_xlim(values) or full
+        self.labels, self.values = labels, values
+        self._redraw(full)
+        return True
+
+
+class PieChart(_BlitChart):
+    """Pie chart whose wedges and labels are re-angled in place."""
+
+    def __init__(self, parent, labels, colors, figsize=(5, 4), startangle=90):
+        self.labels = list(labels)
+        self.startangle = startangle
+        self.values = None
+
+        self.fig = Figure(figsize=figsize, dpi=100)
+        self.ax = self.fig.add_subplot(111)
+
+        # Equal placeholder slices: creates the wedges/texts once
+        self.wedges, self.texts, self.autotexts = self.ax.pie(
+            [1] * len(self.labels), labels=self.labels, colors=colors,
+            autopct='%1.1f%%', startangle=startangle)
+        self.ax.set_xlim(-1.25, 1.25)
+        self.ax.set_ylim(-1.25, 1.25)
+        self.ax.set_aspect('equal')
+        self.empty_text = self.ax.text(0.5, 0.5, 'No Data Available', horizontalalignment='center',
+                                       verticalalignment='center', transform=self.ax.transAxes,
+                                       fontsize=14, visible=False)
+        for artist in self._animated():
+            artist.set_animated(True)
+        self.fig.tight_layout()
+        self._init_canvas(parent)
+
+    def _animated(self):
+        return self.wedges + self.texts + self.autotexts + [self.empty_text]
+
+    def update(self, values):
+        """Show new slice sizes; returns False (no redraw) when nothing changed."""
+        values = list(values)
+        if values == self.values:
+            return False
+        self.values = values
+
+        total = sum(values)
+        self.empty_text.set_visible(total == 0)
+
+        theta1 = self.startangle
+        for wedge, label, pct, value in zip(self.wedges, self.texts, self.autotexts, values):
+            theta2 = theta1 + (360.0 * value / total if total else 0)
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+
+            # Same placement rules as Axes.pie: label at 1.1 r, percentage at 0.6 r
+            mid = math.radians((theta1 + theta2) / 2)
+            x, y = math.cos(mid), math.sin(mid)
+            label.set_position((1.1 * x, 1.1 * y))
+            label.set_horizontalalignment('left' if x > 0 else 'right')
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text(f"{100.0 * value / total:.1f}%" if total else "")
+
+            # Hide empty slices instead of stacking their labels
+            visible = value > 0
+            wedge.set_visible(visible)
+            label.set_visible(visible)
+            pct.set_visible(visible)
+            theta1 = theta2
+
+        self._redraw(False)
+        return True
+
+
+# ----------------------- BENCHMARK -----------------------
+if __name__ == "__main__":
+    # python dashboard_charts.py  ->  time of an in-place update incl. redraw
+    import random
+    import tkinter as tk
+
+    root = tk.Tk()
+    bars = BarChart(root, "#1f6aa5")
+    pie = PieChart(root, ['Accepted', 'Pending', 'Rejected'], ['#28a745', '#ffc107', '#dc3545'])
+    courses = ["BSIT", "BSCS", "BSEd", "BSN", "BSBA"]
+    bars.update(courses, [1] * len(courses))
+    pie.update([1, 1, 1])
+    root.update()
+
+    runs = 50
+    start = time.perf_counter()
+    for _ in range(runs):
+        bars.update(courses, [random.randint(250, 500) for _ in courses])
+        pie.update([random.randint(0, 500) for _ in range(3)])
+        root.update_idletasks()
+    per_update = (time.perf_counter() - start) / runs * 1000
+    print(f"in-place update of both charts: {per_update:.1f} ms")
+    root.destroy()
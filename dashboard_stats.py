@@ -0,0 +1,93 @@
+import sqlite3
+import database
+import schema
+
+# Values of the Applicants.StatusCode generated column (see schema.py)
+STATUS_OTHER = 0
+STATUS_ACCEPTED = 1
+STATUS_PENDING = 2
+STATUS_REJECTED = 3
+
+# Trigger-maintained counters (schema.DashboardCounts): O(courses) rows
+COUNTS_QUERY = """
+    SELECT source, course, status_code, n FROM DashboardCounts ORDER BY source, course
+"""
+
+# Fallback while the counters are not installed: one pass per table, both
+# over covering indexes idx_applicants_course_status and idx_maintainer_course
+STATS_QUERY = """
+    SELECT 'A', Course, StatusCode, COUNT(*) FROM Applicants GROUP BY Course, StatusCode
+    UNION ALL
+    SELECT 'M', course, NULL, COUNT(*) FROM Maintainer GROUP BY course
+"""
+
+
+class DashboardStats:
+    """Everything the admin dashboard shows, from a single query.
+
+    Cards: applicants, maintainers, accepted, pending, rejected (ints).
+    Charts: applicants_by_course, maintainers_by_course - lists of
+    (course, count) in course order, with NULL courses shown as "Unknown".
+    """
+
+    def __init__(self, applicants=0, maintainers=0, accepted=0, pending=0, rejected=0,
+                 applicants_by_course=None, maintainers_by_course=None):
+        self.applicants = applicants
+        self.maintainers = maintainers
+        self.accepted = accepted
+        self.pending = pending
+        self.rejected = rejected
+        self.applicants_by_course = applicants_by_course or []
+        self.maintainers_by_course = maintainers_by_course or []
+
+    @property
+    def status_breakdown(self):
+        return [self.accepted, self.pending, self.rejected]
+
+    def _key(self):
+        return (self.applicants, self.maintainers, self.accepted, self.pending, self.rejected,
+                tuple(self.applicants_by_course), tuple(self.maintainers_by_course))
+
+    def __eq__(self, other):
+        # Lets the dashboard skip redrawing when nothing changed
+        return isinstance(other, DashboardStats) and self._key() == other._key()
+
+    def __repr__(self):
+        return (f"DashboardStats(applicants={self.applicants}, maintainers={self.maintainers}, "
+                f"accepted={self.accepted}, pending={self.pending}, rejected={self.rejected})")
+
+
+def _fold(rows):
+    stats = DashboardStats()
+    by_status = {STATUS_ACCEPTED: 0, STATUS_PENDING: 0, STATUS_REJECTED: 0, STATUS_OTHER: 0}
+    applicant_courses = {}
+    maintainer_courses = {}
+
+    for source, course, status_code, count in rows:
+        course = course if course else "Unknown"
+        if source == "A":
+            stats.applicants += count
+            by_status[status_code] = by_status.get(status_code, 0) + count
+            applicant_courses[course] = applicant_courses.get(course, 0) + count
+        else:
+            stats.maintainers += count
+            maintainer_courses[course] = maintainer_courses.get(course, 0) + count
+
+    stats.accepted = by_status[STATUS_ACCEPTED]
+    stats.pending = by_status[STATUS_PENDING]
+    stats.rejected = by_status[STATUS_REJECTED]
+    stats.applicants_by_course = list(applicant_courses.items())
+    stats.maintainers_by_course = list(maintainer_courses.items())
+    return stats
+
+
+def load_stats():
+    """Snapshot of every dashboard number; empty stats if the tables are missing."""
+    try:
+        with database.connection() as conn:
+            query = COUNTS_QUERY if schema.counters_ready(conn) else STATS_QUERY
+            rows = conn.execute(query).fetchall()
+    except sqlite3.Error as e:
+        print("Dashboard stats unavailable:", e)
+        return DashboardStats()
+    return _fold(rows)
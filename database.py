@@ -0,0 +1,180 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# ----------------------- CONFIG -----------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Override with SCHOLARSHIP_DB=/path/to/file.db (e.g. a copy for testing)
+DB_FILE = os.environ.get("SCHOLARSHIP_DB", os.path.join(BASE_DIR, "Scholarship.db"))
+
+POOL_SIZE = 4                  # max open connections per process
+BUSY_TIMEOUT = 10              # seconds to wait on a locked database
+STATEMENT_CACHE_SIZE = 256     # prepared statements kept per connection
+
+PRAGMAS = (
+    ("journal_mode", "WAL"),     # readers never block the writer
+    ("synchronous", "NORMAL"),   # safe with WAL, one fsync per checkpoint
+    ("cache_size", -16000),      # ~16 MB page cache per connection
+    ("mmap_size", 268435456),    # map up to 256 MB of the file
+    ("temp_store", "MEMORY"),    # sorts / temp tables stay in RAM
+)
+
+
+# ----------------------- CONNECTION POOL -----------------------
+class ConnectionPool:
+    """Small thread-aware pool of tuned sqlite3 connections.
+
+    A thread that asks for a connection while it already holds one gets the
+    same connection back, so helpers can call each other without deadlocking
+    the pool or splitting one unit of work across two connections.
+    """
+
+    def __init__(self, path=None, size=POOL_SIZE, timeout=BUSY_TIMEOUT):
+        self.path = path or DB_FILE
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._all = []
+        self._schema_ready = False
+        self.schema_warnings = []   # what the migrations could not do as planned
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout,
+                               check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        for name, value in PRAGMAS:
+            conn.execute(f"PRAGMA {name}={value}")
+        if not self._schema_ready:
+            import schema
+            self.schema_warnings = schema.ensure_schema(conn)
+            self._schema_ready = True
+        return conn
+
+    def acquire(self):
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+
+        conn = None
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._opened < self.size:
+                    self._opened += 1
+                    try:
+                        conn = self._open()
+                    except Exception:
+                        self._opened -= 1
+                        raise
+                    self._all.append(conn)
+            if conn is None:
+                conn = self._idle.get(timeout=self.timeout)
+
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self, conn):
+        if getattr(self._local, "conn", None) is not conn:
+            raise RuntimeError("Connection released by a thread that does not hold it")
+        self._local.depth -= 1
+        if self._local.depth:
+            return
+
+        self._local.conn = None
+        if conn.in_transaction:
+            # Caller forgot to commit: never hand a half-open write to someone else
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Commit on success, roll back on error; nested use joins the outer one.
+
+        Nesting is counted per thread rather than read from in_transaction,
+        which stays False until the outer block's first write: an inner block
+        that ran before it would otherwise commit on its own.
+        """
+        with self.connection() as conn:
+            depth = getattr(self._local, "tx_depth", 0)
+            # Also joins a transaction the caller opened on the bare connection
+            outermost = not depth and not conn.in_transaction
+            self._local.tx_depth = depth + 1
+            try:
+                yield conn
+                if outermost:
+                    conn.commit()
+            except BaseException:
+                if outermost:
+                    conn.rollback()
+                raise
+            finally:
+                self._local.tx_depth = depth
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._all:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._all.clear()
+            self._opened = 0
+            self._idle = queue.LifoQueue()
+
+
+# ----------------------- MODULE API -----------------------
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure(path=None, size=POOL_SIZE):
+    """Point the application at another database file (closes the old pool)."""
+    global _pool, DB_FILE
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        if path:
+            DB_FILE = path
+        _pool = ConnectionPool(DB_FILE, size=size)
+    return _pool
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_FILE)
+    return _pool
+
+
+def connection():
+    """`with database.connection() as conn:` - borrow a pooled connection."""
+    return get_pool().connection()
+
+
+def transaction():
+    """`with database.transaction() as conn:` - borrow and commit atomically."""
+    return get_pool().transaction()
+
+
+def schema_warnings():
+    """Warnings from bringing the schema up to date (after the first connection)."""
+    return list(get_pool().schema_warnings)
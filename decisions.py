@@ -0,0 +1,105 @@
+import database
+import outbox
+from document_store import store, document_refs
+
+# ============================================================
+#              BULK DECISIONS (ONE TRANSACTION EACH)
+# ============================================================
+# Accepting or declining moves a whole selection with a handful of set-based
+# statements. Kept apart from the New Applicants screen so the rules about
+# who may be promoted do not depend on the GUI toolkit being importable.
+
+
+def _stage_batch(conn, applicant_ids):
+    """Load the chosen Applicant_ids into a per-connection temp table."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS batch_ids (applicant_id INTEGER PRIMARY KEY)")
+    conn.execute("DELETE FROM batch_ids")
+    conn.executemany("INSERT OR IGNORE INTO batch_ids (applicant_id) VALUES (?)",
+                     [(applicant_id,) for applicant_id in applicant_ids])
+
+
+def _batch_recipients(conn):
+    return conn.execute("""
+        SELECT Email, Name, StudentID FROM Applicants
+        WHERE Applicant_id IN (SELECT applicant_id FROM batch_ids)
+    """).fetchall()
+
+
+def _skip_existing_scholars(conn):
+    """Take out of the batch the applicants whose StudentID is already in
+    Maintainer (a returning scholar), or repeats an earlier applicant of the
+    batch. Returns their names; they stay in Applicants, undecided."""
+    rows = conn.execute("""
+        SELECT a.Applicant_id, a.Name FROM Applicants a
+        WHERE a.Applicant_id IN (SELECT applicant_id FROM batch_ids)
+          AND (EXISTS (SELECT 1 FROM Maintainer m WHERE m.student_id = a.StudentID)
+               OR EXISTS (SELECT 1 FROM Applicants d
+                          WHERE d.StudentID = a.StudentID AND d.Applicant_id < a.Applicant_id
+                            AND d.Applicant_id IN (SELECT applicant_id FROM batch_ids)))
+    """).fetchall()
+    conn.executemany("DELETE FROM batch_ids WHERE applicant_id = ?", [(row[0],) for row in rows])
+    return [name for _, name in rows]
+
+
+def accept_applicants(applicant_ids):
+    """Move applicants (and their requirements) to Maintainer in one transaction.
+
+    Everything is set-based INSERT ... SELECT / DELETE inside SQLite, so the
+    cost is a handful of statements whether 1 or 2,000 applicants are chosen.
+    Returns ((email, name, student_id) for each accepted applicant, names of
+    the applicants skipped because they already are scholars).
+    """
+    with database.transaction() as conn:
+        _stage_batch(conn, applicant_ids)
+        skipped = _skip_existing_scholars(conn)
+        recipients = _batch_recipients(conn)
+        # Committed with the decision; outbox.py delivers it
+        outbox.enqueue(conn, "acceptance", recipients)
+
+        # Requirement rows of a maintainer deleted before delete_maintainer
+        # took them along: maintainer_id is unique, so they make way
+        stale = ("maintainer_id IN (SELECT StudentID FROM Applicants"
+                 " WHERE Applicant_id IN (SELECT applicant_id FROM batch_ids))")
+        released = document_refs(conn, "Maintainer_Requirements", stale)
+        conn.execute(f"DELETE FROM Maintainer_Requirements WHERE {stale}")
+        conn.execute("""
+            INSERT INTO Maintainer_Requirements (maintainer_id, COR, TOR, GOOD_MORAL)
+            SELECT a.StudentID, r.COR, r.TOR, r.Good_Moral
+            FROM Applicant_Requirements r
+            JOIN Applicants a ON a.Applicant_id = r.applicants_id
+            WHERE r.applicants_id IN (SELECT applicant_id FROM batch_ids)
+        """)
+        conn.execute("""
+            INSERT INTO Maintainer (
+                student_id, name, username, password, email, school, course,
+                yearlevel, phone_number, gwa, status
+            )
+            SELECT StudentID, Name, Username, Password, Email, School, Course,
+                   Year_Level, Phone_Number, GWA, Status
+            FROM Applicants
+            WHERE Applicant_id IN (SELECT applicant_id FROM batch_ids)
+        """)
+        conn.execute("DELETE FROM Applicant_Requirements WHERE applicants_id IN (SELECT applicant_id FROM batch_ids)")
+        conn.execute("DELETE FROM Applicants WHERE Applicant_id IN (SELECT applicant_id FROM batch_ids)")
+        conn.execute("DELETE FROM batch_ids")
+    store.sweep(released)
+    return recipients, skipped
+
+
+def decline_applicants(applicant_ids):
+    """Remove applicants and their requirements in one transaction.
+
+    Their documents leave the store too, unless another row shares them.
+    Returns (email, name, student_id) for each declined applicant.
+    """
+    with database.transaction() as conn:
+        _stage_batch(conn, applicant_ids)
+        recipients = _batch_recipients(conn)
+        outbox.enqueue(conn, "decline", recipients)
+        released = document_refs(conn, "Applicant_Requirements",
+                                  "applicants_id IN (SELECT applicant_id FROM batch_ids)")
+        conn.execute("DELETE FROM Applicant_Requirements WHERE applicants_id IN (SELECT applicant_id FROM batch_ids)")
+        conn.execute("DELETE FROM Applicants WHERE Applicant_id IN (SELECT applicant_id FROM batch_ids)")
+        conn.execute("DELETE FROM batch_ids")
+    store.sweep(released)
+    return recipients
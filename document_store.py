@@ -0,0 +1,280 @@
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+import database
+import schema
+
+# ----------------------- CONFIG -----------------------
+# Override with SCHOLARSHIP_DOCS=/path/to/folder
+STORE_DIR = os.environ.get("SCHOLARSHIP_DOCS", os.path.join(database.BASE_DIR, "documents"))
+
+CHUNK_SIZE = 1024 * 1024          # bytes read/hashed/written per step
+MAX_DOCUMENT_SIZE = 64 * 1024 * 1024   # reject anything larger while streaming
+SWEEP_GRACE = 300                 # seconds sweep() keeps a new upload its row may not reference yet
+
+# Requirement columns that hold store digests (or legacy BLOBs)
+DOCUMENT_COLUMNS = (
+    ("Applicant_Requirements", ("COR", "TOR", "Good_Moral")),
+    ("Maintainer_Requirements", ("COR", "TOR", "GOOD_MORAL")),
+)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+MAGIC = (
+    (b"%PDF", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xFF\xD8\xFF", "image/jpeg"),
+)
+
+# Stored files keep an extension so the OS viewer can open them in place
+EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+}
+
+ALLOWED_MIME = tuple(EXTENSIONS)
+
+
+class DocumentError(ValueError):
+    """Upload rejected: wrong type, empty, or over MAX_DOCUMENT_SIZE."""
+
+
+def is_reference(value):
+    """True if a requirement column holds a store digest (not a legacy BLOB)."""
+    return isinstance(value, str) and bool(_DIGEST_RE.match(value))
+
+
+def sniff_mime(head, filename=None):
+    """Type from the magic bytes in `head`, else guessed from `filename` (never
+    pass one when the result decides whether a file is accepted)."""
+    for magic, mime in MAGIC:
+        if head.startswith(magic):
+            return mime
+    guessed = mimetypes.guess_type(filename or "")[0]
+    return guessed or "application/octet-stream"
+
+
+# ----------------------- STATUS QUERIES -----------------------
+# Only typeof()/length() and the Documents row are read: SQLite answers
+# these without touching BLOB overflow pages, so a status check costs bytes.
+def describe_documents(table, key_column, key, columns):
+    """Presence and size of each requirement - never the document bytes.
+
+    Returns [{"label", "table", "column", "rowid", "ref", "size"}, ...] for the
+    documents that are present; `ref` is the store digest or None for a
+    legacy BLOB still inside the table.
+    """
+    select = ["rowid"]
+    for _, column in columns:
+        select.append(f"CASE typeof({column}) WHEN 'text' THEN {column} END")
+        select.append(f"CASE typeof({column}) WHEN 'blob' THEN length({column}) "
+                      f"WHEN 'text' THEN (SELECT size FROM Documents WHERE hash = {column}) END")
+
+    with database.connection() as conn:
+        row = conn.execute(f"SELECT {', '.join(select)} FROM {table} WHERE {key_column} = ?",
+                           (key,)).fetchone()
+    if not row:
+        return []
+
+    documents = []
+    for i, (label, column) in enumerate(columns):
+        ref, size = row[1 + 2 * i], row[2 + 2 * i]
+        if not ref and not size:
+            continue
+        documents.append({"label": label, "column": column, "rowid": row[0],
+                          "ref": ref, "size": size, "table": table})
+    return documents
+
+
+def requirement_status(table, key_column, key, columns):
+    """{label: True/False} for each requirement, without loading any document."""
+    present = {doc["label"] for doc in describe_documents(table, key_column, key, columns)}
+    return {label: label in present for label, _ in columns}
+
+
+def document_refs(conn, table, condition, params=()):
+    """Store digests held by the `table` rows matching `condition`.
+
+    Read them in the transaction that deletes those rows, then pass them to
+    store.sweep() once it has committed.
+    """
+    columns = dict(DOCUMENT_COLUMNS)[table]
+    select = ", ".join(f"CASE typeof({column}) WHEN 'text' THEN {column} END" for column in columns)
+    refs = set()
+    for row in conn.execute(f"SELECT {select} FROM {table} WHERE {condition}", params):
+        refs.update(value for value in row if is_reference(value))
+    return refs
+
+
+def _write_lock(conn):
+    # Uploads and sweeps take the write lock before touching files, so a
+    # sweep never deletes a file an upload has just found or placed
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+
+# ============================================================
+#            CONTENT-ADDRESSED DOCUMENT STORE
+# ============================================================
+class DocumentStore:
+    """Stores each distinct file once, named by its SHA-256 digest.
+
+    Files are sharded as <root>/ab/cd/abcd....pdf; the database keeps only the
+    64-character digest, so re-uploading the same certificate every semester
+    costs no extra disk and requirement tables stay small enough to cache.
+    Files no requirement row references any more are removed by sweep().
+    """
+
+    def __init__(self, root=None):
+        self.root = root or STORE_DIR
+
+    def path_for(self, digest, mime="application/pdf"):
+        name = digest + EXTENSIONS.get(mime, "")
+        return os.path.join(self.root, digest[:2], digest[2:4], name)
+
+    def locate(self, digest):
+        """Path of a stored document, or None if the store has no such file."""
+        with database.connection() as conn:
+            row = conn.execute("SELECT mime FROM Documents WHERE hash=?", (digest,)).fetchone()
+        path = self.path_for(digest, row[0]) if row else None
+        return path if path and os.path.exists(path) else None
+
+    def put_file(self, src_path, allowed=ALLOWED_MIME):
+        """Copy a file into the store (hashing as it streams); returns its digest."""
+        with open(src_path, "rb") as src:
+            return self._ingest(src.read, src_path, allowed)
+
+    def put_blob(self, conn, table, column, rowid, allowed=None):
+        """Stream a BLOB cell into the store with incremental I/O; returns its digest."""
+        with conn.blobopen(table, column, rowid, readonly=True) as blob:
+            return self._ingest(blob.read, None, allowed)
+
+    def _ingest(self, read, filename, allowed):
+        """One pass over `read(CHUNK_SIZE)`: validate, hash and copy; memory stays at one chunk."""
+        os.makedirs(self.root, exist_ok=True)
+        sha = hashlib.sha256()
+        size = 0
+        mime = None
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                while True:
+                    chunk = read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if mime is None:
+                        # Type is known from the first chunk: fail before copying the rest.
+                        # Checked uploads go by content alone, so a renamed file
+                        # cannot pass as a PDF
+                        mime = sniff_mime(chunk[:16], None if allowed else filename)
+                        if allowed and mime not in allowed:
+                            named = f" ({os.path.basename(filename)} by its content)" if filename else ""
+                            raise DocumentError(f"Unsupported file type{named}: {mime}.")
+                    size += len(chunk)
+                    if size > MAX_DOCUMENT_SIZE:
+                        raise DocumentError(
+                            f"File is larger than {MAX_DOCUMENT_SIZE // (1024 * 1024)} MB.")
+                    sha.update(chunk)
+                    dst.write(chunk)
+
+            if not size:
+                raise DocumentError("File is empty.")
+
+            digest = sha.hexdigest()
+            self._place(tmp_path, digest, size, mime)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest
+
+    def _place(self, tmp_path, digest, size, mime):
+        """Move a finished upload into place and record it, under the write lock."""
+        final_path = self.path_for(digest, mime)
+        with database.transaction() as conn:
+            _write_lock(conn)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)            # duplicate upload: keep the existing copy
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+            # A repeated upload restarts its sweep() grace period
+            conn.execute("""
+                INSERT INTO Documents (hash, size, mime) VALUES (?, ?, ?)
+                ON CONFLICT (hash) DO UPDATE SET uploaded_at = datetime('now')
+            """, (digest, size, mime))
+
+    def sweep(self, digests=None):
+        """Delete the stored documents no requirement row references any more.
+
+        `digests` limits the check to the ones a delete released (see
+        document_refs); None checks the whole store. Uploads newer than
+        SWEEP_GRACE are kept either way, as their row may not be written yet;
+        the next full sweep gets them. Returns the number of documents removed.
+        """
+        if digests is not None and not digests:
+            return 0
+        with database.transaction() as conn:
+            _write_lock(conn)
+            conditions = ["uploaded_at <= datetime('now', ?)"]
+            params = [f"-{SWEEP_GRACE} seconds"]
+            referenced = " UNION ALL ".join(
+                f"SELECT {column} FROM {table} WHERE typeof({column}) = 'text'"
+                for table, columns in DOCUMENT_COLUMNS if schema.table_columns(conn, table)
+                for column in columns)
+            if referenced:
+                conditions.append(f"hash NOT IN ({referenced})")
+            if digests is not None:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS sweep_candidates (hash TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM sweep_candidates")
+                conn.executemany("INSERT OR IGNORE INTO sweep_candidates (hash) VALUES (?)",
+                                 [(digest,) for digest in digests])
+                conditions.append("hash IN (SELECT hash FROM sweep_candidates)")
+            orphans = conn.execute(f"SELECT hash, mime FROM Documents WHERE {' AND '.join(conditions)}",
+                                   params).fetchall()
+
+            removed = []
+            for digest, mime in orphans:
+                try:
+                    os.remove(self.path_for(digest, mime))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue   # in use or not ours to delete: its row stays for the next sweep
+                removed.append((digest,))
+            conn.executemany("DELETE FROM Documents WHERE hash = ?", removed)
+            if digests is not None:
+                conn.execute("DELETE FROM sweep_candidates")
+        return len(removed)
+
+
+    def migrate_blobs(self, table, columns):
+        """Move legacy BLOB cells of `table` into the store, leaving digests behind."""
+        moved = 0
+        with database.connection() as conn:
+            for column in columns:
+                rowids = [r[0] for r in conn.execute(
+                    f"SELECT rowid FROM {table} WHERE typeof({column}) = 'blob'")]
+                for rowid in rowids:
+                    with database.transaction():
+                        digest = self.put_blob(conn, table, column, rowid)
+                        conn.execute(f"UPDATE {table} SET {column}=? WHERE rowid=?",
+                                     (digest, rowid))
+                    moved += 1
+        return moved
+
+
+store = DocumentStore()
+
+
+# ----------------------- MAINTENANCE -----------------------
+if __name__ == "__main__":
+    # python document_store.py  ->  move every legacy BLOB into the store,
+    # then delete the documents nothing references
+    for table, columns in DOCUMENT_COLUMNS:
+        print(f"{table}: {store.migrate_blobs(table, columns)} documents moved")
+    print(f"{store.sweep()} unreferenced documents removed")
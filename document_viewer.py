@@ -0,0 +1,147 @@
+import atexit
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import customtkinter as ctk
+from tkinter import messagebox
+import database
+from document_store import store, is_reference, sniff_mime, EXTENSIONS, CHUNK_SIZE
+from document_store import describe_documents as fetch_documents
+
+OPEN_POLL_MS = 30   # how often the Tk thread checks for an opened document
+
+# ----------------------- TEMP CACHE -----------------------
+# Legacy BLOBs are streamed into one private folder per process, named by
+# table/row/column so concurrent viewers never overwrite each other's files.
+_cache_dir = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache_dir():
+    global _cache_dir
+    with _cache_lock:
+        if _cache_dir is None:
+            _cache_dir = tempfile.mkdtemp(prefix="scholarship-docs-")
+            atexit.register(shutil.rmtree, _cache_dir, True)
+        return _cache_dir
+
+
+def format_size(size):
+    if size is None:
+        return ""
+    if size < 1024 * 1024:
+        return f"{max(1, size // 1024)} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+# ----------------------- MATERIALIZE -----------------------
+def local_path(doc):
+    """A path the OS viewer can open; streams legacy BLOBs once, then reuses the file."""
+    if doc["ref"]:
+        if is_reference(doc["ref"]):
+            return store.locate(doc["ref"])
+        # Older maintainer uploads stored a file path
+        return doc["ref"] if os.path.exists(doc["ref"]) else None
+
+    base = os.path.join(_get_cache_dir(), f"{doc['table']}-{doc['rowid']}-{doc['column']}")
+    for ext in EXTENSIONS.values():
+        if os.path.exists(base + ext):
+            return base + ext
+
+    part = f"{base}.{threading.get_ident()}.part"
+    with database.connection() as conn, \
+            conn.blobopen(doc["table"], doc["column"], doc["rowid"], readonly=True) as blob, \
+            open(part, "wb") as out:
+        ext = EXTENSIONS.get(sniff_mime(blob.read(16)), ".pdf")
+        blob.seek(0)
+        while True:
+            chunk = blob.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            out.write(chunk)
+    os.replace(part, base + ext)
+    return base + ext
+
+
+def open_path(path):
+    if sys.platform.startswith("win"):
+        os.startfile(path)
+    elif sys.platform.startswith("darwin"):
+        subprocess.call(["open", path])
+    else:
+        subprocess.call(["xdg-open", path])
+
+
+# ============================================================
+#               REQUIREMENTS VIEWER WINDOW
+# ============================================================
+class RequirementsViewer(ctk.CTkToplevel):
+    """Lists uploaded requirements; a document is only read when it is opened."""
+
+    def __init__(self, parent, title, student_id, documents, button_colors=None):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry("520x380")
+        self.resizable(False, False)
+
+        # Center window
+        self.update_idletasks()
+        w, h = 520, 380
+        x = (self.winfo_screenwidth() // 2) - (w // 2)
+        y = (self.winfo_screenheight() // 2) - (h // 2)
+        self.geometry(f"{w}x{h}+{x}+{y}")
+
+        self.documents = documents
+
+        ctk.CTkLabel(self, text=f"Requirements for Student ID {student_id}",
+                     font=("Arial Black", 20)).pack(pady=20)
+
+        # No files
+        if not documents:
+            ctk.CTkLabel(self, text="No requirements uploaded.", font=("Arial", 16)).pack(pady=20)
+            return
+
+        colors = button_colors or {}
+        for doc in documents:
+            size = format_size(doc["size"])
+            text = f"Open {doc['label']}" + (f"  ({size})" if size else "")
+            ctk.CTkButton(self, text=text, width=200, **colors,
+                          command=lambda d=doc: self.open_with_loading(d)).pack(pady=10)
+
+    # ---------------- OPEN FILE SAFELY ---------------- #
+    def open_document(self, doc):
+        """Runs on a worker thread, so no Tk calls: returns an error message or None."""
+        try:
+            path = local_path(doc)
+            if path is None:
+                return f"{doc['label']} is missing from the document store."
+            open_path(path)
+        except Exception as e:
+            return str(e)
+        return None
+
+    # ---------------- LOADING LABEL WRAPPER ---------------- #
+    def open_with_loading(self, doc):
+        loading = ctk.CTkLabel(self, text="Opening file...", font=("Arial", 14))
+        loading.pack(pady=10)
+
+        # The worker only puts its outcome here; the Tk thread polls for it
+        outcome = queue.SimpleQueue()
+        threading.Thread(target=lambda: outcome.put(self.open_document(doc)), daemon=True).start()
+        self.after(OPEN_POLL_MS, self._poll_open, outcome, loading)
+
+    def _poll_open(self, outcome, loading):
+        if not self.winfo_exists():
+            return
+        try:
+            error = outcome.get_nowait()
+        except queue.Empty:
+            self.after(OPEN_POLL_MS, self._poll_open, outcome, loading)
+            return
+        loading.destroy()
+        if error:
+            messagebox.showerror("Open Error", error, parent=self)
@@ -0,0 +1,166 @@
+import base64
+import string
+from email.header import Header
+from email.utils import formataddr, parseaddr
+import mailer
+
+# ============================================================
+#               PRE-COMPILED EMAIL TEMPLATES
+# ============================================================
+# Building a MIMEMultipart and flattening it costs far more than the text
+# itself. A Template does the constant work once: the header block is
+# encoded to bytes and the body is split into literal text and {field}
+# slots. render() only joins the per-recipient values into the body,
+# base64-encodes it (as MIMEText does for UTF-8) and returns a
+# mailer.RawMessage ready for SMTP.
+
+
+def _header_value(value):
+    """Encode a header value (RFC 2047 only when it is not plain ASCII)."""
+    return value if value.isascii() else Header(value, "utf-8").encode()
+
+
+class Template:
+    def __init__(self, subject, body, sender=None):
+        self.subject = subject
+        self.sender = sender or mailer.sender_address()
+        self.parts = []      # literal text and field names, alternating
+        self.fields = set()
+        for literal, field, _, _ in string.Formatter().parse(body):
+            self.parts.append(literal)
+            if field is not None:
+                self.parts.append((field,))
+                self.fields.add(field)
+
+        name, address = parseaddr(self.sender)
+        self.envelope_from = address
+        self._from = f"From: {formataddr((_header_value(name), address))}\r\n".encode()
+        self._rest = (
+            f"Subject: {_header_value(subject)}\r\n"
+            "MIME-Version: 1.0\r\n"
+            'Content-Type: text/plain; charset="utf-8"\r\n'
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+        ).encode()
+
+    def body(self, **values):
+        return "".join(part if isinstance(part, str) else str(values[part[0]])
+                       for part in self.parts)
+
+    def render(self, to, **values):
+        """RawMessage for `to`; `values` fill the body's {fields}."""
+        to = to.replace("\r", "").replace("\n", "")   # no header injection
+        body = base64.encodebytes(self.body(**values).encode("utf-8")).replace(b"\n", b"\r\n")
+        data = b"".join((self._from, b"To: ", to.encode("utf-8"), b"\r\n", self._rest, body))
+        return mailer.RawMessage(self.envelope_from, to, data)
+
+
+# ----------------------- DECISION EMAILS -----------------------
+ACCEPTANCE = Template("Scholarship Application Accepted - Batangas State University", """
+BATANGAS STATE UNIVERSITY
+Scholarship Management System
+
+Congratulations, {recipient_name}!
+
+We are pleased to inform you that your scholarship application has been ACCEPTED.
+
+Student ID: {student_id}
+Status: ✓ Accepted
+
+Your account has been upgraded to Scholar (Maintainer) status. You can now log in to the Scholarship Management System using your existing credentials.
+
+Next Steps:
+1. Log in to the scholarship portal using your username and password
+2. Review your scholarship details and requirements
+3. Keep your documents up to date
+4. Contact the scholarship office if you have any questions
+
+IMPORTANT: Please keep this email for your records.
+
+If you have any questions or concerns, please don't hesitate to contact us.
+
+Best regards,
+Batangas State University
+Scholarship Office
+
+---
+This is an automated message. Please do not reply to this email.
+© 2025 Batangas State University. All rights reserved.
+        """)
+
+DECLINE = Template("Scholarship Application Status - Batangas State University", """
+BATANGAS STATE UNIVERSITY
+Scholarship Management System
+
+Dear {recipient_name},
+
+Thank you for your interest in the scholarship program at Batangas State University.
+
+After careful review of your application, we regret to inform you that your scholarship application has not been approved at this time.
+
+Student ID: {student_id}
+Status: ✗ Not Approved
+
+We understand this may be disappointing news. Please note that this decision does not reflect on your academic abilities or potential. Due to limited scholarship slots and high competition, we are unable to accommodate all qualified applicants.
+
+We encourage you to:
+• Explore other scholarship opportunities available at the university
+• Reapply in future scholarship cycles
+• Contact the scholarship office for feedback on your application
+
+If you have any questions or would like to discuss other financial assistance options, please feel free to contact our office.
+
+Thank you again for your application, and we wish you the best in your academic endeavors.
+
+Best regards,
+Batangas State University
+Scholarship Office
+
+---
+This is an automated message. Please do not reply to this email.
+© 2025 Batangas State University. All rights reserved.
+        """)
+
+
+def acceptance_email(recipient_email, recipient_name, student_id):
+    return ACCEPTANCE.render(recipient_email, recipient_name=recipient_name, student_id=student_id)
+
+
+def decline_email(recipient_email, recipient_name, student_id):
+    return DECLINE.render(recipient_email, recipient_name=recipient_name, student_id=student_id)
+
+
+# ----------------------- BENCHMARK -----------------------
+if __name__ == "__main__":
+    # python email_templates.py [N]  ->  render throughput vs. MIMEMultipart
+    import sys
+    import time
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    people = [(f"student{n}@example.com", f"Juan Dela Cruz {n}", f"21-{n:05d}") for n in range(count)]
+    text = DECLINE.body(recipient_name="{recipient_name}", student_id="{student_id}")
+
+    def mime_email(email, name, student_id):
+        # What build_decline_email used to do per recipient
+        msg = MIMEMultipart()
+        msg["Subject"] = DECLINE.subject
+        msg["From"] = DECLINE.sender
+        msg["To"] = email
+        msg.attach(MIMEText(text.format(recipient_name=name, student_id=student_id), "plain"))
+        return msg.as_bytes()
+
+    start = time.perf_counter()
+    for person in people:
+        mime_email(*person)
+    mime_rate = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for person in people:
+        decline_email(*person)
+    template_rate = count / (time.perf_counter() - start)
+
+    print(f"MIMEMultipart + as_bytes: {mime_rate:10.0f} emails/s")
+    print(f"compiled template:        {template_rate:10.0f} emails/s  "
+          f"({template_rate / mime_rate:.0f}x, {count} recipients)")
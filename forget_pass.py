@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import subprocess
+import app_shell
+from app_shell import Screen
 
 # ------------------------- CONFIG -------------------------
 ctk.set_appearance_mode("light")
@@ -9,28 +10,17 @@ ctk.set_default_color_theme("green")
 # ============================================================
 #          MINI WINDOW FOR FORGOT PASSWORD / RESET
 # ============================================================
-class ForgotPasswordWindow:
-
-    def __init__(self, width=500, height=300):
-        self.win = ctk.CTk()
-        self.win.title("Reset Password")
-
-        # Centering window
-        screen_w = self.win.winfo_screenwidth()
-        screen_h = self.win.winfo_screenheight()
-        x = int((screen_w / 2) - (width / 2))
-        y = int((screen_h / 2) - (height / 2))
-
-        self.win.geometry(f"{width}x{height}+{x}+{y}")
-        self.win.resizable(False, False)
+class ForgotPasswordWindow(Screen):
+    title = "Reset Password"
+    window_size = (500, 300)   # the router centers it and makes it fixed-size
 
+    def __init__(self, master):
+        super().__init__(master)
         self.build_ui()
 
-        self.win.mainloop()
-
     def build_ui(self):
 
-        frame = ctk.CTkFrame(self.win, fg_color="white", corner_radius=15)
+        frame = ctk.CTkFrame(self, fg_color="white", corner_radius=15)
         frame.pack(expand=True, fill="both", padx=20, pady=20)
 
         # Title
@@ -67,12 +57,11 @@ class ForgotPasswordWindow:
         )
         change_btn.pack(pady=10)
 
-    # 🟥 Ito yung magbubukas ng separate file para mag-reset
+    # 🟥 Ito yung magbubukas ng reset screen
     def open_change_password_window(self):
         try:
-            # Example: Opens separate python file for actual change-password UI
-            subprocess.Popen(["python", "reset_password.py"])
-            self.win.destroy()
+            # The actual change-password UI (reset_password.py) in the same window
+            app_shell.navigate("reset_password")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -81,4 +70,4 @@ class ForgotPasswordWindow:
 # RUN WINDOW DIRECTLY (for testing)
 # ============================================================
 if __name__ == "__main__":
-    ForgotPasswordWindow()
+    app_shell.run("forgot_password")
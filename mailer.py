@@ -0,0 +1,449 @@
+import asyncio
+import os
+import queue
+import smtplib
+import socketserver
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# ----------------------- CONFIG -----------------------
+EMAIL_CONFIG = {
+    "smtp_server": "smtp.gmail.com",
+    "smtp_port": 587,
+    "sender_email": "bsu.smsoffice@gmail.com",
+    "sender_password": "eltk hyar kjve dbhu",  # Your app password
+    "sender_name": "BSU Scholarship Office",
+    "starttls": True,
+}
+
+# Override with SCHOLARSHIP_SMTP=host:port to deliver to a local test sink
+# (plain SMTP, no STARTTLS/login), e.g. the one `python mailer.py --sink` runs
+if os.environ.get("SCHOLARSHIP_SMTP"):
+    _host, _, _port = os.environ["SCHOLARSHIP_SMTP"].rpartition(":")
+    EMAIL_CONFIG.update(smtp_server=_host or "localhost", smtp_port=int(_port),
+                        sender_password="", starttls=False)
+
+CONCURRENCY = 4        # messages in flight at once (= SMTP sessions kept open)
+QUEUE_SIZE = 500       # unfinished messages before submit() blocks
+SUBMIT_TIMEOUT = 10    # seconds submit() waits for room in the queue
+SMTP_TIMEOUT = 30      # socket timeout per SMTP command
+IDLE_CHECK = 60        # seconds idle before a session is NOOP-checked
+MAX_ATTEMPTS = 4       # tries per message (transient errors only)
+BACKOFF = 1.0          # first retry delay in seconds, doubled each time
+POLL_MS = 50
+
+
+class MailError(Exception):
+    pass
+
+
+def sender_address():
+    return f"{EMAIL_CONFIG['sender_name']} <{EMAIL_CONFIG['sender_email']}>"
+
+
+class RawMessage:
+    """A message already flattened to bytes (see email_templates.py)."""
+
+    def __init__(self, sender, to, data):
+        self.sender = sender   # envelope sender address
+        self.to = to
+        self.data = data
+
+
+def recipient(msg):
+    return msg.to if isinstance(msg, RawMessage) else msg["To"]
+
+
+# ============================================================
+#                    SMTP SESSION POOL
+# ============================================================
+class SMTPSession:
+    """One long-lived SMTP connection that reconnects when the server drops it."""
+
+    def __init__(self, config=None):
+        self.config = config or EMAIL_CONFIG
+        self.smtp = None
+        self.last_used = 0.0
+
+    def connect(self):
+        self.close()
+        config = self.config
+        smtp = smtplib.SMTP(config["smtp_server"], config["smtp_port"], timeout=SMTP_TIMEOUT)
+        try:
+            if config.get("starttls", True):
+                smtp.starttls()
+            if config.get("sender_password"):
+                smtp.login(config["sender_email"], config["sender_password"])
+        except Exception:
+            smtp.close()
+            raise
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+    def _alive(self):
+        if self.smtp is None:
+            return False
+        if time.monotonic() - self.last_used < IDLE_CHECK:
+            return True
+        try:
+            return self.smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _send(self, msg):
+        if isinstance(msg, RawMessage):
+            self.smtp.sendmail(msg.sender, [msg.to], msg.data)
+        else:
+            self.smtp.send_message(msg)
+
+    def send(self, msg):
+        if not self._alive():
+            self.connect()
+        try:
+            self._send(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped between the liveness check and the send: one reconnect
+            self.connect()
+            self._send(msg)
+        self.last_used = time.monotonic()
+
+    def close(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self.smtp.close()
+            self.smtp = None
+
+
+class SessionPool:
+    """Up to `size` SMTP sessions, reused LIFO so the warmest one goes first."""
+
+    def __init__(self, size=CONCURRENCY, config=None):
+        self.size = size
+        self.config = config
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._opened < self.size:
+                    self._opened += 1
+                    return SMTPSession(self.config)   # connects on first send
+            return self._idle.get()
+
+    def release(self, session):
+        self._idle.put(session)
+
+    @contextmanager
+    def session(self):
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def close_all(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# ============================================================
+#                BACKGROUND DELIVERY WORKERS
+# ============================================================
+class DeliveryResult:
+    def __init__(self, recipient, ok, error=None, attempts=1, transient=False):
+        self.recipient = recipient
+        self.ok = ok
+        self.error = error
+        self.attempts = attempts
+        self.transient = transient   # failed, but worth trying again later
+
+    def __repr__(self):
+        state = "sent" if self.ok else f"failed: {self.error}"
+        return f"DeliveryResult({self.recipient}, {state}, attempts={self.attempts})"
+
+
+def is_transient(error):
+    """Worth retrying: connection trouble or a 4xx (try again later) reply.
+
+    A 5xx refusal (unknown recipient, bad login) fails at once. Every
+    smtplib exception is an OSError, so the reply codes are checked first.
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return bool(codes) and all(400 <= code < 500 for code in codes)
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class Mailer:
+    """Delivers messages from one dedicated asyncio loop thread.
+
+    At most `concurrency` messages are in flight; each runs smtplib on a
+    pooled session in the loop's executor (that many threads, never one per
+    message), and retry backoff is an asyncio sleep that holds neither a
+    thread nor a concurrency slot. submit() returns at once, or blocks for
+    up to `timeout` while `queue_size` messages are unfinished (backpressure).
+
+    on_result(DeliveryResult) runs on the loop thread: keep it short, and
+    wrap it with UiBridge to touch widgets.
+    """
+
+    def __init__(self, concurrency=CONCURRENCY, queue_size=QUEUE_SIZE, config=None):
+        self.concurrency = concurrency
+        self.pool = SessionPool(concurrency, config)
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._unfinished = 0
+        self._done = threading.Condition()
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(ThreadPoolExecutor(self.concurrency, thread_name_prefix="mailer"))
+            self._limit = asyncio.Semaphore(self.concurrency)
+            threading.Thread(target=loop.run_forever, name="mailer-loop", daemon=True).start()
+            self._loop = loop
+
+    def submit(self, msg, on_result=None, timeout=SUBMIT_TIMEOUT):
+        self._start()
+        if not self._slots.acquire(timeout=timeout):
+            raise MailError("Mail queue is full, try again later.")
+        with self._done:
+            self._unfinished += 1
+        asyncio.run_coroutine_threadsafe(self._job(msg, on_result), self._loop)
+
+    def _send_blocking(self, msg):
+        with self.pool.session() as session:
+            try:
+                session.send(msg)
+            except Exception as e:
+                if is_transient(e):
+                    session.close()   # next use starts from a fresh connection
+                raise
+
+    async def _deliver(self, msg):
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                async with self._limit:
+                    await self._loop.run_in_executor(None, self._send_blocking, msg)
+                return DeliveryResult(recipient(msg), True, attempts=attempts)
+            except Exception as e:
+                if attempts >= MAX_ATTEMPTS or not is_transient(e):
+                    return DeliveryResult(recipient(msg), False, str(e), attempts, is_transient(e))
+                await asyncio.sleep(BACKOFF * 2 ** (attempts - 1))
+
+    async def _job(self, msg, on_result):
+        try:
+            result = await self._deliver(msg)
+            if on_result is not None:
+                on_result(result)
+        except Exception as e:
+            print(f"✗ Mail delivery error: {e}")
+        finally:
+            self._slots.release()
+            with self._done:
+                self._unfinished -= 1
+                if not self._unfinished:
+                    self._done.notify_all()
+
+    def join(self):
+        """Block until every submitted message has been handled."""
+        with self._done:
+            while self._unfinished:
+                self._done.wait()
+
+
+_mailer = None
+_mailer_lock = threading.Lock()
+
+
+def get_mailer():
+    global _mailer
+    if _mailer is None:
+        with _mailer_lock:
+            if _mailer is None:
+                _mailer = Mailer()
+    return _mailer
+
+
+def submit(msg, on_result=None):
+    """Queue `msg` for background delivery."""
+    get_mailer().submit(msg, on_result)
+
+
+# ============================================================
+#                 RESULTS BACK ON THE TK THREAD
+# ============================================================
+class UiBridge:
+    """Runs callbacks posted from worker threads on the Tk thread of `widget`.
+
+    Tk is not thread-safe, so other threads only put calls on a queue; the
+    Tk thread drains it from an after() loop every `poll_ms`.
+    """
+
+    def __init__(self, widget, poll_ms=POLL_MS):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._calls = queue.SimpleQueue()
+        self._latest = {}
+        self._lock = threading.Lock()
+        widget.after(poll_ms, self._pump)
+
+    def wrap(self, callback, latest=False):
+        """Thread-safe version of callback: the call happens on the next poll.
+
+        latest=True coalesces: however often it is posted between two polls,
+        callback runs once with the newest arguments (progress displays).
+        """
+        if not latest:
+            return lambda *args: self._calls.put((callback, args))
+
+        def post(*args):
+            with self._lock:
+                self._latest[callback] = args
+        return post
+
+    def _run(self, callback, args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"✗ Mail result callback failed: {e}")
+
+    def _pump(self):
+        if not self.widget.winfo_exists():
+            return
+        while True:
+            try:
+                callback, args = self._calls.get_nowait()
+            except queue.Empty:
+                break
+            self._run(callback, args)
+        with self._lock:
+            latest, self._latest = self._latest, {}
+        for callback, args in latest.items():
+            self._run(callback, args)
+        self.widget.after(self.poll_ms, self._pump)
+
+
+# ============================================================
+#              LOCAL TEST SINK + THROUGHPUT BENCHMARK
+# ============================================================
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept and count messages (no TLS; any AUTH passes)."""
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.reply("220 sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line[:4].upper().decode(errors="replace")
+            with self.server.lock:
+                self.server.commands[verb] += 1
+            if verb in self.server.replies:
+                self.reply(self.server.replies[verb])
+            elif verb == "EHLO":
+                self.reply("250-sink")
+                self.reply("250 AUTH PLAIN")
+            elif verb == "HELO":
+                self.reply("250 sink")
+            elif verb == "AUTH":
+                self.reply("235 ok")
+            elif verb == "DATA":
+                self.reply("354 end with .")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                time.sleep(self.server.latency)
+                with self.server.lock:
+                    self.server.received += 1
+                self.reply("250 queued")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:   # MAIL, RCPT, RSET, NOOP
+                self.reply("250 ok")
+
+
+class SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=0, latency=0.0, replies=None):
+        super().__init__(("127.0.0.1", port), _SinkHandler)
+        self.latency = latency   # seconds per accepted message, like a real relay
+        self.replies = replies or {}   # verb -> canned reply, e.g. {"RCPT": "550 no such user"}
+        self.received = 0
+        self.commands = Counter()
+        self.lock = threading.Lock()
+
+
+if __name__ == "__main__":
+    # python mailer.py --sink [PORT]        -> run a local sink for SCHOLARSHIP_SMTP
+    # python mailer.py [N] [LATENCY_MS]     -> messages/second against a local sink
+    import sys
+    from email.message import EmailMessage
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--sink":
+        server = SinkServer(int(sys.argv[2]) if len(sys.argv) > 2 else 8025)
+        print(f"SMTP sink on 127.0.0.1:{server.server_address[1]} (Ctrl+C to stop)")
+        server.serve_forever()
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02
+    server = SinkServer(latency=latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = dict(EMAIL_CONFIG, smtp_server="127.0.0.1", smtp_port=server.server_address[1],
+                  sender_password="", starttls=False)
+
+    def message(n):
+        msg = EmailMessage()
+        msg["Subject"] = "Benchmark"
+        msg["From"] = sender_address()
+        msg["To"] = f"student{n}@example.com"
+        msg.set_content("Scholarship status update.\n" * 20)
+        return msg
+
+    messages = [message(n) for n in range(count)]
+
+    sample = messages[:max(1, count // 10)]
+    start = time.perf_counter()
+    for msg in sample:
+        session = SMTPSession(config)   # old way: connection per message
+        session.send(msg)
+        session.close()
+    per_connection = len(sample) / (time.perf_counter() - start)
+
+    print(f"relay latency {latency * 1000:.0f} ms, {count} messages")
+    print(f"connection per message:       {per_connection:8.0f} msg/s")
+    for concurrency in (1, CONCURRENCY, 2 * CONCURRENCY):
+        mailer = Mailer(concurrency, config=config)
+        start = time.perf_counter()
+        for msg in messages:
+            mailer.submit(msg)   # blocks once QUEUE_SIZE are unfinished
+        mailer.join()
+        rate = count / (time.perf_counter() - start)
+        print(f"asyncio, concurrency {concurrency:2}:     {rate:8.0f} msg/s")
+    server.shutdown()
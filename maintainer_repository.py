@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+import database
+
+# ----------------------- CONFIG -----------------------
+CACHE_SIZE = 128   # maintainer profiles kept in memory
+
+COLUMNS = "student_id, name, username, email, school, course, yearlevel, phone_number, gwa, status"
+
+# ============================================================
+#                 MAINTAINER PROFILE REPOSITORY
+# ============================================================
+# One query and one dict per maintainer, whether the screen knows the
+# student_id (login) or the username (dashboard / upload launched from the
+# command line). Profiles live in a bounded LRU identity map, so both keys
+# return the same object and re-rendering a dashboard costs no SQL. Code
+# that writes a Maintainer row calls invalidate() after committing.
+
+
+def _profile(row):
+    parts = row[1].split()
+    initials = "".join([p[0] for p in parts[:2]]).upper()
+    return {
+        "student_id": row[0],
+        "initials": initials,
+        "name": row[1],
+        "maintainer_no": row[0],
+        "program": f"{row[6]} ({row[5]})",
+        "year": row[6],
+        "status": row[9],
+        "username": row[2],
+        "email": row[3],
+        "phone": row[7],
+        "gwa": row[8],
+    }
+
+
+class MaintainerRepository:
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._profiles = OrderedDict()   # student_id -> profile, least recently used first
+        self._usernames = {}             # username -> student_id of a cached profile
+        self._lock = threading.Lock()
+
+    def _cached(self, student_id):
+        profile = self._profiles.get(student_id)
+        if profile is not None:
+            self._profiles.move_to_end(student_id)
+        return profile
+
+    def _load(self, column, value):
+        with database.connection() as conn:
+            row = conn.execute(f"SELECT {COLUMNS} FROM Maintainer WHERE {column}=?",
+                               (value,)).fetchone()
+        if not row:
+            return None   # misses are not cached: the row may be created any time
+        profile = _profile(row)
+        with self._lock:
+            # Another thread may have loaded it meanwhile: keep one identity
+            existing = self._cached(profile["student_id"])
+            if existing is not None:
+                return existing
+            self._profiles[profile["student_id"]] = profile
+            self._usernames[profile["username"]] = profile["student_id"]
+            while len(self._profiles) > self.size:
+                _, evicted = self._profiles.popitem(last=False)
+                self._usernames.pop(evicted["username"], None)
+        return profile
+
+    def by_student_id(self, student_id):
+        with self._lock:
+            profile = self._cached(student_id)
+        return profile or self._load("student_id", student_id)
+
+    def by_username(self, username):
+        with self._lock:
+            student_id = self._usernames.get(username)
+            profile = self._cached(student_id) if student_id is not None else None
+        return profile or self._load("username", username)
+
+    def invalidate(self, student_id):
+        """Forget a maintainer after its row was updated or deleted."""
+        with self._lock:
+            profile = self._profiles.pop(student_id, None)
+            if profile is not None:
+                self._usernames.pop(profile["username"], None)
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+            self._usernames.clear()
+
+
+repository = MaintainerRepository()
+
+
+if __name__ == "__main__":
+    # python maintainer_repository.py [USERNAME] -> cached vs. uncached lookups
+    import sys
+    import time
+
+    with database.connection() as conn:
+        row = conn.execute("SELECT username FROM Maintainer LIMIT 1").fetchone()
+    username = sys.argv[1] if len(sys.argv) > 1 else row and row[0]
+    if not username:
+        sys.exit("No maintainers in the database")
+
+    rounds = 5000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        repository.clear()
+        repository.by_username(username)
+    uncached = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        repository.by_username(username)
+    cached = (time.perf_counter() - start) / rounds
+    print(f"uncached: {uncached * 1e6:7.1f} µs/lookup")
+    print(f"cached:   {cached * 1e6:7.1f} µs/lookup ({uncached / cached:.0f}x)")
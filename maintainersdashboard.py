@@ -4,9 +4,13 @@ from tkinter import messagebox
 import sqlite3
 import sys
 import webbrowser
-import subprocess
 import hashlib
-from PIL import Image, ImageTk
+import assets
+import database
+import app_shell
+from app_shell import Screen
+from document_store import store, DocumentError, requirement_status, document_refs
+from maintainer_repository import repository
 
 # ----------------------- COLORS -----------------------
 MAROON       = "#7B1113"
@@ -21,96 +25,29 @@ ACTIVE_HOVER = "#A52A2A"
 ctk.set_appearance_mode("light")
 
 # ----------------------- DATABASE -----------------------
-DB_FILE = "Scholarship.db"
-
-def get_connection():
-    return sqlite3.connect(DB_FILE)
-
 def get_maintainer_by_studentid(student_id):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
-        SELECT student_id, name, username, email, school, course, yearlevel, phone_number, gwa, status
-        FROM Maintainer
-        WHERE student_id=?
-    """, (student_id,))
-    row = c.fetchone()
-    conn.close()
-    if row:
-        parts = row[1].split()
-        initials = "".join([p[0] for p in parts[:2]]).upper()
-        return {
-            "student_id": row[0],
-            "initials": initials,
-            "name": row[1],
-            "maintainer_no": row[0],
-            "program": f"{row[6]} ({row[5]})",
-            "year": row[6],
-            "status": row[9],
-            "username": row[2],
-            "email": row[3],
-            "phone": row[7],
-            "gwa": row[8],
-        }
-    return None
+    return repository.by_student_id(student_id)
 
 def get_maintainer_by_username(username):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
-        SELECT student_id, name, username, email, school, course, yearlevel, phone_number, gwa, status 
-        FROM Maintainer
-        WHERE username=?
-    """, (username,))
-    row = c.fetchone()
-    conn.close()
-    if row:
-        parts = row[1].split()
-        initials = "".join([p[0] for p in parts[:2]]).upper()
-        return {
-            "student_id": row[0],
-            "initials": initials,
-            "name": row[1],
-            "maintainer_no": row[0],
-            "program": f"{row[6]} ({row[5]})",
-            "year": row[6],
-            "status": row[9],
-            "username": row[2],
-            "email": row[3],
-            "phone": row[7],
-            "gwa": row[8],
-            "avatar_path": row[10]
-        }
-    return None
+    return repository.by_username(username)
+
+# (progress label, Maintainer_Requirements column)
+REQUIREMENTS = (
+    ("COR (Certificate of Registration)", "COR"),
+    ("Grades (Previous Semester)", "TOR"),
+    ("Good Moral Certificate", "GOOD_MORAL"),
+)
+
+# upload form field -> Maintainer_Requirements column
+UPLOAD_COLUMNS = {"COR": "COR", "Grades": "TOR", "Good Moral": "GOOD_MORAL"}
 
 def get_maintainer_requirements(students_id):
     """
-    Check if requirements exist as BLOB data (not just 0 or 1)
-    Returns a dictionary with True if BLOB exists, False otherwise
+    Check which requirements have been uploaded.
+    Returns a dictionary with True/False per requirement; only sizes are
+    read, never the documents themselves.
     """
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
-        SELECT COR, TOR, GOOD_MORAL
-        FROM Maintainer_Requirements
-        WHERE maintainer_id = ?
-    """, (students_id,))
-    row = c.fetchone()
-    conn.close()
-    
-    requirements = {
-        "COR (Certificate of Registration)": False,
-        "Grades (Previous Semester)": False,
-        "Good Moral Certificate": False
-    }
-    
-    if row:
-        # Check if BLOB data exists (not None and not empty)
-        requirements["COR (Certificate of Registration)"] = bool(row[0])
-        requirements["Grades (Previous Semester)"] = bool(row[1])
-        requirements["Good Moral Certificate"] = bool(row[2])
-    
-    return requirements
+    return requirement_status("Maintainer_Requirements", "maintainer_id", students_id, REQUIREMENTS)
 
 # ----------------------- COMPONENTS -----------------------
 class Tag(ctk.CTkLabel):
@@ -142,15 +79,8 @@ class AvatarCanvas(tk.Canvas):
 
     def set_image(self, path):
         try:
-            img = Image.open(path).convert("RGBA")
-            # resize and crop to square
-            w, h = img.size
-            s = min(w, h)
-            left = (w - s)//2
-            top = (h - s)//2
-            img = img.crop((left, top, left+s, top+s))
-            img = img.resize((self.size-4, self.size-4), Image.LANCZOS)
-            tkimg = ImageTk.PhotoImage(img)
+            # cropped/resized once per file version, shared between rebuilds
+            tkimg = assets.square_photo(path, self.size-4)
             self.delete("all")
             self.create_image(self.size/2, self.size/2, image=tkimg)
             self._img_ref = tkimg
@@ -354,51 +284,35 @@ class ScholarshipsAvailable(ctk.CTkFrame):
         maintainer_id_str = str(self.maintainer_id)
         
         try:
-            conn = sqlite3.connect(DB_FILE)
-            c = conn.cursor()
-            
-            # Check if record exists
-            c.execute("SELECT COR, TOR, GOOD_MORAL FROM Maintainer_Requirements WHERE maintainer_id = ?", (maintainer_id_str,))
-            row = c.fetchone()
-            
-            # Get existing BLOBs or None
-            existing_cor = row[0] if row else None
-            existing_tor = row[1] if row else None
-            existing_moral = row[2] if row else None
-            
-            # Read new files as BLOB (binary data)
-            cor_blob = existing_cor
-            tor_blob = existing_tor
-            moral_blob = existing_moral
-            
-            if "COR" in self.uploaded_files:
-                with open(self.uploaded_files["COR"], 'rb') as f:
-                    cor_blob = f.read()
-            
-            if "Grades" in self.uploaded_files:
-                with open(self.uploaded_files["Grades"], 'rb') as f:
-                    tor_blob = f.read()
-            
-            if "Good Moral" in self.uploaded_files:
-                with open(self.uploaded_files["Good Moral"], 'rb') as f:
-                    moral_blob = f.read()
-            
-            if row:
-                # Update existing record
-                c.execute("""
-                    UPDATE Maintainer_Requirements 
-                    SET COR = ?, TOR = ?, GOOD_MORAL = ?
-                    WHERE maintainer_id = ?
-                """, (cor_blob, tor_blob, moral_blob, maintainer_id_str))
-            else:
-                # Insert new record
-                c.execute("""
-                    INSERT INTO Maintainer_Requirements (maintainer_id, COR, TOR, GOOD_MORAL)
-                    VALUES (?, ?, ?, ?)
-                """, (maintainer_id_str, cor_blob, tor_blob, moral_blob))
-            
-            conn.commit()
-            conn.close()
+            # Copy new files into the document store before taking the write lock
+            refs = {name: store.put_file(path) for name, path in self.uploaded_files.items()}
+
+            with database.transaction() as conn:
+                # Check if record exists (existing documents are never read back)
+                row = conn.execute("SELECT 1 FROM Maintainer_Requirements WHERE maintainer_id = ?",
+                                   (maintainer_id_str,)).fetchone()
+                
+                columns = {UPLOAD_COLUMNS[name]: ref for name, ref in refs.items()}
+                
+                released = set()
+                if row:
+                    # Digests being replaced go to the sweep once this commits
+                    released = document_refs(conn, "Maintainer_Requirements", "maintainer_id = ?",
+                                             (maintainer_id_str,))
+                    # Update only the newly uploaded columns
+                    assignments = ", ".join(f"{column} = ?" for column in columns)
+                    conn.execute(f"""
+                        UPDATE Maintainer_Requirements 
+                        SET {assignments}
+                        WHERE maintainer_id = ?
+                    """, (*columns.values(), maintainer_id_str))
+                else:
+                    # Insert new record
+                    conn.execute("""
+                        INSERT INTO Maintainer_Requirements (maintainer_id, COR, TOR, GOOD_MORAL)
+                        VALUES (?, ?, ?, ?)
+                    """, (maintainer_id_str, columns.get("COR"), columns.get("TOR"), columns.get("GOOD_MORAL")))
+            store.sweep(released - set(refs.values()))
             
             # Update local status
             if "COR" in self.uploaded_files:
@@ -411,6 +325,8 @@ class ScholarshipsAvailable(ctk.CTkFrame):
             messagebox.showinfo("Success", "Requirements uploaded and saved successfully!")
             self.back_to_card()
             
+        except DocumentError as e:
+            messagebox.showerror("Invalid Document", str(e))
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to save requirements: {e}")
         except FileNotFoundError as e:
@@ -465,14 +381,13 @@ def create_announcement_card(parent, title, description, link=None):
 # ---------------------------------------------------------
 # MAIN DASHBOARD APP
 # ---------------------------------------------------------
-class MaintainerApp(ctk.CTk):
-    def __init__(self, maintainer):
-        super().__init__()
+class MaintainerApp(Screen):
+    title = "BatStateU • Scholarship Management System"
+    min_size = (960, 640)
+
+    def __init__(self, master, maintainer):
+        super().__init__(master, fg_color=BG)
         self.maintainer = maintainer
-        self.title("BatStateU • Scholarship Management System")
-        self.geometry("1100x720")
-        self.minsize(960,640)
-        self.configure(fg_color=BG)
         
         # ---------------- HEADER ----------------
         self.header = ctk.CTkFrame(self, fg_color=MAROON, height=110, corner_radius=0)
@@ -520,10 +435,15 @@ class MaintainerApp(ctk.CTk):
 
         # Default page
         self.show_dashboard()
-        
+
+    @classmethod
+    def cache_key(cls, maintainer):
+        # One dashboard per logged-in student
+        return maintainer["student_id"]
+
     def logout(self):
-        self.destroy()  
-        subprocess.Popen(["python", "login.py"])
+        app_shell.navigate("login")
+        app_shell.get_router().evict("maintainer")
     # ---------------- PAGE FUNCTIONS ----------------
     def clear_content(self):
         for widget in self.content_frame.winfo_children():
@@ -556,7 +476,6 @@ class MaintainerApp(ctk.CTk):
         """
         Profile Settings UI
         """
-        import sqlite3
         from tkinter import filedialog
 
         self.clear_content()
@@ -647,20 +566,16 @@ class MaintainerApp(ctk.CTk):
                     messagebox.showerror("Error", "Password must be at least 6 characters.")
                     return
                 try:
-                    conn = sqlite3.connect(DB_FILE)
-                    c = conn.cursor()
-                    c.execute("SELECT password FROM Maintainer WHERE student_id=?", (maintainer.get("student_id"),))
-                    row = c.fetchone()
-                    conn.close()
-                    stored = row[0] if row else None
-                    if stored and stored != "" and hash_pw(old_pw.get()) != stored:
-                        messagebox.showerror("Error", "Current password is incorrect.")
-                        return
-                    conn = sqlite3.connect(DB_FILE)
-                    c = conn.cursor()
-                    c.execute("UPDATE Maintainer SET password=? WHERE student_id=?", (hash_pw(new_pw.get()), maintainer.get("student_id")))
-                    conn.commit()
-                    conn.close()
+                    with database.transaction() as conn:
+                        row = conn.execute("SELECT password FROM Maintainer WHERE student_id=?",
+                                           (maintainer.get("student_id"),)).fetchone()
+                        stored = row[0] if row else None
+                        if stored and stored != "" and hash_pw(old_pw.get()) != stored:
+                            messagebox.showerror("Error", "Current password is incorrect.")
+                            return
+                        conn.execute("UPDATE Maintainer SET password=? WHERE student_id=?",
+                                     (hash_pw(new_pw.get()), maintainer.get("student_id")))
+                    repository.invalidate(maintainer.get("student_id"))
                     messagebox.showinfo("Success", "Password changed successfully.")
                     win.destroy()
                 except Exception as e:
@@ -738,11 +653,9 @@ class MaintainerApp(ctk.CTk):
                 
                 try:
                     # Verify password
-                    conn = sqlite3.connect(DB_FILE)
-                    c = conn.cursor()
-                    c.execute("SELECT password FROM Maintainer WHERE student_id=?", (maintainer.get("student_id"),))
-                    row = c.fetchone()
-                    conn.close()
+                    with database.connection() as conn:
+                        row = conn.execute("SELECT password FROM Maintainer WHERE student_id=?",
+                                           (maintainer.get("student_id"),)).fetchone()
                     
                     stored = row[0] if row else None
                     # Check both hashed and plain text password
@@ -765,14 +678,12 @@ class MaintainerApp(ctk.CTk):
                             db_updates[key_map.get(k, k)] = v
 
                     # Save to database
-                    conn = sqlite3.connect(DB_FILE)
-                    c = conn.cursor()
                     set_clause = ", ".join([f"{col}=?" for col in db_updates.keys()])
                     values = list(db_updates.values())
                     values.append(maintainer.get("student_id"))
-                    c.execute(f"UPDATE Maintainer SET {set_clause} WHERE student_id=?", values)
-                    conn.commit()
-                    conn.close()
+                    with database.transaction() as conn:
+                        conn.execute(f"UPDATE Maintainer SET {set_clause} WHERE student_id=?", values)
+                    repository.invalidate(maintainer.get("student_id"))
                     
                     # Update maintainer object with new values
                     for key, value in updated.items():
@@ -858,6 +769,4 @@ if __name__ == "__main__":
         messagebox.showerror("Error", f"Maintainer '{username}' not found!")
         sys.exit(1)
 
-    app = MaintainerApp(maintainer)
-    app.after(100, lambda: app.state("zoomed"))
-    app.mainloop()
+    app_shell.run("maintainer", maintainer=maintainer)
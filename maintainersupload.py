@@ -1,9 +1,10 @@
 import tkinter as tk
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import sqlite3
 import sys
-import os
+import database
+from document_store import store, DocumentError, requirement_status, document_refs
+from maintainer_repository import repository
 
 # ----------------------- COLORS -----------------------
 MAROON       = "#7B1113"
@@ -16,41 +17,21 @@ ACTIVE_HOVER = "#A52A2A"
 ctk.set_appearance_mode("light")
 
 # ----------------------- DATABASE -----------------------
-DB_FILE = "Scholarship.db"
-
-def get_connection():
-    return sqlite3.connect(DB_FILE)
-
 def get_maintainer_by_username(username):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("SELECT student_id, name FROM Maintainer WHERE username=?", (username,))
-    row = c.fetchone()
-    conn.close()
-    if row:
-        return {"student_id": row[0], "name": row[1]}
-    return None
+    return repository.by_username(username)
+
+DOC_TYPES = (("COR", "COR"), ("TOR", "TOR"), ("GOOD_MORAL", "GOOD_MORAL"))
 
 def get_maintainer_requirements(maintainer_id):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
-        SELECT COR, TOR, GOOD_MORAL
-        FROM Maintainer_requirements
-        WHERE maintainer_id=?
-    """, (maintainer_id,))
-    row = c.fetchone()
-    conn.close()
-    if row:
-        return {"COR": row[0], "TOR": row[1], "GOOD_MORAL": row[2]}
-    else:
+    """{doc_type: uploaded?} - reads sizes only, never the documents."""
+    with database.transaction() as conn:
+        row = conn.execute("SELECT 1 FROM Maintainer_requirements WHERE maintainer_id=?",
+                           (maintainer_id,)).fetchone()
+        if row:
+            return requirement_status("Maintainer_requirements", "maintainer_id", maintainer_id, DOC_TYPES)
         # if no record yet, create one
-        conn = get_connection()
-        c = conn.cursor()
-        c.execute("INSERT INTO Maintainer_requirements (maintainer_id) VALUES (?)", (maintainer_id,))
-        conn.commit()
-        conn.close()
-        return {"COR": None, "TOR": None, "GOOD_MORAL": None}
+        conn.execute("INSERT INTO Maintainer_requirements (maintainer_id) VALUES (?)", (maintainer_id,))
+        return {doc: False for doc, _ in DOC_TYPES}
 
 def upload_document(maintainer_id, doc_type):
     file_path = filedialog.askopenfilename(
@@ -59,22 +40,22 @@ def upload_document(maintainer_id, doc_type):
     )
     if not file_path:
         return
-    # optionally, copy file to a local folder
-    upload_dir = "uploaded_documents"
-    os.makedirs(upload_dir, exist_ok=True)
-    dest_file = os.path.join(upload_dir, f"{doc_type}_{maintainer_id}.pdf")
+    # copy into the shared document store; the table keeps only the digest
     try:
-        with open(file_path, "rb") as src, open(dest_file, "wb") as dst:
-            dst.write(src.read())
+        ref = store.put_file(file_path)
+    except DocumentError as e:
+        messagebox.showerror("Invalid Document", str(e))
+        return
     except Exception as e:
         messagebox.showerror("Error", f"Failed to copy file: {e}")
         return
 
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute(f"UPDATE Maintainer_requirements SET {doc_type}=? WHERE maintainer_id=?", (dest_file, maintainer_id))
-    conn.commit()
-    conn.close()
+    with database.transaction() as conn:
+        # the digest being replaced goes to the sweep once this commits
+        released = document_refs(conn, "Maintainer_Requirements", "maintainer_id = ?", (maintainer_id,))
+        conn.execute(f"UPDATE Maintainer_requirements SET {doc_type}=? WHERE maintainer_id=?",
+                     (ref, maintainer_id))
+    store.sweep(released - {ref})
     messagebox.showinfo("Success", f"{doc_type} uploaded successfully!")
     app.show_documents()  # refresh display
 
@@ -100,9 +81,9 @@ class MaintainerUploadApp(ctk.CTk):
 
         reqs = get_maintainer_requirements(self.maintainer["student_id"])
         
-        for i, (doc, path) in enumerate(reqs.items()):
-            status = "Uploaded" if path else "Not Uploaded"
-            color = "green" if path else "red"
+        for i, (doc, uploaded) in enumerate(reqs.items()):
+            status = "Uploaded" if uploaded else "Not Uploaded"
+            color = "green" if uploaded else "red"
 
             row_frame = ctk.CTkFrame(self.body_frame, fg_color="transparent")
             row_frame.pack(fill="x", pady=10, padx=20)
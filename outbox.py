@@ -0,0 +1,172 @@
+import importlib
+import queue
+import threading
+import database
+import mailer
+
+# ============================================================
+#              DURABLE OUTBOX FOR NOTIFICATION EMAILS
+# ============================================================
+# A decision and its notification are committed together: enqueue() runs
+# inside the caller's transaction, so the email exists exactly when the
+# status change does. The drainer thread then claims pending rows in
+# batches, hands them to the mailer and records the outcome. Rows claimed
+# by a process that died are handed out again after CLAIM_TIMEOUT, so
+# delivery is at-least-once and survives crashes and closed windows.
+
+# kind -> (module, function(recipient, name, student_id) -> message)
+KINDS = {
+    "acceptance": ("email_templates", "acceptance_email"),
+    "decline": ("email_templates", "decline_email"),
+}
+
+BATCH_SIZE = 50         # rows claimed per round
+IDLE_WAIT = 30          # seconds between polls when nothing is pending
+CLAIM_TIMEOUT = 600     # seconds before a 'sending' row is considered abandoned
+MAX_ATTEMPTS = 5        # drain rounds before a transiently failing row is given up
+                        # (permanent errors, e.g. a refused address, fail at once)
+RETRY_DELAY = 60        # seconds before a failed row is tried again (x attempts)
+
+
+def enqueue(conn, kind, recipients):
+    """Add (email, name, student_id) rows; call inside the decision's transaction."""
+    conn.executemany("INSERT INTO Outbox (kind, recipient, name, student_id) VALUES (?, ?, ?, ?)",
+                     [(kind, email, name, student_id)
+                      for email, name, student_id in recipients if email])
+
+
+def build_message(kind, recipient, name, student_id):
+    module_name, attr = KINDS[kind]
+    build = getattr(importlib.import_module(module_name), attr)
+    return build(recipient, name, student_id)
+
+
+def pending_count():
+    with database.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM Outbox WHERE state IN ('pending', 'sending')").fetchone()[0]
+
+
+# ----------------------- DRAINER -----------------------
+class Drainer:
+    def __init__(self, mail=None, batch_size=BATCH_SIZE):
+        self.mail = mail
+        self.batch_size = batch_size
+        self.listeners = []
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="outbox", daemon=True)
+                self._thread.start()
+
+    def wake(self):
+        """New rows were committed: drain now instead of at the next poll."""
+        self.start()
+        self._wake.set()
+
+    def subscribe(self, listener):
+        """listener(DeliveryResult) is called from the drainer thread."""
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _claim(self):
+        with database.transaction() as conn:
+            # Rows a dead process was sending go back in the queue
+            conn.execute("""
+                UPDATE Outbox SET state = 'pending'
+                WHERE state = 'sending' AND claimed_at < datetime('now', ?)
+            """, (f"-{CLAIM_TIMEOUT} seconds",))
+            rows = conn.execute("""
+                SELECT id, kind, recipient, name, student_id FROM Outbox
+                WHERE state = 'pending' AND (retry_at IS NULL OR retry_at <= datetime('now'))
+                ORDER BY id LIMIT ?
+            """, (self.batch_size,)).fetchall()
+            conn.executemany("UPDATE Outbox SET state = 'sending', claimed_at = datetime('now') WHERE id = ?",
+                             [(row[0],) for row in rows])
+        return rows
+
+    def _record(self, outcomes):
+        sent = [(row_id,) for row_id, result in outcomes if result.ok]
+        failed = [(result.error, int(result.transient), row_id)
+                  for row_id, result in outcomes if not result.ok]
+        with database.transaction() as conn:
+            conn.executemany("""
+                UPDATE Outbox SET state = 'sent', sent_at = datetime('now'),
+                                  attempts = attempts + 1, last_error = NULL
+                WHERE id = ?
+            """, sent)
+            conn.executemany("""
+                UPDATE Outbox SET attempts = attempts + 1, last_error = ?1,
+                                  state = CASE WHEN ?2 AND attempts + 1 < ?3 THEN 'pending' ELSE 'failed' END,
+                                  retry_at = datetime('now', '+' || (?4 * (attempts + 1)) || ' seconds')
+                WHERE id = ?5
+            """, [(error, transient, MAX_ATTEMPTS, RETRY_DELAY, row_id)
+                  for error, transient, row_id in failed])
+
+    def drain_once(self):
+        """Send one batch; returns the number of rows handled."""
+        rows = self._claim()
+        if not rows:
+            return 0
+
+        mail = self.mail or mailer.get_mailer()
+        results = queue.SimpleQueue()
+        for row_id, kind, recipient, name, student_id in rows:
+            on_result = lambda result, row_id=row_id: results.put((row_id, result))
+            try:
+                msg = build_message(kind, recipient, name, student_id)
+            except Exception as e:
+                on_result(mailer.DeliveryResult(recipient, False, f"Cannot build {kind} email: {e}"))
+                continue
+            try:
+                mail.submit(msg, on_result)
+            except mailer.MailError as e:
+                # Could not even be queued (full queue): retried later
+                on_result(mailer.DeliveryResult(recipient, False, str(e), transient=True))
+
+        outcomes = [results.get() for _ in rows]
+        self._record(outcomes)
+        for _, result in outcomes:
+            for listener in list(self.listeners):
+                listener(result)
+        return len(rows)
+
+    def _run(self):
+        while True:
+            self._wake.clear()   # a wake() during the drain triggers another round
+            try:
+                handled = self.drain_once()
+            except Exception as e:
+                print(f"✗ Outbox drain failed: {e}")
+                handled = 0
+            if handled < self.batch_size:
+                # Drained (or only waiting rows left): sleep until woken
+                self._wake.wait(IDLE_WAIT)
+
+
+_drainer = None
+_drainer_lock = threading.Lock()
+
+
+def get_drainer():
+    global _drainer
+    if _drainer is None:
+        with _drainer_lock:
+            if _drainer is None:
+                _drainer = Drainer()
+    return _drainer
+
+
+def start():
+    """Deliver whatever is pending (e.g. left over from a crash) in the background."""
+    get_drainer().start()
+
+
+def wake():
+    get_drainer().wake()
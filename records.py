@@ -0,0 +1,73 @@
+from collections import namedtuple
+
+# ============================================================
+#                  COMPACT ROW RECORDS
+# ============================================================
+# Rows the list screens page in from SQLite. Each record is a tuple subclass
+# with empty __slots__: fields have names (row.student_id) but an instance
+# costs exactly what the raw sqlite3 tuple did, and row[0] is still the
+# paging key that virtual_table.PagedQuery seeks on. Pass the class as
+# PagedQuery(record=...) and rows are built by the cursor's row_factory.
+
+
+def _record(name, fields):
+    base = namedtuple(name, fields)
+
+    class Record(base):
+        __slots__ = ()
+
+        @classmethod
+        def from_row(cls, cursor, row):
+            """sqlite3 row_factory: wraps the fetched tuple without copying fields."""
+            return tuple.__new__(cls, row)
+
+    Record.__name__ = Record.__qualname__ = name
+    return Record
+
+
+# key = Applicant_id; columns as selected by NewApplicantsDashboard
+Applicant = _record("Applicant", "key student_id name username email status")
+
+# key = rowid (normally an alias of schema.MAINTAINER_KEY); columns as selected by MaintainersDashboard
+Maintainer = _record("Maintainer", "key student_id name username email status")
+
+
+if __name__ == "__main__":
+    # python records.py [N] -> memory per row for each way of holding a row
+    import sqlite3
+    import sys
+    import tracemalloc
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE Maintainer (student_id TEXT, name TEXT, username TEXT, email TEXT, status TEXT)")
+    conn.executemany("INSERT INTO Maintainer VALUES (?, ?, ?, ?, ?)",
+                     [(f"2024{i:05d}", f"Name {i}", f"user{i}", f"user{i}@g.batstate-u.edu.ph", "claimed")
+                      for i in range(count)])
+    sql = "SELECT rowid, student_id, name, username, email, status FROM Maintainer"
+
+    class SlotsMaintainer:
+        __slots__ = Maintainer._fields
+
+        def __init__(self, cursor, row):
+            for field, value in zip(self.__slots__, row):
+                setattr(self, field, value)
+
+    factories = (
+        ("tuple", None),
+        ("dict", lambda cursor, row: dict(zip(Maintainer._fields, row))),
+        ("__slots__ class", SlotsMaintainer),
+        ("Maintainer record", Maintainer.from_row),
+    )
+    print(f"{count} rows            total  container (bytes/row)")
+    for label, factory in factories:
+        cursor = conn.cursor()
+        cursor.row_factory = factory
+        tracemalloc.start()
+        rows = cursor.execute(sql).fetchall()
+        total = tracemalloc.get_traced_memory()[0] - sys.getsizeof(rows)
+        tracemalloc.stop()
+        # The field values are the same strings whatever holds them
+        container = sys.getsizeof(rows[0])
+        del rows
+        print(f"{label:18} {total / count:7.1f} {container:7}")
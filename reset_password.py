@@ -1,14 +1,14 @@
 import customtkinter as ctk
 from tkinter import messagebox
-import sqlite3
-import smtplib
 import random
-import subprocess
-import os
-from PIL import Image
+from email.message import EmailMessage
+import database
+import mailer
+import assets
+import app_shell
+from app_shell import Screen
 
 # ------------------------- CONFIG -------------------------
-DB_FILE = "Scholarship.db"
 RESET_EMAIL = None
 RESET_OTP = None
 
@@ -22,159 +22,167 @@ HOVER = "#A52A2A"
 # OPEN LOGIN SCREEN
 # ============================================================
 def open_login():
-    subprocess.Popen(["python", "login.py"])
+    app_shell.navigate("login")
 
 # ============================================================
 # SEND OTP EMAIL
 # ============================================================
-def send_otp(email, win):
+def build_otp_email(email, otp):
+    msg = EmailMessage()
+    msg["Subject"] = "Password Reset"
+    msg["From"] = mailer.sender_address()
+    msg["To"] = email
+    msg.set_content(f"""Dear User,
+
+Your OTP Code is: **{otp}**
+
+Please keep this OTP secure and do not share it with anyone. 
+This code is confidential and will only be used to reset your password.
+
+Thank you for your cooperation.
+""")
+    return msg
+
+
+def send_otp(email, on_result):
+    """Queue the OTP email; on_result(DeliveryResult) reports delivery.
+
+    Returns True when the email was queued.
+    """
     email = email.strip()
     if email == "":
         messagebox.showerror("Error", "Please enter your email.")
-        return
+        return False
 
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("SELECT * FROM Maintainer WHERE email=?", (email,))
-    result = c.fetchone()
-    conn.close()
+    with database.connection() as conn:
+        result = conn.execute("SELECT 1 FROM Maintainer WHERE email=?", (email,)).fetchone()
 
     if not result:
         messagebox.showerror("Error", "Email is not registered.")
-        return
+        return False
 
     global RESET_EMAIL, RESET_OTP
     RESET_EMAIL = email
     RESET_OTP = str(random.randint(100000, 999999))
 
     try:
-        sender = "bsu.smsoffice@gmail.com"
-        app_password = "eltk hyar kjve dbhu"
-
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(sender, app_password)
-            msg = f""""Subject: Password Reset
-
-Dear User,
-
-Your OTP Code is: **{RESET_OTP}**
-
-Please keep this OTP secure and do not share it with anyone. 
-This code is confidential and will only be used to reset your password.
-
-Thank you for your cooperation.
-"""
-            server.sendmail(sender, email, msg)
-
-        win.destroy()
-        otp_screen()
-    except Exception as e:
+        # Sent by the background mail workers: the window stays responsive
+        mailer.submit(build_otp_email(email, RESET_OTP), on_result)
+    except mailer.MailError as e:
         messagebox.showerror("Email Error", str(e))
+        return False
+    return True
 
 # ============================================================
 # OTP SCREEN
 # ============================================================
-def otp_screen():
-    win = ctk.CTk()
-    win.title("Verify Code")
-    win.after(100, lambda: win.state("zoomed"))
-
-    # LEFT PANEL
-    left_frame = ctk.CTkFrame(win, width=400, fg_color=MAROON)
-    left_frame.pack(side="left", fill="y")
-
-    ctk.CTkLabel(left_frame, text="BATANGAS STATE UNIVERSITY",
-                 font=("Helvetica", 24, "bold"), text_color="white").pack(pady=(150, 10))
-    ctk.CTkLabel(left_frame, text="SCHOLARSHIP MANAGEMENT SYSTEM",
-                 font=("Helvetica", 15), text_color="white").pack(pady=(0, 50))
-
-    # RIGHT PANEL
-    right_frame = ctk.CTkFrame(win, fg_color="white")
-    right_frame.pack(side="left", fill="both", expand=True)
-
-    container = ctk.CTkFrame(right_frame, fg_color="transparent")
-    container.place(relx=0.5, rely=0.5, anchor="center")
-
-    ctk.CTkLabel(container, text="Verification Code",
-                 font=("Helvetica", 32, "bold"), text_color=MAROON).pack(pady=(0, 20))
-
-    ctk.CTkLabel(container,
-                 text=f"A 6-digit verification code was sent to:\n{RESET_EMAIL}",
-                 font=("Helvetica", 16), text_color="#555555").pack(pady=(0, 30))
-
-    frame = ctk.CTkFrame(container, fg_color="white")
-    frame.pack(pady=(0, 40))
-
-    otp_vars = []
-    for _ in range(6):
-        var = ctk.StringVar()
-        entry = ctk.CTkEntry(frame, width=60, height=65,
-                             fg_color="#f2f2f2",
-                             corner_radius=10, justify="center",
-                             font=("Helvetica", 20, "bold"),
-                             textvariable=var)
-        entry.pack(side="left", padx=8)
-        otp_vars.append(var)
-
-    def verify():
-        entered = "".join([v.get() for v in otp_vars])
+class OtpScreen(Screen):
+    title = "Verify Code"
+    cacheable = False
+
+    def __init__(self, master):
+        super().__init__(master)
+
+        # LEFT PANEL
+        left_frame = ctk.CTkFrame(self, width=400, fg_color=MAROON)
+        left_frame.pack(side="left", fill="y")
+
+        ctk.CTkLabel(left_frame, text="BATANGAS STATE UNIVERSITY",
+                     font=("Helvetica", 24, "bold"), text_color="white").pack(pady=(150, 10))
+        ctk.CTkLabel(left_frame, text="SCHOLARSHIP MANAGEMENT SYSTEM",
+                     font=("Helvetica", 15), text_color="white").pack(pady=(0, 50))
+
+        # RIGHT PANEL
+        right_frame = ctk.CTkFrame(self, fg_color="white")
+        right_frame.pack(side="left", fill="both", expand=True)
+
+        container = ctk.CTkFrame(right_frame, fg_color="transparent")
+        container.place(relx=0.5, rely=0.5, anchor="center")
+
+        ctk.CTkLabel(container, text="Verification Code",
+                     font=("Helvetica", 32, "bold"), text_color=MAROON).pack(pady=(0, 20))
+
+        ctk.CTkLabel(container,
+                     text=f"A 6-digit verification code was sent to:\n{RESET_EMAIL}",
+                     font=("Helvetica", 16), text_color="#555555").pack(pady=(0, 30))
+
+        frame = ctk.CTkFrame(container, fg_color="white")
+        frame.pack(pady=(0, 40))
+
+        self.otp_vars = []
+        for _ in range(6):
+            var = ctk.StringVar()
+            entry = ctk.CTkEntry(frame, width=60, height=65,
+                                 fg_color="#f2f2f2",
+                                 corner_radius=10, justify="center",
+                                 font=("Helvetica", 20, "bold"),
+                                 textvariable=var)
+            entry.pack(side="left", padx=8)
+            self.otp_vars.append(var)
+
+        ctk.CTkButton(container, text="Verify",
+                      fg_color=MAROON, hover_color=HOVER,
+                      corner_radius=20, width=200, height=50,
+                      font=("Helvetica", 18, "bold"),
+                      command=self.verify).pack()
+
+    def verify(self):
+        entered = "".join([v.get() for v in self.otp_vars])
         if entered == RESET_OTP:
-            win.destroy()
-            reset_password_screen()
+            app_shell.navigate("reset_new_password")
         else:
             messagebox.showerror("Error", "Incorrect verification code.")
 
-    ctk.CTkButton(container, text="Verify",
-                  fg_color=MAROON, hover_color=HOVER,
-                  corner_radius=20, width=200, height=50,
-                  font=("Helvetica", 18, "bold"),
-                  command=verify).pack()
-
-    win.mainloop()
-
 # ============================================================
 # RESET PASSWORD SCREEN
 # ============================================================
-def reset_password_screen():
-    win = ctk.CTk()
-    win.title("Reset Password")
-    win.after(100, lambda: win.state("zoomed"))
-
-    # LEFT PANEL
-    left_frame = ctk.CTkFrame(win, width=400, fg_color=MAROON)
-    left_frame.pack(side="left", fill="y")
-
-    ctk.CTkLabel(left_frame, text="BATANGAS STATE UNIVERSITY",
-                 font=("Helvetica", 24, "bold"), text_color="white").pack(pady=(150, 10))
-    ctk.CTkLabel(left_frame, text="SCHOLARSHIP MANAGEMENT SYSTEM",
-                 font=("Helvetica", 15), text_color="white").pack(pady=(0, 50))
-
-    # RIGHT PANEL
-    right_frame = ctk.CTkFrame(win, fg_color="white")
-    right_frame.pack(side="left", fill="both", expand=True)
-
-    container = ctk.CTkFrame(right_frame, fg_color="transparent")
-    container.place(relx=0.5, rely=0.5, anchor="center")
-
-    ctk.CTkLabel(container, text="Reset Password",
-                 font=("Helvetica", 32, "bold"), text_color=MAROON).pack(pady=(0, 40))
-
-    new_pw = ctk.CTkEntry(container, show="●", placeholder_text="New Password",
-                           width=400, height=55, font=("Helvetica", 16),
-                           fg_color="white", border_color=MAROON,
-                           border_width=2, corner_radius=25)
-    new_pw.pack(pady=(0, 20))
-
-    confirm_pw = ctk.CTkEntry(container, show="●", placeholder_text="Confirm Password",
-                               width=400, height=55, font=("Helvetica", 16),
-                               fg_color="white", border_color=MAROON,
-                               border_width=2, corner_radius=25)
-    confirm_pw.pack(pady=(0, 40))
-
-    def update_pw():
-        pw1 = new_pw.get()
-        pw2 = confirm_pw.get()
+class NewPasswordScreen(Screen):
+    title = "Reset Password"
+    cacheable = False
+
+    def __init__(self, master):
+        super().__init__(master)
+
+        # LEFT PANEL
+        left_frame = ctk.CTkFrame(self, width=400, fg_color=MAROON)
+        left_frame.pack(side="left", fill="y")
+
+        ctk.CTkLabel(left_frame, text="BATANGAS STATE UNIVERSITY",
+                     font=("Helvetica", 24, "bold"), text_color="white").pack(pady=(150, 10))
+        ctk.CTkLabel(left_frame, text="SCHOLARSHIP MANAGEMENT SYSTEM",
+                     font=("Helvetica", 15), text_color="white").pack(pady=(0, 50))
+
+        # RIGHT PANEL
+        right_frame = ctk.CTkFrame(self, fg_color="white")
+        right_frame.pack(side="left", fill="both", expand=True)
+
+        container = ctk.CTkFrame(right_frame, fg_color="transparent")
+        container.place(relx=0.5, rely=0.5, anchor="center")
+
+        ctk.CTkLabel(container, text="Reset Password",
+                     font=("Helvetica", 32, "bold"), text_color=MAROON).pack(pady=(0, 40))
+
+        self.new_pw = ctk.CTkEntry(container, show="●", placeholder_text="New Password",
+                                   width=400, height=55, font=("Helvetica", 16),
+                                   fg_color="white", border_color=MAROON,
+                                   border_width=2, corner_radius=25)
+        self.new_pw.pack(pady=(0, 20))
+
+        self.confirm_pw = ctk.CTkEntry(container, show="●", placeholder_text="Confirm Password",
+                                       width=400, height=55, font=("Helvetica", 16),
+                                       fg_color="white", border_color=MAROON,
+                                       border_width=2, corner_radius=25)
+        self.confirm_pw.pack(pady=(0, 40))
+
+        ctk.CTkButton(container, text="Reset Password",
+                      fg_color=MAROON, hover_color=HOVER,
+                      width=250, height=55, corner_radius=25,
+                      font=("Helvetica", 18, "bold"),
+                      command=self.update_pw).pack()
+
+    def update_pw(self):
+        pw1 = self.new_pw.get()
+        pw2 = self.confirm_pw.get()
 
         if pw1.strip() == "" or pw2.strip() == "":
             messagebox.showerror("Error", "Please fill out all fields.")
@@ -183,125 +191,125 @@ def reset_password_screen():
             messagebox.showerror("Error", "Passwords do not match!")
             return
 
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute("UPDATE Maintainer SET password=? WHERE email=?", (pw1, RESET_EMAIL))
-        conn.commit()
-        conn.close()
-
-        win.destroy()
-        success_popup()
+        with database.transaction() as conn:
+            conn.execute("UPDATE Maintainer SET password=? WHERE email=?", (pw1, RESET_EMAIL))
 
-    ctk.CTkButton(container, text="Reset Password",
-                  fg_color=MAROON, hover_color=HOVER,
-                  width=250, height=55, corner_radius=25,
-                  font=("Helvetica", 18, "bold"),
-                  command=update_pw).pack()
-
-    win.mainloop()
+        app_shell.navigate("reset_success")
 
 # ============================================================
 # SUCCESS POPUP
 # ============================================================
-def success_popup():
-    win = ctk.CTk()
-    win.title("Success")
-    win.after(100, lambda: win.state("zoomed"))
+class SuccessScreen(Screen):
+    title = "Success"
+    cacheable = False
 
-    container = ctk.CTkFrame(win, fg_color="transparent")
-    container.place(relx=0.5, rely=0.5, anchor="center")
+    def __init__(self, master):
+        super().__init__(master)
 
-    ctk.CTkLabel(container, text="Password reset successfully!",
-                 font=("Helvetica", 22, "bold"), text_color=MAROON).pack(pady=(0, 30))
+        container = ctk.CTkFrame(self, fg_color="transparent")
+        container.place(relx=0.5, rely=0.5, anchor="center")
 
-    ctk.CTkButton(container, text="Return to Login",
-                  fg_color=MAROON, hover_color=HOVER,
-                  width=180, height=50, corner_radius=25,
-                  font=("Helvetica", 18, "bold"),
-                  command=win.destroy).pack()
+        ctk.CTkLabel(container, text="Password reset successfully!",
+                     font=("Helvetica", 22, "bold"), text_color=MAROON).pack(pady=(0, 30))
 
-    win.mainloop()
+        ctk.CTkButton(container, text="Return to Login",
+                      fg_color=MAROON, hover_color=HOVER,
+                      width=180, height=50, corner_radius=25,
+                      font=("Helvetica", 18, "bold"),
+                      command=open_login).pack()
 
 # ============================================================
 # MAIN SCREEN
 # ============================================================
-def main():
-    win = ctk.CTk()
-    win.title("Forgot Password")
-    win.after(100, lambda: win.state("zoomed"))
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    logo_path = os.path.join(BASE_DIR, "logo.png")
-
-    # ----------------- LEFT PANEL -----------------
-    left_frame = ctk.CTkFrame(win, width=400, fg_color=MAROON, corner_radius=0)
-    left_frame.pack(side="left", fill="y")
-
-    left_center_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
-    left_center_frame.place(relx=0.5, rely=0.5, anchor="center")
-
-    ctk.CTkLabel(left_center_frame,
-                 text="BATANGAS STATE UNIVERSITY",
-                 font=("Helvetica", 24, "bold"),
-                 text_color="white").pack(pady=(0, 10), padx=20)
-    ctk.CTkLabel(left_center_frame,
-                 text="SCHOLARSHIP MANAGEMENT SYSTEM",
-                 font=("Helvetica", 15),
-                 text_color="white").pack()
-
-    # ----------------- RIGHT PANEL -----------------
-    right_frame = ctk.CTkFrame(win, fg_color="white")
-    right_frame.pack(side="left", fill="both", expand=True)
-
-    # LOGO ON TOP OF RIGHT PANEL
-    if os.path.exists(logo_path):
-        logo_img = ctk.CTkImage(Image.open(logo_path), size=(120, 100))
-        logo_label = ctk.CTkLabel(right_frame, image=logo_img, text="")
-        logo_label.pack(pady=30)
-    else:
-        print("Logo not found:", logo_path)
-
-    container = ctk.CTkFrame(right_frame, fg_color="transparent")
-    container.place(relx=0.5, rely=0.5, anchor="center")
-
-    ctk.CTkLabel(container, text="Forgot Password ?",
-                 font=("Helvetica", 36, "bold"), text_color=MAROON).pack(pady=(0, 20))
-
-    ctk.CTkLabel(container, text="Please enter your Email Account",
-                 font=("Helvetica", 16), text_color="#555555").pack(pady=(0, 40))
-
-    ctk.CTkLabel(container, text="E-mail",
-                 font=("Helvetica", 16, "bold"), text_color=MAROON).pack(pady=(0, 10))
-
-    email_entry = ctk.CTkEntry(container, placeholder_text="username@gmail.com",
-                                width=400, height=45, fg_color="white",
-                                border_color=MAROON, border_width=2,
-                                corner_radius=25, font=("Helvetica", 16))
-    email_entry.pack(pady=(0, 40))
-
-    # ----------------- Buttons Frame -----------------
-    button_frame = ctk.CTkFrame(container, fg_color="transparent")
-    button_frame.pack(pady=(0, 20))
-
-    # Back Button (left)
-    ctk.CTkButton(
-        button_frame, text="Back", fg_color=MAROON, hover_color=HOVER,
-        width=150, height=45, corner_radius=25,
-        font=("Helvetica", 16, "bold"),
-        command=lambda: [win.destroy(), open_login()]
-    ).pack(side="left", padx=(0, 10))
-
-    # Send Code Button (right)
-    ctk.CTkButton(
-        button_frame, text="Send Code", fg_color=MAROON, hover_color=HOVER,
-        width=150, height=45, corner_radius=25,
-        font=("Helvetica", 16, "bold"),
-        command=lambda: send_otp(email_entry.get(), win)
-    ).pack(side="left")
-
-    win.mainloop()
+class ForgotPasswordScreen(Screen):
+    title = "Forgot Password"
+    cacheable = False
+
+    def __init__(self, master):
+        super().__init__(master)
+
+        # ----------------- LEFT PANEL -----------------
+        left_frame = ctk.CTkFrame(self, width=400, fg_color=MAROON, corner_radius=0)
+        left_frame.pack(side="left", fill="y")
+
+        left_center_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+        left_center_frame.place(relx=0.5, rely=0.5, anchor="center")
+
+        ctk.CTkLabel(left_center_frame,
+                     text="BATANGAS STATE UNIVERSITY",
+                     font=("Helvetica", 24, "bold"),
+                     text_color="white").pack(pady=(0, 10), padx=20)
+        ctk.CTkLabel(left_center_frame,
+                     text="SCHOLARSHIP MANAGEMENT SYSTEM",
+                     font=("Helvetica", 15),
+                     text_color="white").pack()
+
+        # ----------------- RIGHT PANEL -----------------
+        right_frame = ctk.CTkFrame(self, fg_color="white")
+        right_frame.pack(side="left", fill="both", expand=True)
+
+        # LOGO ON TOP OF RIGHT PANEL
+        if assets.exists("logo.png"):
+            logo_img = assets.ctk_image("logo.png", (120, 100))
+            logo_label = ctk.CTkLabel(right_frame, image=logo_img, text="")
+            logo_label.pack(pady=30)
+        else:
+            print("Logo not found:", assets.path("logo.png"))
+
+        container = ctk.CTkFrame(right_frame, fg_color="transparent")
+        container.place(relx=0.5, rely=0.5, anchor="center")
+
+        ctk.CTkLabel(container, text="Forgot Password ?",
+                     font=("Helvetica", 36, "bold"), text_color=MAROON).pack(pady=(0, 20))
+
+        ctk.CTkLabel(container, text="Please enter your Email Account",
+                     font=("Helvetica", 16), text_color="#555555").pack(pady=(0, 40))
+
+        ctk.CTkLabel(container, text="E-mail",
+                     font=("Helvetica", 16, "bold"), text_color=MAROON).pack(pady=(0, 10))
+
+        self.email_entry = ctk.CTkEntry(container, placeholder_text="username@gmail.com",
+                                        width=400, height=45, fg_color="white",
+                                        border_color=MAROON, border_width=2,
+                                        corner_radius=25, font=("Helvetica", 16))
+        self.email_entry.pack(pady=(0, 40))
+
+        # ----------------- Buttons Frame -----------------
+        button_frame = ctk.CTkFrame(container, fg_color="transparent")
+        button_frame.pack(pady=(0, 20))
+
+        # Back Button (left)
+        ctk.CTkButton(
+            button_frame, text="Back", fg_color=MAROON, hover_color=HOVER,
+            width=150, height=45, corner_radius=25,
+            font=("Helvetica", 16, "bold"),
+            command=open_login
+        ).pack(side="left", padx=(0, 10))
+
+        # Send Code Button (right)
+        self.send_button = ctk.CTkButton(
+            button_frame, text="Send Code", fg_color=MAROON, hover_color=HOVER,
+            width=150, height=45, corner_radius=25,
+            font=("Helvetica", 16, "bold"),
+            command=self.send_code
+        )
+        self.send_button.pack(side="left")
+
+        self.mail_bridge = mailer.UiBridge(self)
+
+    def send_code(self):
+        if send_otp(self.email_entry.get(), self.mail_bridge.wrap(self.on_code_sent)):
+            self.send_button.configure(state="disabled", text="Sending...")
+
+    def on_code_sent(self, result):
+        if result.ok:
+            app_shell.navigate("reset_otp")
+        else:
+            messagebox.showerror("Email Error", result.error)
+            self.send_button.configure(state="normal", text="Send Code")
 
 # ============================================================
 # RUN APP
 # ============================================================
 if __name__ == "__main__":
-    main()
+    app_shell.run("reset_password")
@@ -0,0 +1,528 @@
+import sqlite3
+
+# ----------------------- SCHEMA -----------------------
+# Versioned migrations, run once per process on the first pooled
+# connection. PRAGMA user_version records the last migration applied, so an
+# up-to-date database costs one read at startup. Every migration is
+# idempotent and skips the tables the registration forms have not created
+# yet; such a migration (and any after it) is not recorded and runs again
+# on the next start, while the others still apply what they can. What a
+# migration has to do differently than planned (e.g. no FTS5 in this SQLite
+# build) is passed to its `warn` and returned by ensure_schema().
+
+# Tables the application itself owns
+
+STATEMENTS = (
+    # Content-addressed documents (see document_store.py). Requirement
+    # columns hold the SHA-256 hex digest; the bytes live on disk.
+    """
+    CREATE TABLE IF NOT EXISTS Documents (
+        hash        TEXT PRIMARY KEY,
+        size        INTEGER NOT NULL,
+        mime        TEXT,
+        uploaded_at TEXT NOT NULL DEFAULT (datetime('now'))
+    )
+    """,
+    # Dashboard counters, kept current by the triggers below so the admin
+    # dashboard reads O(courses) rows instead of scanning every applicant.
+    """
+    CREATE TABLE IF NOT EXISTS DashboardCounts (
+        source      TEXT NOT NULL,       -- 'A' applicants, 'M' maintainers
+        course      TEXT NOT NULL,       -- '' when the row has no course
+        status_code INTEGER NOT NULL,    -- Applicants.StatusCode, 0 for maintainers
+        n           INTEGER NOT NULL,
+        PRIMARY KEY (source, course, status_code)
+    ) WITHOUT ROWID
+    """,
+    # Notification emails, written in the same transaction as the decision
+    # they announce and delivered by the drainer in outbox.py
+    """
+    CREATE TABLE IF NOT EXISTS Outbox (
+        id          INTEGER PRIMARY KEY,
+        kind        TEXT NOT NULL,                     -- key of outbox.KINDS
+        recipient   TEXT NOT NULL,
+        name        TEXT,
+        student_id  TEXT,
+        state       TEXT NOT NULL DEFAULT 'pending',   -- pending, sending, sent, failed
+        attempts    INTEGER NOT NULL DEFAULT 0,
+        last_error  TEXT,
+        retry_at    TEXT,                              -- pending rows wait until then
+        claimed_at  TEXT,
+        created_at  TEXT NOT NULL DEFAULT (datetime('now')),
+        sent_at     TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_outbox_pending ON Outbox (id) WHERE state = 'pending'",
+)
+
+# Normalized applicant status (codes in dashboard_stats.py):
+# 1 accepted, 2 pending, 3 rejected, 0 anything else
+STATUS_CODE_SQL = """CASE
+        WHEN LOWER(Status) IN ('accepted', 'approve', 'approved') THEN 1
+        WHEN LOWER(Status) IN ('pending', 'waiting', 'in progress') THEN 2
+        WHEN LOWER(Status) IN ('rejected', 'declined', 'denied') THEN 3
+        ELSE 0
+    END"""
+
+# Columns added to tables created by the registration forms:
+# (table, column, definition). Skipped while the table does not exist.
+COLUMNS = (
+    ("Applicants", "StatusCode", f"INTEGER GENERATED ALWAYS AS ({STATUS_CODE_SQL}) VIRTUAL"),
+)
+
+# (index name, table, columns)
+INDEXES = (
+    ("idx_applicants_course_status", "Applicants", "Course, StatusCode"),
+    ("idx_maintainer_course", "Maintainer", "course"),
+)
+
+# Keys the screens look rows up by: (index name, table, columns, unique).
+# Only the keys the app itself keeps unique are UNIQUE: accept_applicants
+# skips returning scholars, and a maintainer has one requirements row. The
+# forms do not check the others, so those indexes only speed up the reads.
+# A unique index falls back to a plain one while the table holds duplicates.
+LOOKUP_INDEXES = (
+    ("idx_admin_username", "Admin", "username", False),
+    ("idx_applicants_student_id", "Applicants", "StudentID", False),
+    ("idx_applicant_requirements_applicant", "Applicant_Requirements", "applicants_id", False),
+    ("idx_maintainer_student_id", "Maintainer", "student_id", True),
+    ("idx_maintainer_username", "Maintainer", "username", False),
+    ("idx_maintainer_email", "Maintainer", "email", False),
+    ("idx_maintainer_requirements_maintainer", "Maintainer_Requirements", "maintainer_id", True),
+)
+
+# Full-text indexes behind the dashboards' search boxes (see search.py):
+# (FTS5 table, content table, its INTEGER PRIMARY KEY, indexed columns).
+# They are external-content tables: the text stays in the content table and
+# the triggers from search_triggers() keep the index in step with it. The
+# key must be a declared INTEGER PRIMARY KEY: a plain rowid may be
+# renumbered by VACUUM, which would silently point the index at other rows.
+# None: whatever INTEGER PRIMARY KEY the table has (see integer_key).
+SEARCH_TABLES = (
+    ("ApplicantSearch", "Applicants", "Applicant_id",
+     ("StudentID", "Name", "Username", "Email", "Course", "School")),
+    ("MaintainerSearch", "Maintainer", None,
+     ("student_id", "name", "username", "email", "course", "school")),
+)
+
+# Maintainer is created by the registration forms, usually without a key of
+# its own; migration 7 then adds this one (not to be confused with the
+# maintainer_id of Maintainer_Requirements, which holds the student_id)
+MAINTAINER_KEY = "maintainer_key"
+
+# Sorting and filtering the admin lists (virtual_table.PagedQuery):
+# (index name, table, equality filter column or expression or None, sort
+# column or None). The sort column is indexed as sort_expression(), exactly
+# what the query orders by; the key follows as the rowid, so ORDER BY walks
+# the index and keyset paging seeks it.
+SORT_INDEXES = (
+    ("idx_applicants_sort_student_id", "Applicants", None, "StudentID"),
+    ("idx_applicants_sort_name", "Applicants", None, "Name"),
+    ("idx_applicants_sort_username", "Applicants", None, "Username"),
+    ("idx_applicants_sort_email", "Applicants", None, "Email"),
+    ("idx_applicants_sort_status", "Applicants", None, "Status"),
+    ("idx_applicants_status", "Applicants", "StatusCode", None),
+    ("idx_applicants_status_name", "Applicants", "StatusCode", "Name"),
+    ("idx_applicants_course_name", "Applicants", "Course", "Name"),
+    ("idx_maintainer_sort_student_id", "Maintainer", None, "student_id"),
+    ("idx_maintainer_sort_name", "Maintainer", None, "name"),
+    ("idx_maintainer_sort_username", "Maintainer", None, "username"),
+    ("idx_maintainer_sort_email", "Maintainer", None, "email"),
+    ("idx_maintainer_sort_status", "Maintainer", None, "status"),
+    ("idx_maintainer_course_name", "Maintainer", "course", "name"),
+    ("idx_maintainer_status_name", "Maintainer", "COALESCE(status, '') COLLATE NOCASE", "name"),
+)
+
+# Lists filtered on a column's sort_expression() (Maintainers.STATUS_FILTERS),
+# so its sort index also seeks the filter: (table, column, that index)
+SORT_FILTERS = (
+    ("Maintainer", "status", "idx_maintainer_sort_status"),
+)
+
+
+def sort_expression(column):
+    """What the lists sort by: text without case, NULL first as ''."""
+    return f"COALESCE({column}, '') COLLATE NOCASE"
+
+
+# One query per lookup the code does; check_lookups() asserts each is an index seek
+LOOKUPS = (
+    "SELECT * FROM Admin WHERE username=? AND password=?",
+    "SELECT Applicant_id FROM Applicants WHERE StudentID = ?",
+    "SELECT COR, TOR, Good_Moral FROM Applicant_Requirements WHERE applicants_id = ?",
+    "SELECT password FROM Maintainer WHERE student_id=?",
+    "SELECT student_id, name FROM Maintainer WHERE username=?",
+    "SELECT 1 FROM Maintainer WHERE email=?",
+    "SELECT 1 FROM Maintainer_Requirements WHERE maintainer_id = ?",
+)
+
+
+# Tables counted into DashboardCounts: (table, source, course column, status expression)
+COUNTED_TABLES = (
+    ("Applicants", "A", "Course", "StatusCode"),
+    ("Maintainer", "M", "course", "0"),
+)
+
+
+def _count(source, row, course, status, delta):
+    key = f"'{source}', COALESCE({row}.{course}, ''), {status}"
+    return f"""
+            INSERT INTO DashboardCounts (source, course, status_code, n) VALUES ({key}, {delta})
+                ON CONFLICT (source, course, status_code) DO UPDATE SET n = n + excluded.n;
+            DELETE FROM DashboardCounts
+                WHERE (source, course, status_code) = ({key}) AND n = 0;"""
+
+
+def counter_triggers(table, source, course, status):
+    """(name, sql) for the INSERT/UPDATE/DELETE triggers that maintain DashboardCounts."""
+    new_status = status if status == "0" else f"NEW.{status}"
+    old_status = status if status == "0" else f"OLD.{status}"
+    watched = course if status == "0" else f"{course}, Status"
+    prefix = f"trg_{table.lower()}_counts"
+    return (
+        (f"{prefix}_insert", f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_insert AFTER INSERT ON {table}
+        BEGIN{_count(source, "NEW", course, new_status, 1)}
+        END"""),
+        (f"{prefix}_update", f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_update AFTER UPDATE OF {watched} ON {table}
+        BEGIN{_count(source, "OLD", course, old_status, -1)}{_count(source, "NEW", course, new_status, 1)}
+        END"""),
+        (f"{prefix}_delete", f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_delete AFTER DELETE ON {table}
+        BEGIN{_count(source, "OLD", course, old_status, -1)}
+        END"""),
+    )
+
+
+def search_triggers(fts, table, key, columns):
+    """(name, sql) for the triggers that mirror `table` into its FTS5 index."""
+    names = ", ".join(columns)
+    new = ", ".join(f"NEW.{c}" for c in columns)
+    old = ", ".join(f"OLD.{c}" for c in columns)
+    delete = f"INSERT INTO {fts} ({fts}, rowid, {names}) VALUES ('delete', OLD.{key}, {old});"
+    insert = f"INSERT INTO {fts} (rowid, {names}) VALUES (NEW.{key}, {new});"
+    prefix = f"trg_{table.lower()}_search"
+    return (
+        (f"{prefix}_insert", f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_insert AFTER INSERT ON {table}
+        BEGIN {insert} END"""),
+        (f"{prefix}_update", f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_update AFTER UPDATE OF {names} ON {table}
+        BEGIN {delete} {insert} END"""),
+        (f"{prefix}_delete", f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_delete AFTER DELETE ON {table}
+        BEGIN {delete} END"""),
+    )
+
+
+def counters_ready(conn):
+    """True when every counted table has its triggers (so DashboardCounts is exact)."""
+    names = [name for spec in COUNTED_TABLES for name, _ in counter_triggers(*spec)]
+    found = conn.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' "
+                         f"AND name IN ({', '.join('?' * len(names))})", names).fetchone()[0]
+    return found == len(names)
+
+
+def _install_counters(conn, table, source, course, status):
+    triggers = counter_triggers(table, source, course, status)
+    installed = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                             (triggers[0][0],)).fetchone()
+    if installed:
+        return
+    # First install: seed the counters from the current rows, then keep them live
+    conn.execute("DELETE FROM DashboardCounts WHERE source = ?", (source,))
+    conn.execute(f"""
+        INSERT INTO DashboardCounts (source, course, status_code, n)
+        SELECT ?, COALESCE({course}, ''), {status}, COUNT(*) FROM {table}
+        GROUP BY 2, 3
+    """, (source,))
+    for _, sql in triggers:
+        conn.execute(sql)
+
+
+def table_columns(conn, table):
+    """Column names of `table` (including generated ones); empty if it does not exist."""
+    return {row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+
+
+def primary_key(conn, table):
+    """[(column, declared type)] of `table`'s declared PRIMARY KEY, in key order."""
+    rows = sorted((row[5], row[1], row[2]) for row in conn.execute(f"PRAGMA table_info({table})") if row[5])
+    return [(name, declared) for _, name, declared in rows]
+
+
+def integer_key(conn, table):
+    """Name of `table`'s INTEGER PRIMARY KEY (the alias of its rowid), or None."""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    if not row or "WITHOUT ROWID" in row[0].upper():
+        return None
+    key = primary_key(conn, table)
+    if len(key) == 1 and key[0][1].upper() == "INTEGER":
+        return key[0][0]
+    return None
+
+
+def _drop_search_index(conn, table):
+    for spec in SEARCH_TABLES:
+        if spec[1] == table:
+            for name, _ in search_triggers(*spec):
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(f"DROP TABLE IF EXISTS {spec[0]}")
+
+
+# ----------------------- MIGRATIONS -----------------------
+# Each is migrate(conn, warn) and returns False when a table it needs does
+# not exist yet.
+
+def _baseline(conn, warn):
+    """Application tables, StatusCode, dashboard indexes and counters."""
+    for statement in STATEMENTS:
+        conn.execute(statement)
+
+    complete = True
+    for table, column, definition in COLUMNS:
+        existing = table_columns(conn, table)
+        if not existing:
+            complete = False
+        elif column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    for name, table, columns in INDEXES:
+        if table_columns(conn, table):
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+        else:
+            complete = False
+
+    for spec in COUNTED_TABLES:
+        if table_columns(conn, spec[0]):
+            _install_counters(conn, *spec)
+        else:
+            complete = False
+    return complete
+
+
+def _lookup_indexes(conn, warn):
+    """Indexes that turn the screens' point lookups into seeks."""
+    complete = True
+    for name, table, columns, unique in LOOKUP_INDEXES:
+        if not table_columns(conn, table):
+            complete = False
+            continue
+        if unique:
+            try:
+                conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+                continue
+            except sqlite3.IntegrityError:
+                warn(f"{table}.{columns} holds duplicate values; {name} was created without UNIQUE "
+                     f"until they are removed.")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+    return complete
+
+
+def _is_unique(conn, table, name):
+    return conn.execute('SELECT 1 FROM pragma_index_list(?) WHERE name = ? AND "unique"',
+                        (table, name)).fetchone() is not None
+
+
+def _search_indexes(conn, warn):
+    """FTS5 indexes for the search boxes, built from the existing rows."""
+    complete = True
+    for fts, table, key, columns in SEARCH_TABLES:
+        existing = table_columns(conn, table)
+        if not existing:
+            complete = False
+            continue
+        key = key or integer_key(conn, table)
+        if key is None:
+            continue   # Maintainer before migration 7, which indexes it once it has a key
+        if not table_columns(conn, fts):
+            try:
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE {fts} USING fts5(
+                        {", ".join(columns)},
+                        content='{table}', content_rowid='{key}',
+                        tokenize='unicode61 remove_diacritics 2', prefix='2 3')
+                """)
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5: search.py falls back to LIKE
+                warn(f"Full-text search is unavailable ({e}); the search boxes scan the tables instead.")
+                return True
+            conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+        for _, sql in search_triggers(fts, table, key, columns):
+            conn.execute(sql)
+    return complete
+
+
+def _sort_indexes(conn, warn):
+    """Indexes behind the sortable, filterable admin lists."""
+    complete = True
+    for name, table, column, order in SORT_INDEXES:
+        if not table_columns(conn, table):
+            complete = False
+            continue
+        columns = [c for c in (column, order and sort_expression(order)) if c]
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    # Statistics let the planner walk a sort index past a broad filter
+    # (a course) instead of sorting every matching row
+    for table in {table for _, table, _, _ in SORT_INDEXES}:
+        if table_columns(conn, table):
+            conn.execute(f"ANALYZE {table}")
+    return complete
+
+
+def _plain_lookup_indexes(conn, warn):
+    """Version 2 made lookup indexes UNIQUE on keys the forms never check
+    (Admin.username, Applicants.StudentID, Maintainer.username): recreate
+    those plain, so a registration the app allows is not refused."""
+    for name, table, _, unique in LOOKUP_INDEXES:
+        if not unique and _is_unique(conn, table, name):
+            conn.execute(f"DROP INDEX {name}")
+    return _lookup_indexes(conn, warn)
+
+
+def _unique_lookup_indexes(conn, warn):
+    """Migration 5 briefly made every lookup index plain: make the ones on
+    the keys the app keeps unique UNIQUE again (see LOOKUP_INDEXES)."""
+    for name, table, _, unique in LOOKUP_INDEXES:
+        if unique and table_columns(conn, table) and not _is_unique(conn, table, name):
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+    return _lookup_indexes(conn, warn)
+
+
+def _maintainer_key(conn, warn):
+    """Give Maintainer an INTEGER PRIMARY KEY, so MaintainerSearch and the
+    list's paging key on ids VACUUM cannot renumber.
+
+    A table that already has one keeps it. One with no primary key is
+    rebuilt with MAINTAINER_KEY in front: each row keeps its current rowid
+    as its key, the indexes and triggers are recreated as they were, and the
+    search index is built afresh. Any other primary key cannot be joined by
+    a second one, so that table gets no search index (search.py scans it).
+    """
+    if not table_columns(conn, "Maintainer"):
+        return False
+    declared = primary_key(conn, "Maintainer")
+    if declared and integer_key(conn, "Maintainer") is None:
+        _drop_search_index(conn, "Maintainer")
+        warn(f"Maintainer's primary key ({', '.join(name for name, _ in declared)}) is not an "
+             f"INTEGER PRIMARY KEY; the maintainer search box scans the table instead.")
+        return True
+    if not declared:
+        table_sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'Maintainer'"
+                                 ).fetchone()[0]
+        search = {name for spec in SEARCH_TABLES if spec[1] == "Maintainer" for name, _ in search_triggers(*spec)}
+        dependents = [sql for name, sql in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE tbl_name = 'Maintainer' "
+            "AND type IN ('index', 'trigger') AND sql IS NOT NULL") if name not in search]
+        columns = ", ".join(row[1] for row in conn.execute("PRAGMA table_info(Maintainer)"))
+
+        # Same definition with the key as its first column
+        definition = table_sql[table_sql.index("(") + 1:]
+        conn.execute(f"CREATE TABLE Maintainer_rebuild ({MAINTAINER_KEY} INTEGER PRIMARY KEY, {definition}")
+        conn.execute(f"INSERT INTO Maintainer_rebuild ({MAINTAINER_KEY}, {columns}) "
+                     f"SELECT rowid, {columns} FROM Maintainer")
+        conn.execute("DROP TABLE Maintainer")
+        conn.execute("ALTER TABLE Maintainer_rebuild RENAME TO Maintainer")
+        for sql in dependents:
+            conn.execute(sql)
+        conn.execute("DROP TABLE IF EXISTS MaintainerSearch")
+        conn.execute("ANALYZE Maintainer")
+    return _search_indexes(conn, warn)
+
+
+# (version, migration); append new ones, never renumber
+MIGRATIONS = (
+    (1, _baseline),
+    (2, _lookup_indexes),
+    (3, _search_indexes),
+    (4, _sort_indexes),
+    (5, _plain_lookup_indexes),
+    (6, _sort_indexes),   # idx_maintainer_status_name
+    (7, _maintainer_key),
+    (8, _unique_lookup_indexes),
+)
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def ensure_schema(conn):
+    """Apply the migrations newer than the database's recorded version.
+
+    Returns the migrations' warnings, each once, for the caller to show.
+    """
+    warnings = []
+
+    def warn(message):
+        # Migrations that rebuild the same index may hit the same problem
+        if message not in warnings:
+            warnings.append(message)
+
+    if schema_version(conn) >= SCHEMA_VERSION:
+        return warnings
+    with conn:
+        # One writer at a time, so two processes starting together cannot
+        # both seed the counters; re-read the version once we hold the lock
+        conn.execute("BEGIN IMMEDIATE")
+        version = schema_version(conn)
+        recorded = version
+        for number, migrate in MIGRATIONS:
+            if number <= version:
+                continue
+            if migrate(conn, warn) and recorded == number - 1:
+                recorded = number
+        if recorded != version:
+            conn.execute(f"PRAGMA user_version = {recorded}")
+    return warnings
+
+
+def check_lookups(conn):
+    """Assert that every query in LOOKUPS searches an index instead of scanning."""
+    for sql in LOOKUPS:
+        plan = _query_plan(conn, sql)
+        assert plan and all(step.startswith("SEARCH") for step in plan), f"{sql}: {plan}"
+
+
+def _query_plan(conn, sql):
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", (None,) * sql.count("?"))]
+
+
+def check_sorts(conn):
+    """Assert that every list order in SORT_INDEXES is read from an index, not
+    sorted, and that every filter in SORT_FILTERS can seek its index.
+
+    The filters are checked with INDEXED BY: on a table whose statistics show
+    few distinct values the planner may rightly prefer a scan, but the
+    filter's expression must still match the index.
+    """
+    for name, table, column, order in SORT_INDEXES:
+        where = f" WHERE {column} = ?" if column else ""
+        terms = [sort_expression(order), "rowid"] if order else ["rowid"]
+        for direction in ("", " DESC"):
+            order_by = ", ".join(term + direction for term in terms)
+            sql = f"SELECT rowid FROM {table}{where} ORDER BY {order_by} LIMIT 100"
+            plan = _query_plan(conn, sql)
+            assert not any("TEMP B-TREE" in step for step in plan), f"{sql}: {plan}"
+    for table, column, index in SORT_FILTERS:
+        for direction in ("", " DESC"):
+            sql = (f"SELECT rowid FROM {table} INDEXED BY {index} "
+                   f"WHERE {sort_expression(f'{table}.{column}')} = ? ORDER BY rowid{direction} LIMIT 100")
+            plan = _query_plan(conn, sql)
+            assert plan and plan[0].startswith("SEARCH"), f"{sql}: {plan}"
+            assert not any("TEMP B-TREE" in step for step in plan), f"{sql}: {plan}"
+
+
+if __name__ == "__main__":
+    # python schema.py -> migrate Scholarship.db (or SCHOLARSHIP_DB) and check the plans
+    import database
+    with database.connection() as conn:
+        for warning in database.schema_warnings():
+            print(f"⚠ {warning}")
+        print(f"schema version {schema_version(conn)} of {SCHEMA_VERSION}")
+        check_lookups(conn)
+        print(f"✓ {len(LOOKUPS)} lookups use an index")
+        check_sorts(conn)
+        print(f"✓ {len(SORT_INDEXES)} list orders read from an index")
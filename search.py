@@ -0,0 +1,134 @@
+import re
+import weakref
+import database
+import schema
+from virtual_table import PagedQuery
+
+# ============================================================
+#              FULL-TEXT SEARCH OVER THE DASHBOARDS
+# ============================================================
+# The FTS5 indexes are created by schema.py (SEARCH_TABLES) and kept in
+# step by triggers. Every word typed must match the start of a word in one
+# of the indexed columns ("jua dela" finds "Juan Dela Cruz"; "2024" finds
+# the student IDs). virtual_table.SearchBox runs these queries off the Tk
+# thread.
+
+_WORD_RE = re.compile(r"[^\W_]+")   # what the unicode61 tokenizer keeps
+
+# content table -> (FTS5 table, key column or None, indexed columns)
+_INDEXES = {table: (fts, key, columns) for fts, table, key, columns in schema.SEARCH_TABLES}
+# pool -> {content table -> its key column, or None without an FTS5 index};
+# per pool, so database.configure() pointing at another file starts afresh
+_available = weakref.WeakKeyDictionary()
+
+
+def match_expression(text):
+    """FTS5 query for what the admin typed: every word as a quoted prefix."""
+    return " ".join(f'"{word}"*' for word in _WORD_RE.findall(text))
+
+
+def _index_key(table):
+    """The key `table`'s FTS5 index is keyed on, or None when it has no index."""
+    pool = database.get_pool()
+    available = _available.setdefault(pool, {})
+    if table not in available:
+        fts, key, _ = _INDEXES[table]
+        with pool.connection() as conn:
+            key = key or schema.integer_key(conn, table)
+            available[table] = key if key and schema.table_columns(conn, fts) else None
+    return available[table]
+
+
+class SearchResults(PagedQuery):
+    """The rows of an unsorted `base` matching an FTS5 query, in the index's order.
+
+    The index yields matches by rowid (= the table's key), so a page stops
+    after page_size matches instead of collecting every match first, and
+    without other filters the count never touches the table itself.
+    """
+
+    def __init__(self, base, fts, key, expression):
+        where = f"{fts} MATCH ?" + (f" AND ({base.where})" if base.where else "")
+        super().__init__(base.table, [f"{base.table}.{c}" for c in base.columns], f"{fts}.rowid",
+                         base.page_size, base.max_pages, base.record, where,
+                         (expression,) + base.params, descending=base.descending)
+        self.fts = fts
+        self.content_key = key
+        self.index_only = not base.where
+
+    def _from(self):
+        return f"{self.fts} JOIN {self.table} ON {self.table}.{self.content_key} = {self.fts}.rowid"
+
+    def count(self):
+        if self._count is None and self.index_only:
+            with database.connection() as conn:
+                self._count = conn.execute(f"SELECT COUNT(*) FROM {self.fts} WHERE {self.where}",
+                                           self.params).fetchone()[0]
+        return super().count()
+
+
+def like_condition(columns, words):
+    """(where, params) with the same prefix semantics as the FTS5 query, for
+    SQLite builds without FTS5 (one scan per query)."""
+    per_word = "(" + " OR ".join(f"{c} LIKE ? OR {c} LIKE ?" for c in columns) + ")"
+    params = []
+    for word in words:
+        params += [f"{word}%", f"% {word}%"] * len(columns)
+    return " AND ".join([per_word] * len(words)), tuple(params)
+
+
+def filtered(query, text):
+    """`query` (a PagedQuery, maybe filtered and sorted) restricted to the rows matching `text`."""
+    fts, _, columns = _INDEXES[query.table]
+    words = _WORD_RE.findall(text)
+    if not words:
+        return query.filtered(None)
+    key = _index_key(query.table)
+    if key is None:
+        return query.filtered(*like_condition([f"{query.table}.{c}" for c in columns], words))
+    if query.order is None:
+        return SearchResults(query, fts, key, match_expression(text))
+    # Sorted by a column: SQLite collects the matching keys once and pages
+    # through the sort index, checking each row against them
+    return query.filtered(f"{query.table}.{key} IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)",
+                          (match_expression(text),))
+
+
+if __name__ == "__main__":
+    # python search.py [N] -> time to first page of results on N applicants
+    import os
+    import sys
+    import tempfile
+    import time
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    database.configure(os.path.join(tempfile.mkdtemp(), "search.db"))
+    with database.transaction() as conn:
+        conn.execute("""CREATE TABLE Applicants (Applicant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        StudentID TEXT, Name TEXT, Username TEXT, Password TEXT, Email TEXT,
+                        School TEXT, Course TEXT, Year_Level TEXT, Phone_Number TEXT,
+                        GWA REAL, Status TEXT)""")
+        conn.execute("""CREATE TABLE Maintainer (student_id TEXT, name TEXT, username TEXT, password TEXT,
+                        email TEXT, school TEXT, course TEXT, yearlevel TEXT, phone_number TEXT,
+                        gwa REAL, status TEXT)""")
+        first = ("Juan", "Maria", "Jose", "Ana", "Mark", "Angel", "Paolo", "Kristine")
+        last = ("Dela Cruz", "Santos", "Reyes", "Garcia", "Mendoza", "Bautista", "Villanueva")
+        conn.executemany("""INSERT INTO Applicants (StudentID, Name, Username, Email, School, Course, Status)
+                            VALUES (?, ?, ?, ?, ?, ?, 'Pending')""",
+                         [(f"{21 + i % 4}-{i:05d}", f"{first[i % 8]} {last[i % 7]} {i}", f"user{i}",
+                           f"user{i}@g.batstate-u.edu.ph", "BatStateU", ("BSIT", "BSCS", "BSEd")[i % 3])
+                          for i in range(count)])
+    database.configure()   # new pool: migrations (and the FTS5 build) run on open
+    start = time.perf_counter()
+    with database.connection():
+        pass
+    print(f"{count} applicants, index built in {time.perf_counter() - start:.1f} s")
+    base = PagedQuery("Applicants", ["StudentID", "Name", "Username", "Email", "Status"], key="Applicant_id")
+
+    for text in ("juan", "ma", "santos 12", "user4567", "23-0", "bsit garcia", "user", "nobody"):
+        start = time.perf_counter()
+        results = filtered(base, text)
+        total = results.count()
+        results.page(0)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{text!r:14} {total:7} matches  {elapsed:6.1f} ms")
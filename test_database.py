@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+import database
+
+
+class TransactionTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+        self.addCleanup(database.configure, database.DB_FILE)
+        database.configure(os.path.join(self.dir, "Scholarship.db"))
+        with database.transaction() as conn:
+            conn.execute("CREATE TABLE Notes (text TEXT)")
+
+    def notes(self):
+        with database.connection() as conn:
+            return [row[0] for row in conn.execute("SELECT text FROM Notes ORDER BY rowid")]
+
+    def test_inner_block_before_any_outer_write_joins_the_outer_one(self):
+        with self.assertRaises(RuntimeError):
+            with database.transaction():
+                # No DML yet in the outer block: in_transaction is still False here
+                with database.transaction() as conn:
+                    conn.execute("INSERT INTO Notes VALUES ('inner')")
+                raise RuntimeError("outer block fails after the inner one")
+        self.assertEqual(self.notes(), [])
+
+    def test_nested_blocks_commit_once_with_the_outer_one(self):
+        with database.transaction() as outer:
+            with database.transaction() as inner:
+                inner.execute("INSERT INTO Notes VALUES ('inner')")
+            outer.execute("INSERT INTO Notes VALUES ('outer')")
+        self.assertEqual(self.notes(), ["inner", "outer"])
+
+    def test_transaction_after_a_failed_one_commits_again(self):
+        with self.assertRaises(RuntimeError):
+            with database.transaction():
+                raise RuntimeError
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO Notes VALUES ('later')")
+        self.assertEqual(self.notes(), ["later"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+import database
+from document_store import DocumentStore, DocumentError, document_refs
+
+
+class DocumentStoreTestCase(unittest.TestCase):
+    """A fresh database and document store in a temporary folder."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+        self.addCleanup(database.configure, database.DB_FILE)
+        database.configure(os.path.join(self.dir, "Scholarship.db"))
+        with database.transaction() as conn:
+            conn.execute("""CREATE TABLE Applicant_Requirements (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            applicants_id INTEGER, COR BLOB, TOR BLOB, Good_Moral BLOB)""")
+            conn.execute("""CREATE TABLE Maintainer_Requirements (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            maintainer_id TEXT, COR BLOB, TOR BLOB, GOOD_MORAL BLOB)""")
+        self.store = DocumentStore(os.path.join(self.dir, "documents"))
+
+    def put(self, name, data, allowed=("application/pdf",)):
+        path = os.path.join(self.dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return self.store.put_file(path, allowed=allowed)
+
+
+class ValidationTest(DocumentStoreTestCase):
+    def test_type_is_checked_by_content_not_name(self):
+        with self.assertRaises(DocumentError):
+            self.put("x.pdf", b"MZ\x90\x00 not a PDF at all")
+        with database.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM Documents").fetchone()[0], 0)
+        self.assertEqual(os.listdir(self.store.root), [])
+
+    def test_pdf_content_is_accepted_under_any_name(self):
+        digest = self.put("scan.bin", b"%PDF-1.7 certificate")
+        self.assertTrue(self.store.locate(digest).endswith(".pdf"))
+
+    def test_unchecked_upload_falls_back_to_the_name(self):
+        digest = self.put("notes.txt", b"plain text", allowed=None)
+        with database.connection() as conn:
+            mime = conn.execute("SELECT mime FROM Documents WHERE hash = ?", (digest,)).fetchone()[0]
+        self.assertEqual(mime, "text/plain")
+
+
+class SweepTest(DocumentStoreTestCase):
+    def age_uploads(self):
+        with database.transaction() as conn:
+            conn.execute("UPDATE Documents SET uploaded_at = datetime('now', '-1 day')")
+
+    def decline(self, applicant_id):
+        # What New_Applicants.decline_applicants does with the requirements
+        with database.transaction() as conn:
+            released = document_refs(conn, "Applicant_Requirements", "applicants_id = ?", (applicant_id,))
+            conn.execute("DELETE FROM Applicant_Requirements WHERE applicants_id = ?", (applicant_id,))
+        return self.store.sweep(released)
+
+    def test_declined_document_is_removed_and_shared_one_kept(self):
+        own = self.put("cor.pdf", b"%PDF-1.4 declined applicant's COR")
+        shared = self.put("moral.pdf", b"%PDF-1.4 certificate both uploaded")
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO Applicant_Requirements (applicants_id, COR, Good_Moral) VALUES (1, ?, ?)",
+                         (own, shared))
+            conn.execute("INSERT INTO Applicant_Requirements (applicants_id, Good_Moral) VALUES (2, ?)", (shared,))
+        self.age_uploads()
+
+        self.assertEqual(self.decline(1), 1)
+        self.assertIsNone(self.store.locate(own))
+        self.assertFalse(os.path.exists(self.store.path_for(own)))
+        self.assertIsNotNone(self.store.locate(shared))
+
+    def test_new_upload_is_kept_until_referenced(self):
+        digest = self.put("cor.pdf", b"%PDF-1.4 uploaded, row not written yet")
+        self.assertEqual(self.store.sweep(), 0)
+        self.age_uploads()
+        self.assertEqual(self.store.sweep(), 1)
+        self.assertIsNone(self.store.locate(digest))
+
+    def test_full_sweep_keeps_referenced_documents(self):
+        kept = self.put("tor.pdf", b"%PDF-1.4 maintainer's TOR")
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO Maintainer_Requirements (maintainer_id, TOR) VALUES ('21-00001', ?)", (kept,))
+            conn.execute("INSERT INTO Applicant_Requirements (applicants_id) VALUES (3)")
+        self.age_uploads()
+        self.assertEqual(self.store.sweep(), 0)
+        self.assertIsNotNone(self.store.locate(kept))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import smtplib
+import threading
+import unittest
+from email.message import EmailMessage
+import mailer
+
+
+def message():
+    msg = EmailMessage()
+    msg["Subject"] = "Scholarship status"
+    msg["From"] = mailer.sender_address()
+    msg["To"] = "student@example.com"
+    msg.set_content("Scholarship status update.")
+    return msg
+
+
+class SinkTestCase(unittest.TestCase):
+    """Delivers through a Mailer to a local sink that gives canned replies."""
+
+    def deliver(self, replies, password=""):
+        server = mailer.SinkServer(replies=replies)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        config = dict(mailer.EMAIL_CONFIG, smtp_server="127.0.0.1", smtp_port=server.server_address[1],
+                      sender_password=password, starttls=False)
+        mail = mailer.Mailer(1, config=config)
+        results = []
+        mail.submit(message(), results.append)
+        mail.join()
+        return server, results[0]
+
+
+class PermanentErrorTest(SinkTestCase):
+    def test_refused_recipient_fails_at_once(self):
+        server, result = self.deliver({"RCPT": "550 no such user"})
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, 1)
+        self.assertFalse(result.transient)
+        self.assertEqual(server.commands["RCPT"], 1)
+
+    def test_rejected_login_fails_at_once(self):
+        server, result = self.deliver({"AUTH": "535 bad credentials"}, password="wrong")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, 1)
+        self.assertFalse(result.transient)
+        self.assertEqual(server.commands["AUTH"], 1)
+
+
+class TransientErrorTest(SinkTestCase):
+    def setUp(self):
+        backoff, mailer.BACKOFF = mailer.BACKOFF, 0
+        self.addCleanup(setattr, mailer, "BACKOFF", backoff)
+
+    def test_try_again_later_is_retried(self):
+        server, result = self.deliver({"RCPT": "451 try again later"})
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, mailer.MAX_ATTEMPTS)
+        self.assertTrue(result.transient)
+        self.assertEqual(server.commands["RCPT"], mailer.MAX_ATTEMPTS)
+
+
+class IsTransientTest(unittest.TestCase):
+    def test_reply_codes(self):
+        self.assertFalse(mailer.is_transient(smtplib.SMTPRecipientsRefused({"a@x": (550, b"no")})))
+        self.assertTrue(mailer.is_transient(smtplib.SMTPRecipientsRefused({"a@x": (452, b"full")})))
+        self.assertFalse(mailer.is_transient(smtplib.SMTPAuthenticationError(535, b"bad")))
+        self.assertFalse(mailer.is_transient(smtplib.SMTPSenderRefused(553, b"no", "me@x")))
+        self.assertTrue(mailer.is_transient(smtplib.SMTPDataError(421, b"busy")))
+
+    def test_connection_errors(self):
+        self.assertTrue(mailer.is_transient(smtplib.SMTPServerDisconnected("gone")))
+        self.assertTrue(mailer.is_transient(smtplib.SMTPConnectError(554, b"no service")))
+        self.assertTrue(mailer.is_transient(ConnectionRefusedError()))
+        self.assertTrue(mailer.is_transient(TimeoutError()))
+        self.assertFalse(mailer.is_transient(smtplib.SMTPNotSupportedError()))
+        self.assertFalse(mailer.is_transient(ValueError()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import database
+import decisions
+import schema
+
+# The tables the registration forms create, as they create them
+REGISTRATION_TABLES = """
+CREATE TABLE Admin (username TEXT, password TEXT);
+CREATE TABLE Applicants (Applicant_id INTEGER PRIMARY KEY AUTOINCREMENT, StudentID TEXT, Name TEXT,
+    Username TEXT, Password TEXT, Email TEXT, School TEXT, Course TEXT, Year_Level TEXT,
+    Phone_Number TEXT, GWA REAL, Status TEXT);
+CREATE TABLE Applicant_Requirements (id INTEGER PRIMARY KEY AUTOINCREMENT, applicants_id INTEGER,
+    COR BLOB, TOR BLOB, Good_Moral BLOB);
+CREATE TABLE Maintainer_Requirements (id INTEGER PRIMARY KEY AUTOINCREMENT, maintainer_id TEXT,
+    COR BLOB, TOR BLOB, GOOD_MORAL BLOB);
+"""
+
+# Maintainer as registration creates it: no primary key of its own
+MAINTAINER_TABLE = """
+CREATE TABLE Maintainer (student_id TEXT, name TEXT, username TEXT, password TEXT, email TEXT,
+    school TEXT, course TEXT, yearlevel TEXT, phone_number TEXT, gwa REAL, status TEXT)
+"""
+
+COURSES = ("BSIT", "BSCS", "BSEd")
+APPLICANT_STATUSES = ("Pending", "Accepted", "rejected", "waiting", "approved")
+MAINTAINER_STATUSES = ("claimed", "Unclaimed", None, "on hold")
+
+
+class SchemaTestCase(unittest.TestCase):
+    """A temporary database with the registration tables and some rows."""
+
+    rows = 2000
+    maintainer_table = MAINTAINER_TABLE
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+        path = os.path.join(self.dir, "Scholarship.db")
+        with sqlite3.connect(path) as conn:
+            conn.executescript(REGISTRATION_TABLES)
+            conn.execute(self.maintainer_table)
+            conn.executemany("""INSERT INTO Applicants (StudentID, Name, Username, Email, Course, Status)
+                                VALUES (?, ?, ?, ?, ?, ?)""",
+                             [(f"24-{i:05d}", f"Applicant {i}", f"app{i}", f"app{i}@g.batstate-u.edu.ph",
+                               COURSES[i % 3], APPLICANT_STATUSES[i % 5]) for i in range(self.rows)])
+            conn.executemany("""INSERT INTO Maintainer (student_id, name, username, email, course, status)
+                                VALUES (?, ?, ?, ?, ?, ?)""",
+                             [(f"21-{i:05d}", f"Scholar {i}", f"sch{i}", f"sch{i}@g.batstate-u.edu.ph",
+                               COURSES[i % 3], MAINTAINER_STATUSES[i % 4]) for i in range(self.rows)])
+        conn.close()
+        self.addCleanup(database.configure, database.DB_FILE)
+        database.configure(path)
+
+
+class MigrationTest(SchemaTestCase):
+    def test_migrates_to_the_latest_version_without_warnings(self):
+        with database.connection() as conn:
+            self.assertEqual(schema.schema_version(conn), schema.SCHEMA_VERSION)
+        self.assertEqual(database.schema_warnings(), [])
+
+    def test_lookups_seek_an_index(self):
+        with database.connection() as conn:
+            schema.check_lookups(conn)
+
+    def test_list_orders_and_filters_use_their_indexes(self):
+        with database.connection() as conn:
+            schema.check_sorts(conn)
+
+    def test_returning_scholar_is_skipped_not_promoted_again(self):
+        with database.transaction() as conn:
+            returning = conn.execute("INSERT INTO Applicants (StudentID, Name) VALUES ('21-00001', 'Scholar 1')"
+                                     ).lastrowid
+            fresh = conn.execute("SELECT Applicant_id FROM Applicants WHERE StudentID = '24-00001'").fetchone()[0]
+        recipients, skipped = decisions.accept_applicants([returning, fresh])
+        self.assertEqual([student_id for _, _, student_id in recipients], ["24-00001"])
+        self.assertEqual(skipped, ["Scholar 1"])
+        with database.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM Maintainer WHERE student_id = '21-00001'"
+                                          ).fetchone()[0], 1)
+            self.assertTrue(conn.execute("SELECT 1 FROM Applicants WHERE Applicant_id = ?", (returning,)).fetchone())
+            # The rule the index backs up
+            with self.assertRaises(sqlite3.IntegrityError):
+                conn.execute("INSERT INTO Maintainer (student_id) VALUES ('21-00001')")
+
+
+class SearchIndexTest(SchemaTestCase):
+    def search(self, text):
+        with database.connection() as conn:
+            key = schema.integer_key(conn, "Maintainer")
+            return conn.execute(f"""
+                SELECT m.student_id FROM MaintainerSearch JOIN Maintainer m ON m.{key} = MaintainerSearch.rowid
+                WHERE MaintainerSearch MATCH ? ORDER BY 1
+            """, (text,)).fetchall()
+
+    def test_maintainer_gets_a_key_that_survives_vacuum(self):
+        with database.connection() as conn:
+            self.assertEqual(schema.integer_key(conn, "Maintainer"), schema.MAINTAINER_KEY)
+            conn.execute("DELETE FROM Maintainer WHERE rowid % 3 = 0")
+            conn.commit()
+            before = self.search("scholar 12*")
+            conn.execute("VACUUM")
+        self.assertTrue(before)
+        self.assertEqual(self.search("scholar 12*"), before)
+
+
+class IntegerKeyMaintainerTest(SchemaTestCase):
+    maintainer_table = MAINTAINER_TABLE.replace("(student_id", "(id INTEGER PRIMARY KEY AUTOINCREMENT, student_id")
+
+    def test_own_key_is_kept_and_indexed(self):
+        with database.connection() as conn:
+            self.assertEqual(schema.schema_version(conn), schema.SCHEMA_VERSION)
+            self.assertNotIn(schema.MAINTAINER_KEY, schema.table_columns(conn, "Maintainer"))
+            self.assertEqual(schema.integer_key(conn, "Maintainer"), "id")
+            found = conn.execute("""
+                SELECT m.student_id FROM MaintainerSearch JOIN Maintainer m ON m.id = MaintainerSearch.rowid
+                WHERE MaintainerSearch MATCH 'sch42'
+            """).fetchall()
+            schema.check_lookups(conn)
+            schema.check_sorts(conn)
+        self.assertEqual(found, [("21-00042",)])
+        self.assertEqual(database.schema_warnings(), [])
+
+
+class TextKeyMaintainerTest(SchemaTestCase):
+    maintainer_table = MAINTAINER_TABLE.replace("(student_id TEXT", "(student_id TEXT PRIMARY KEY")
+
+    def test_migrates_without_a_search_index_and_warns(self):
+        with database.connection() as conn:
+            self.assertEqual(schema.schema_version(conn), schema.SCHEMA_VERSION)
+            self.assertNotIn(schema.MAINTAINER_KEY, schema.table_columns(conn, "Maintainer"))
+            self.assertFalse(schema.table_columns(conn, "MaintainerSearch"))
+            schema.check_lookups(conn)
+            schema.check_sorts(conn)
+        warnings = database.schema_warnings()
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("student_id", warnings[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
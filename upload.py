@@ -4,6 +4,8 @@ import sqlite3
 import os
 import subprocess
 import tkinter as tk
+import database
+from document_store import store, DocumentError
 
 
 # ------------------------- CONFIG -------------------------
@@ -15,9 +17,9 @@ entry_fields = {}
 
 
 # ------------------------- FUNCTIONS -------------------------
-def pdf_to_blob(file_path):
-    with open(file_path, "rb") as f:
-        return f.read()
+def store_document(file_path):
+    """Stream a PDF into the document store; returns the digest kept in the DB."""
+    return store.put_file(file_path, allowed=("application/pdf",))
 
 
 def browse_file(doc_field):
@@ -58,29 +60,24 @@ def submit_application():
         return
 
     try:
-        conn = sqlite3.connect("Scholarship.db")
-        c = conn.cursor()
+        # Copy files outside the transaction so the write lock is held briefly
+        cor_ref = store_document(uploaded_files["COR"])
+        tor_ref = store_document(uploaded_files["TOR"])
+        gm_ref = store_document(uploaded_files["Good_Moral"])
 
-        # GET LAST REGISTERED APPLICANT ID
-        c.execute("SELECT MAX(Applicant_id) FROM Applicants")
-        applicant_id = c.fetchone()[0]
+        with database.transaction() as conn:
+            # GET LAST REGISTERED APPLICANT ID
+            applicant_id = conn.execute("SELECT MAX(Applicant_id) FROM Applicants").fetchone()[0]
 
-        if applicant_id is None:
-            messagebox.showerror("Error", "No applicant found.")
-            return
+            if applicant_id is None:
+                messagebox.showerror("Error", "No applicant found.")
+                return
 
-        cor_blob = pdf_to_blob(uploaded_files["COR"])
-        tor_blob = pdf_to_blob(uploaded_files["TOR"])
-        gm_blob = pdf_to_blob(uploaded_files["Good_Moral"])
-
-        c.execute("""
-            INSERT INTO Applicant_Requirements 
-            (applicants_id, COR, "TOR", Good_Moral)
-            VALUES (?, ?, ?, ?)
-        """, (applicant_id, cor_blob, tor_blob, gm_blob))
-
-        conn.commit()
-        conn.close()
+            conn.execute("""
+                INSERT INTO Applicant_Requirements 
+                (applicants_id, COR, "TOR", Good_Moral)
+                VALUES (?, ?, ?, ?)
+            """, (applicant_id, cor_ref, tor_ref, gm_ref))
 
         messagebox.showinfo("Success", "PDF documents submitted successfully!")
 
@@ -91,6 +88,10 @@ def submit_application():
 
     except sqlite3.Error as e:
         messagebox.showerror("Database Error", str(e))
+    except DocumentError as e:
+        messagebox.showerror("Invalid Document", str(e))
+    except OSError as e:
+        messagebox.showerror("File Error", f"Could not store document: {e}")
 
 
 def reset_form():
@@ -0,0 +1,684 @@
+import customtkinter as ctk
+import queue
+import threading
+from collections import OrderedDict
+import database
+import schema
+
+# ----------------------- STYLE -----------------------
+HEADER_BG   = "#7c0a02"
+HEADER_FONT = ("Arial Black", 16)
+CELL_FONT   = ("Arial", 14)
+COL_WIDTH   = 250
+ROW_HEIGHT  = 40
+CHECK_WIDTH = 40
+
+SEARCH_DEBOUNCE_MS = 150   # quiet time after the last keystroke before searching
+SEARCH_POLL_MS = 15        # how often the Tk thread checks for a finished search
+
+
+# ============================================================
+#            KEYSET-PAGINATED ROW SOURCE (SQLite)
+# ============================================================
+class PagedQuery:
+    """Reads a table a page at a time, in key order or sorted by a column.
+
+    Rows come back as tuples of (key, *columns), or as `record` instances
+    (see records.py) built by the cursor's row_factory. `where` (with
+    `params`) restricts the rows, e.g. to a status or search results; write
+    its columns as Table.column so it also fits the search join. `order`
+    names one of `columns` to sort by (text without case, NULL as ''), the
+    key breaking ties. Pages are fetched with keyset pagination (rows after
+    the last row's (sort value, key), LIMIT n) so reading page 500 costs the
+    same as reading page 1; only a jump to a page whose neighbour is not
+    cached needs an OFFSET probe to find its first row. The sorting and
+    filtering happen in SQLite, on the indexes from schema.SORT_INDEXES.
+    """
+
+    def __init__(self, table, columns, key="rowid", page_size=100, max_pages=32, record=None,
+                 where=None, params=(), order=None, descending=False):
+        self.table = table
+        self.columns = list(columns)
+        self.key = key
+        self.record = record
+        self.where = where
+        self.params = tuple(params)
+        self.order = order
+        self.descending = descending
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+        self._count = None
+
+    # ---------------- SQL ---------------- #
+    def _from(self):
+        return self.table
+
+    def _select(self, columns=None, condition=None):
+        columns = columns or f"{self.key}, {', '.join(self.columns)}"
+        conditions = [c for c in (self.where, condition) if c]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"SELECT {columns} FROM {self._from()}{where}"
+
+    def _sort_expr(self):
+        # Same expression as schema.SORT_INDEXES, or SQLite would sort in memory
+        return schema.sort_expression(f"{self.table}.{self.order}")
+
+    def _order_by(self, reverse=False):
+        direction = " DESC" if self.descending != reverse else ""
+        terms = [self.key] if self.order is None else [self._sort_expr(), self.key]
+        return ", ".join(term + direction for term in terms)
+
+    def _position(self, row):
+        """Where `row` sits in the order: (key,) or (sort value, key)."""
+        if self.order is None:
+            return (row[0],)
+        value = row[1 + self.columns.index(self.order)]
+        return ("" if value is None else value, row[0])
+
+    def _beyond(self, position, forward=True, inclusive=False):
+        """(condition, params) for the rows after `position` (before it if not forward)."""
+        op = ">" if forward != self.descending else "<"
+        key_op = op + "=" if inclusive else op
+        if self.order is None:
+            return f"{self.key} {key_op} ?", position
+        # Written as a range on the sort value plus a tie-break, because
+        # SQLite seeks an expression index on "expr >= ?" but not on a row value
+        value, key = position
+        expr = self._sort_expr()
+        return (f"{expr} {op}= ? AND ({expr} {op} ? OR {self.key} {key_op} ?)", (value, value, key))
+
+    def _rows(self, conn, sql, params):
+        # Pooled connections are shared, so the row_factory goes on the cursor
+        cursor = conn.cursor()
+        if self.record is not None:
+            cursor.row_factory = self.record.from_row
+        return cursor.execute(sql, params).fetchall()
+
+    def _fetch_after(self, conn, position, limit=None):
+        limit = limit or self.page_size
+        if position is None:
+            sql = f"{self._select()} ORDER BY {self._order_by()} LIMIT ?"
+            return self._rows(conn, sql, self.params + (limit,))
+        condition, params = self._beyond(position)
+        sql = f"{self._select(condition=condition)} ORDER BY {self._order_by()} LIMIT ?"
+        return self._rows(conn, sql, self.params + params + (limit,))
+
+    def _fetch_before(self, conn, position):
+        condition, params = self._beyond(position, forward=False)
+        sql = f"{self._select(condition=condition)} ORDER BY {self._order_by(reverse=True)} LIMIT ?"
+        rows = self._rows(conn, sql, self.params + params + (self.page_size,))
+        rows.reverse()
+        return rows
+
+    def _fetch_seek(self, conn, page_no):
+        columns = self.key if self.order is None else f"{self._sort_expr()}, {self.key}"
+        probe = conn.execute(
+            f"{self._select(columns)} ORDER BY {self._order_by()} LIMIT 1 OFFSET ?",
+            self.params + (page_no * self.page_size,)).fetchone()
+        if probe is None:
+            return []
+        condition, params = self._beyond(tuple(probe), inclusive=True)
+        sql = f"{self._select(condition=condition)} ORDER BY {self._order_by()} LIMIT ?"
+        return self._rows(conn, sql, self.params + params + (self.page_size,))
+
+    # ---------------- PUBLIC ---------------- #
+    def _derive(self, **changes):
+        settings = dict(table=self.table, columns=self.columns, key=self.key,
+                        page_size=self.page_size, max_pages=self.max_pages, record=self.record,
+                        where=self.where, params=self.params,
+                        order=self.order, descending=self.descending)
+        settings.update(changes)
+        return PagedQuery(**settings)
+
+    def filtered(self, where, params=()):
+        """A new query restricted further by `where` (same columns and order)."""
+        if not where:
+            return self._derive()
+        if self.where:
+            where = f"({self.where}) AND ({where})"
+        return self._derive(where=where, params=self.params + tuple(params))
+
+    def sorted(self, column=None, descending=False):
+        """A new query with the same rows sorted by `column` (None: key order)."""
+        return self._derive(order=column, descending=descending)
+
+    def count(self):
+        if self._count is None:
+            with database.connection() as conn:
+                self._count = conn.execute(self._select("COUNT(*)"), self.params).fetchone()[0]
+        return self._count
+
+    def page(self, page_no):
+        if page_no in self._pages:
+            self._pages.move_to_end(page_no)
+            return self._pages[page_no]
+
+        prev_page = self._pages.get(page_no - 1)
+        next_page = self._pages.get(page_no + 1)
+        with database.connection() as conn:
+            if page_no == 0:
+                rows = self._fetch_after(conn, None)
+            elif prev_page:
+                rows = self._fetch_after(conn, self._position(prev_page[-1]))
+            elif next_page:
+                rows = self._fetch_before(conn, self._position(next_page[0]))
+            else:
+                rows = self._fetch_seek(conn, page_no)
+
+        self._pages[page_no] = rows
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return rows
+
+    def row(self, index):
+        page_no, offset = divmod(index, self.page_size)
+        rows = self.page(page_no)
+        return rows[offset] if offset < len(rows) else None
+
+    def invalidate(self):
+        self._pages.clear()
+        self._count = None
+
+    # ---------------- ROW-LEVEL EDITS ---------------- #
+    # Called after the table itself was changed; each costs at most one page
+    # of list work and one small query, never a full reload.
+    def _locate(self, key):
+        for page_no, rows in self._pages.items():
+            for offset, row in enumerate(rows):
+                if row[0] == key:
+                    return page_no * self.page_size + offset
+        return None
+
+    def _drop_pages_after(self, page_no):
+        for stale in [p for p in self._pages if p > page_no]:
+            del self._pages[stale]
+
+    def index_of(self, key, row=None):
+        """Index of the row with `key`; None if sorted and the row is gone."""
+        index = self._locate(key)
+        if index is not None:
+            return index
+        with database.connection() as conn:
+            if row is not None or self.order is None:
+                position = self._position(row) if row is not None else (key,)
+            else:
+                found = conn.execute(f"SELECT {self._sort_expr()} FROM {self.table} WHERE {self.key} = ?",
+                                     (key,)).fetchone()
+                if found is None:
+                    return None
+                position = (found[0], key)
+            condition, params = self._beyond(position, forward=False)
+            return conn.execute(self._select("COUNT(*)", condition), self.params + params).fetchone()[0]
+
+    def remove(self, key):
+        """Forget a row that was deleted from the table; returns its old index."""
+        index = self.index_of(key)
+        if index is None:
+            # Not cached and its sort value went with it: start over
+            self.invalidate()
+            return None
+        page_no, offset = divmod(index, self.page_size)
+        rows = self._pages.get(page_no)
+        if rows is not None and offset < len(rows) and rows[offset][0] == key:
+            removed = rows.pop(offset)
+            # Pull the next row up so the page stays full and later indexes line up
+            with database.connection() as conn:
+                rows.extend(self._fetch_after(conn, self._position(rows[-1] if rows else removed), limit=1))
+        self._drop_pages_after(page_no)
+        if self._count:
+            self._count -= 1
+        return index
+
+    def insert(self, row):
+        """Account for a row that was added to the table; returns its index."""
+        index = self.index_of(row[0], row)
+        page_no, offset = divmod(index, self.page_size)
+        rows = self._pages.get(page_no)
+        if rows is not None:
+            rows.insert(offset, row)
+            if len(rows) > self.page_size:
+                rows.pop()
+        self._drop_pages_after(page_no)
+        if self._count is not None:
+            self._count += 1
+        return index
+
+    def update(self, row):
+        """Replace a cached row in place; returns its index (None if not cached)."""
+        index = self._locate(row[0])
+        if index is not None:
+            page_no, offset = divmod(index, self.page_size)
+            self._pages[page_no][offset] = row
+        return index
+
+
+# ============================================================
+#          TABLE MODEL (ROW-LEVEL CHANGE NOTIFICATIONS)
+# ============================================================
+class TableModel:
+    """Wraps a row source and tells its views exactly which row changed.
+
+    Listeners are called as listener(event, index) where event is one of
+    "inserted", "removed", "updated", "reset", "replaced" (another source,
+    e.g. search results) or "selection". The model also
+    owns the multi-select state (a set of row keys) so it survives scrolling
+    and widget recycling.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._listeners = []
+        self.selected = set()
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event, index=None):
+        for listener in list(self._listeners):
+            listener(event, index)
+
+    def count(self):
+        return self.source.count()
+
+    def row(self, index):
+        return self.source.row(index)
+
+    def insert_row(self, row):
+        index = self.source.insert(row)
+        self._notify("inserted", index)
+        return index
+
+    def remove_row(self, key):
+        self.selected.discard(key)
+        index = self.source.remove(key)
+        self._notify("removed" if index is not None else "reset", index)
+        return index
+
+    def update_row(self, row):
+        index = self.source.update(row)
+        if index is not None:
+            self._notify("updated", index)
+        return index
+
+    def reset(self):
+        self.source.invalidate()
+        self._notify("reset")
+
+    def set_source(self, source):
+        """Show another row source; its cached pages are used as they are."""
+        self.source = source
+        self._notify("replaced")
+
+    # ---------------- SELECTION ---------------- #
+    def is_selected(self, key):
+        return key in self.selected
+
+    def set_selected(self, key, selected):
+        if selected:
+            self.selected.add(key)
+        else:
+            self.selected.discard(key)
+        self._notify("selection")
+
+    def clear_selection(self):
+        self.selected.clear()
+        self._notify("selection")
+
+
+# ============================================================
+#                 VIRTUALIZED TABLE WIDGET
+# ============================================================
+class _RowSlot:
+    """One recycled on-screen row: a label per column plus action buttons."""
+
+    def __init__(self, table, grid_row):
+        self.table = table
+        self.row = None
+        self.cells = []
+
+        self.check = None
+        if table.selectable:
+            self.check = ctk.CTkCheckBox(table.body, text="", width=CHECK_WIDTH,
+                                         checkbox_width=20, checkbox_height=20,
+                                         command=self.on_check)
+            self.check.grid(row=grid_row, column=0, padx=(10, 1), pady=1)
+
+        offset = 1 if table.selectable else 0
+        for col in range(len(table.headers)):
+            cell = ctk.CTkLabel(table.body, text="", font=CELL_FONT,
+                                width=table.col_width, height=table.row_height,
+                                fg_color="white", anchor="center")
+            cell.grid(row=grid_row, column=col + offset, padx=1, pady=1, sticky="nsew")
+            table.bind_wheel(cell)
+            self.cells.append(cell)
+
+        self.action_frame = None
+        if table.actions:
+            self.action_frame = ctk.CTkFrame(table.body, fg_color="white",
+                                             width=table.col_width, height=table.row_height)
+            self.action_frame.grid(row=grid_row, column=len(table.headers) + offset,
+                                   padx=1, pady=1, sticky="nsew")
+            table.bind_wheel(self.action_frame)
+            for i, (text, fg, hover, callback) in enumerate(table.actions):
+                self.action_frame.grid_columnconfigure(i, weight=1)
+                colors = {"fg_color": fg, "hover_color": hover} if fg else {}
+                ctk.CTkButton(self.action_frame, text=text, width=70, height=30,
+                              command=lambda cb=callback: self.fire(cb), **colors
+                              ).grid(row=0, column=i, padx=5)
+
+    def fire(self, callback):
+        if self.row is not None:
+            callback(self.row)
+
+    def on_check(self):
+        if self.row is not None:
+            self.table.model.set_selected(self.row[0], bool(self.check.get()))
+
+    def show(self, row, values):
+        self.row = row
+        for cell, value in zip(self.cells, values):
+            cell.configure(text=value)
+        self.sync_check()
+        for widget in self.widgets():
+            widget.grid()
+
+    def sync_check(self):
+        if self.check is None or self.row is None:
+            return
+        if self.table.model.is_selected(self.row[0]):
+            self.check.select()
+        else:
+            self.check.deselect()
+
+    def hide(self):
+        self.row = None
+        for widget in self.widgets():
+            widget.grid_remove()
+
+    def widgets(self):
+        extras = [w for w in (self.check, self.action_frame) if w is not None]
+        return self.cells + extras
+
+
+class VirtualTable(ctk.CTkFrame):
+    """Grid that only creates widgets for the rows that fit on screen.
+
+    `model` is a TableModel (a bare PagedQuery is wrapped in one). The table
+    listens to it, so inserting, removing or updating a row only re-binds
+    the on-screen slots. `actions` is a list of
+    (text, fg_color, hover_color, callback); colors may be None for the theme
+    default and each callback receives the full row tuple. `display` maps a row to the visible cell values
+    (default: every column after the key). With `selectable=True` each row
+    gets a checkbox bound to the model's selection. With `on_sort`, clicking
+    a header calls on_sort(column index); show_sort() marks the order.
+    """
+
+    def __init__(self, master, model, headers, actions=None, display=None,
+                 selectable=False, col_width=COL_WIDTH, row_height=ROW_HEIGHT, on_sort=None, **kwargs):
+        super().__init__(master, fg_color="white", **kwargs)
+        self.model = model if isinstance(model, TableModel) else TableModel(model)
+        self.model.subscribe(self.on_model_changed)
+        self.headers = list(headers)
+        self.actions = actions or []
+        self.display = display or (lambda row: row[1:])
+        self.selectable = selectable
+        self.col_width = col_width
+        self.row_height = row_height
+        self.first = 0
+        self.slots = []
+        self.visible = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Header row
+        head = ctk.CTkFrame(self, fg_color="white")
+        head.grid(row=0, column=0, sticky="ew")
+        titles = self.headers + (["Action"] if self.actions else [])
+        offset = 1 if selectable else 0
+        if selectable:
+            ctk.CTkLabel(head, text="", fg_color=HEADER_BG, width=CHECK_WIDTH,
+                         height=row_height).grid(row=0, column=0, padx=(10, 1), pady=1, sticky="nsew")
+        self.header_labels = []
+        for col, title in enumerate(titles):
+            label = ctk.CTkLabel(head, text=title, font=HEADER_FONT, fg_color=HEADER_BG,
+                                 text_color="white", width=col_width, height=row_height)
+            label.grid(row=0, column=col + offset, padx=1, pady=1, sticky="nsew")
+            head.grid_columnconfigure(col + offset, weight=1)
+            if on_sort is not None and col < len(self.headers):
+                label.configure(cursor="hand2")
+                label.bind("<Button-1>", lambda event, col=col: on_sort(col))
+                self.header_labels.append(label)
+
+        # Body (fixed pool of row slots) + scrollbar
+        self.body = ctk.CTkFrame(self, fg_color="white")
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.body.grid_propagate(False)   # size comes from the window, not the rows
+        for col in range(len(titles)):
+            self.body.grid_columnconfigure(col + offset, weight=1)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, rowspan=2, sticky="ns")
+
+        self.empty_label = ctk.CTkLabel(self.body, text="No records found.", font=CELL_FONT)
+
+        self.body.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.body)
+
+    def destroy(self):
+        self.model.unsubscribe(self.on_model_changed)
+        super().destroy()
+
+    # ---------------- LAYOUT ---------------- #
+    def on_resize(self, event):
+        # +2 accounts for the 1px grid padding above and below each row
+        fits = max(1, event.height // (self.row_height + 2))
+        while len(self.slots) < fits:
+            self.slots.append(_RowSlot(self, len(self.slots)))
+        self.visible = fits
+        self.render()
+
+    def render(self):
+        total = self.model.count()
+        self.first = max(0, min(self.first, total - self.visible))
+
+        for i, slot in enumerate(self.slots):
+            row = self.model.row(self.first + i) if i < self.visible and self.first + i < total else None
+            if row is None:
+                slot.hide()
+            else:
+                slot.show(row, self.display(row))
+
+        if total:
+            self.empty_label.place_forget()
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.visible) / total))
+        else:
+            self.empty_label.place(relx=0.5, rely=0.2, anchor="center")
+            self.scrollbar.set(0.0, 1.0)
+
+    def refresh(self):
+        """Re-read everything (only needed after bulk changes)."""
+        self.model.reset()
+
+    def show_sort(self, index, descending=False):
+        """Arrow on the header the rows are sorted by (None: no arrow)."""
+        for col, label in enumerate(self.header_labels):
+            arrow = (" ▼" if descending else " ▲") if col == index else ""
+            label.configure(text=self.headers[col] + arrow)
+
+    def on_model_changed(self, event, index):
+        if event == "selection":
+            for slot in self.slots:
+                slot.sync_check()
+            return
+        if event == "updated":
+            offset = index - self.first
+            if 0 <= offset < self.visible:
+                row = self.model.row(index)
+                self.slots[offset].show(row, self.display(row))
+            return
+
+        if event == "replaced":
+            self.first = 0
+        # Keep the rows the admin is looking at in place
+        elif event == "removed" and index < self.first:
+            self.first -= 1
+        elif event == "inserted" and index < self.first:
+            self.first += 1
+        self.render()
+
+    # ---------------- SCROLLING ---------------- #
+    def scroll_to(self, index):
+        if index != self.first:
+            self.first = index
+            self.render()
+
+    def on_scrollbar(self, *args):
+        total = self.model.count()
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * total))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.visible if args[2] == "pages" else 1)
+            self.scroll_to(self.first + step)
+
+    def on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -3
+        elif getattr(event, "num", None) == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self.scroll_to(max(0, self.first + delta))
+        return "break"
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", self.on_wheel)
+        widget.bind("<Button-5>", self.on_wheel)
+
+
+# ============================================================
+#              SEARCH-AS-YOU-TYPE (OFF THE TK THREAD)
+# ============================================================
+class SearchBox(ctk.CTkEntry):
+    """Entry that filters a TableModel as the admin types.
+
+    Keystrokes are debounced; `make_source(text)` (e.g. search.filtered)
+    then builds the filtered row source on a worker thread, which also
+    fetches its count and first page. Only the newest search is shown, so
+    a slow query never overwrites the results of a later one.
+    """
+
+    def __init__(self, master, model, make_source, debounce_ms=SEARCH_DEBOUNCE_MS, **kwargs):
+        kwargs.setdefault("placeholder_text", "Search name, username, email or student ID")
+        super().__init__(master, **kwargs)
+        self.model = model
+        self.make_source = make_source
+        self.debounce_ms = debounce_ms
+        self._text = ""
+        self._timer = None
+        self._generation = 0
+        self._running = 0
+        self._results = queue.SimpleQueue()
+        self.bind("<KeyRelease>", self.on_key)
+
+    def on_key(self, event=None):
+        if self._timer is not None:
+            self.after_cancel(self._timer)
+        self._timer = self.after(self.debounce_ms, self.search)
+
+    def search(self, force=False):
+        """Run the search now; force=True re-runs it for the same text
+        (after the rows it starts from were re-sorted or filtered)."""
+        self._timer = None
+        text = self.get().strip()
+        if text == self._text and not force:
+            return   # arrows, shift, ... did not change the query
+        self._text = text
+        self._generation += 1
+        self._running += 1
+        threading.Thread(target=self._run, args=(self._generation, text), daemon=True).start()
+        if self._running == 1:
+            self.after(SEARCH_POLL_MS, self._poll)
+
+    def _run(self, generation, text):
+        try:
+            source = self.make_source(text)
+            source.count()
+            source.page(0)
+            self._results.put((generation, source, None))
+        except Exception as e:
+            self._results.put((generation, None, e))
+
+    def _poll(self):
+        if not self.winfo_exists():
+            return
+        while True:
+            try:
+                generation, source, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._running -= 1
+            if generation != self._generation:
+                continue   # superseded while it ran
+            if error is not None:
+                print(f"✗ Search failed: {error}")
+            else:
+                self.model.set_source(source)
+        if self._running:
+            self.after(SEARCH_POLL_MS, self._poll)
+
+
+if __name__ == "__main__":
+    # python virtual_table.py [N] -> time to show a sorted / filtered view of N applicants
+    import os
+    import random
+    import sys
+    import tempfile
+    import time
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    database.configure(os.path.join(tempfile.mkdtemp(), "sort.db"))
+    with database.transaction() as conn:
+        conn.execute("""CREATE TABLE Applicants (Applicant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        StudentID TEXT, Name TEXT, Username TEXT, Password TEXT, Email TEXT,
+                        School TEXT, Course TEXT, Year_Level TEXT, Phone_Number TEXT,
+                        GWA REAL, Status TEXT)""")
+        conn.execute("""CREATE TABLE Maintainer (student_id TEXT, name TEXT, username TEXT, password TEXT,
+                        email TEXT, school TEXT, course TEXT, yearlevel TEXT, phone_number TEXT,
+                        gwa REAL, status TEXT)""")
+        rng = random.Random(1)
+        conn.executemany("""INSERT INTO Applicants (StudentID, Name, Username, Email, Course, Status)
+                            VALUES (?, ?, ?, ?, ?, ?)""",
+                         [(f"{rng.randint(21, 24)}-{i:05d}",
+                           f"{rng.choice(('juan', 'Maria', 'jose', 'Ana'))} {rng.random():.6f}",
+                           f"user{i}", f"user{i}@g.batstate-u.edu.ph", rng.choice(("BSIT", "BSCS", "BSEd")),
+                           rng.choice(("Pending", "Accepted", "Rejected")))
+                          for i in range(count)])
+    database.configure()   # new pool: migrations build the indexes on open
+    with database.connection():
+        pass
+    base = PagedQuery("Applicants", ["StudentID", "Name", "Username", "Email", "Status"], key="Applicant_id")
+
+    views = (
+        ("insertion order", base),
+        ("name", base.sorted("Name")),
+        ("name, descending", base.sorted("Name", True)),
+        ("student id", base.sorted("StudentID")),
+        ("pending, by name", base.filtered("Applicants.StatusCode = ?", (2,)).sorted("Name")),
+        ("BSIT, by email desc", base.filtered("Applicants.Course = ?", ("BSIT",)).sorted("Email", True)),
+    )
+    print(f"{count} applicants     first page   next page   jump to middle")
+    for label, query in views:
+        timings = []
+        for step in (lambda: (query.count(), query.row(0)), lambda: query.row(query.page_size),
+                     lambda: query.row(query.count() // 2)):
+            start = time.perf_counter()
+            step()
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{label:22} " + "".join(f"{ms:9.1f} ms" for ms in timings))
@@ -0,0 +1,79 @@
+import importlib
+import threading
+import time
+
+# ----------------------- BACKGROUND IMPORTS -----------------------
+# Heavy modules (matplotlib, the mail stack, other screens) are imported on
+# a daemon thread while Tk paints the first frame. The Tk thread never
+# blocks on them: it polls with after() and continues once the import is done.
+
+POLL_MS = 30
+
+_events = {}
+_timings = {}
+_lock = threading.Lock()
+
+
+def _event(name):
+    with _lock:
+        return _events.setdefault(name, threading.Event())
+
+
+def _claim(names):
+    """Names nobody has started importing yet (marks them as started)."""
+    with _lock:
+        fresh = [name for name in names if name not in _events]
+        for name in fresh:
+            _events[name] = threading.Event()
+        return fresh
+
+
+def preload(names):
+    """Start importing `names` in the background; returns the thread (or None)."""
+    names = _claim(names)
+    if not names:
+        return None
+
+    def run():
+        for name in names:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception:
+                # when_loaded imports it again on the Tk thread, which
+                # raises the real error where it can be reported
+                pass
+            _timings[name] = time.perf_counter() - start
+            _event(name).set()
+
+    thread = threading.Thread(target=run, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_loaded(name):
+    return _event(name).is_set()
+
+
+def when_loaded(widget, name, callback):
+    """Call callback(module) on the Tk thread once `name` has been imported.
+
+    The first check is itself deferred, so the callback always runs after
+    the window has had a chance to paint.
+    """
+    preload([name])
+
+    def check():
+        if not widget.winfo_exists():
+            return
+        if is_loaded(name):
+            callback(importlib.import_module(name))
+        else:
+            widget.after(POLL_MS, check)
+
+    widget.after(POLL_MS, check)
+
+
+def timings():
+    """{module: seconds} spent importing each preloaded module."""
+    return dict(_timings)